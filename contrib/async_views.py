@@ -0,0 +1,194 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+"""
+Asynchronous variants of the views making the most calls to the web services. If the ADMISSION_ASYNC_VIEWS setting is
+enabled, they replace the synchronous views in the urls (see `use_async_views`), which requires the application to be
+served by ASGI. The views do not hold a thread while the web services are called, and the calls are cancelled if the
+client disconnects. The other parts of the requests (session, database, templates) are still handled in threads.
+
+This module is not in admission/contrib/views so that the FileRouter does not register its views.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.urls import URLPattern, URLResolver
+from waffle import switch_is_active
+
+from admission.contrib.enums import TypeFormation
+from admission.contrib.forms import EMPTY_VALUE
+from admission.contrib.views.autocomplete import (
+    DoctorateAutocomplete,
+    GeneralEducationAutocomplete,
+    MixedTrainingAutocomplete,
+)
+from admission.contrib.views.list import AdmissionListView, DashboardData, is_re_enrolment_period_open
+from admission.services.autocomplete import AdmissionAutocompleteService
+from admission.services.person import AdmissionPersonService
+from admission.services.proposition import AdmissionPropositionService
+from admission.url_manifest import LazyView
+
+__all__ = [
+    "AsyncAdmissionListView",
+    "AsyncDoctorateAutocomplete",
+    "AsyncGeneralEducationAutocomplete",
+    "AsyncMixedTrainingAutocomplete",
+    "ASYNC_VIEWS",
+    "aload_dashboard_data",
+    "use_async_views",
+]
+
+
+async def aget_person(request):
+    """Return the person of the authenticated user, which is loaded from the database in a thread."""
+    return await sync_to_async(lambda: request.user.person)()
+
+
+def get_selected_campus(view):
+    selected_campus = view.forwarded.get('campus') or EMPTY_VALUE
+    return selected_campus if selected_campus != EMPTY_VALUE else ''
+
+
+class AsyncAutocompleteMixin:
+    """Mixin of the asynchronous variants of the autocomplete views, whose options are loaded by `aget_list`."""
+
+    http_method_names = ['get', 'options']
+
+    async def get(self, request, *args, **kwargs):
+        results = await self.aget_list(await aget_person(request))
+        if self.q:
+            results = self.autocomplete_results(results)
+        # The switches used to format the results are read from the database
+        return JsonResponse({'results': await sync_to_async(self.results)(results)})
+
+    async def aget_list(self, person):
+        raise NotImplementedError
+
+
+class AsyncDoctorateAutocomplete(AsyncAutocompleteMixin, DoctorateAutocomplete):
+    async def aget_list(self, person):
+        return await AdmissionAutocompleteService.aget_doctorates(
+            person=person,
+            sigle=self.forwarded['sector'],
+            campus=get_selected_campus(self),
+            acronym_or_name=self.q,
+        )
+
+
+class AsyncGeneralEducationAutocomplete(AsyncAutocompleteMixin, GeneralEducationAutocomplete):
+    async def aget_list(self, person):
+        return await AdmissionAutocompleteService.aget_general_education_trainings(
+            person=person,
+            training_type=self.forwarded.get('training_type'),
+            acronym_or_name=self.q,
+            campus=get_selected_campus(self),
+        )
+
+
+class AsyncMixedTrainingAutocomplete(AsyncAutocompleteMixin, MixedTrainingAutocomplete):
+    async def aget_list(self, person):
+        is_iufc_active = await sync_to_async(switch_is_active)('admission-iufc')
+        certificate_call = AdmissionAutocompleteService.aget_general_education_trainings(
+            person=person,
+            training_type=TypeFormation.CERTIFICAT.name,
+            acronym_or_name=self.q,
+            campus=get_selected_campus(self),
+        )
+        if not is_iufc_active:
+            return await certificate_call
+        iufc_trainings, certificate = await asyncio.gather(
+            AdmissionAutocompleteService.aget_continuing_education_trainings(
+                person=person,
+                acronym_or_name=self.q,
+                campus=get_selected_campus(self),
+            ),
+            certificate_call,
+        )
+        # Mix the two types
+        return iufc_trainings + certificate
+
+
+async def aload_dashboard_data(person) -> DashboardData:
+    """Asynchronous version of `load_dashboard_data`, in which the web services are called concurrently."""
+    propositions, candidate, re_enrolment_period = await asyncio.gather(
+        AdmissionPropositionService.aget_propositions(person),
+        AdmissionPersonService.aretrieve_person(person),
+        # The period is cached for all the candidates, so it is rarely loaded from the web service
+        sync_to_async(AdmissionPropositionService.retrieve_re_enrolment_period)(person),
+    )
+    if not is_re_enrolment_period_open(re_enrolment_period):
+        return DashboardData(propositions, candidate, re_enrolment_period)
+    ucl_enrolments, re_enrolment_eligibility = await asyncio.gather(
+        AdmissionPropositionService.aretrieve_ucl_enrolments_list(person),
+        AdmissionPropositionService.aretrieve_candidate_re_enrolment_eligibility(person),
+    )
+    return DashboardData(propositions, candidate, re_enrolment_period, ucl_enrolments, re_enrolment_eligibility)
+
+
+class AsyncAdmissionListView(AdmissionListView):
+    async def get(self, request, *args, **kwargs):
+        self.dashboard_data = await aload_dashboard_data(await aget_person(request))
+        # The context uses the session and the response is rendered by OutboundCallBudgetMixin, in threads
+        return await sync_to_async(super().get)(request, *args, **kwargs)
+
+    def get_dashboard_data(self) -> DashboardData:
+        return self.dashboard_data
+
+
+# Asynchronous variants of the views, by path of the synchronous views
+ASYNC_VIEWS = {
+    'admission.contrib.views.autocomplete.DoctorateAutocomplete': AsyncDoctorateAutocomplete,
+    'admission.contrib.views.autocomplete.GeneralEducationAutocomplete': AsyncGeneralEducationAutocomplete,
+    'admission.contrib.views.autocomplete.MixedTrainingAutocomplete': AsyncMixedTrainingAutocomplete,
+    'admission.contrib.views.list.AdmissionListView': AsyncAdmissionListView,
+}
+
+
+def _get_view_path_and_initkwargs(callback):
+    if isinstance(callback, LazyView):
+        return callback.view_path, callback.initkwargs
+    view_class = getattr(callback, 'view_class', None)
+    if view_class is None:
+        return None, None
+    return f'{view_class.__module__}.{view_class.__qualname__}', callback.view_initkwargs
+
+
+def use_async_views(urlpatterns):
+    """Replace, in the url patterns (including the included ones), the views having an asynchronous variant."""
+    for index, pattern in enumerate(urlpatterns):
+        if isinstance(pattern, URLResolver):
+            use_async_views(pattern.url_patterns)
+            continue
+        view_path, initkwargs = _get_view_path_and_initkwargs(pattern.callback)
+        async_view = ASYNC_VIEWS.get(view_path)
+        if async_view is not None:
+            urlpatterns[index] = URLPattern(
+                pattern.pattern,
+                async_view.as_view(**initkwargs),
+                pattern.default_args,
+                pattern.name,
+            )
+    return urlpatterns
@@ -24,8 +24,8 @@
 #
 # ##############################################################################
 import datetime
-from functools import partial
-from typing import List, Mapping, Optional, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Union
 
 import phonenumbers
 from django import forms
@@ -38,19 +38,22 @@ from django.utils.translation import pgettext_lazy
 from osis_document_components.fields import FileUploadField
 
 from admission.constants import MINIMUM_BIRTH_YEAR
+from admission.services.background import run_concurrently
 from admission.services.campus import AdmissionCampusService
 from admission.services.diplomatic_post import AdmissionDiplomaticPostService
 from admission.services.organisation import EntitiesService
 from admission.services.reference import (
+    AcademicCalendar,
     AcademicYearService,
+    CachedScholarshipService,
     CountriesService,
     DiplomaService,
     HighSchoolService,
     LanguageService,
     SuperiorInstituteService,
+    format_academic_year_label,
 )
 from admission.utils import format_entity_title, format_scholarship, format_school_title
-from reference.services.scholarship import ScholarshipService
 
 EMPTY_CHOICE = (('', ' - '),)
 EMPTY_VALUE = '__all__'
@@ -80,6 +83,30 @@ LOWERCASE_MONTHS = {
 }
 
 
+def format_country_choice(country):
+    return country.iso_code, country.name if get_language() == settings.LANGUAGE_CODE else country.name_en
+
+
+def format_diplomatic_post_choice(post):
+    return post.code, post.name_fr if get_language() == settings.LANGUAGE_CODE else post.name_en
+
+
+def format_language_choice(language):
+    return language.code, language.name if get_language() == settings.LANGUAGE_CODE else language.name_en
+
+
+def format_thesis_institute_choice(institute):
+    return institute.uuid, format_entity_title(entity=institute)
+
+
+def format_diploma_choice(diploma):
+    return diploma.uuid, diploma.title
+
+
+def format_school_choice(school):
+    return school.uuid, format_school_title(school=school)
+
+
 def get_country_initial_choices(iso_code=None, person=None, loaded_country=None):
     """Return the unique initial choice for a country when data is either set from initial or from webservice."""
     if not iso_code and not loaded_country:
@@ -87,9 +114,7 @@ def get_country_initial_choices(iso_code=None, person=None, loaded_country=None)
     country = loaded_country if loaded_country else CountriesService.get_country(iso_code=iso_code, person=person)
     if not country:
         return EMPTY_CHOICE
-    return EMPTY_CHOICE + (
-        (country.iso_code, country.name if get_language() == settings.LANGUAGE_CODE else country.name_en),
-    )
+    return EMPTY_CHOICE + (format_country_choice(country),)
 
 
 def get_diplomatic_post_initial_choices(diplomatic_post_code, person, loaded_post=None):
@@ -106,20 +131,20 @@ def get_diplomatic_post_initial_choices(diplomatic_post_code, person, loaded_pos
         )
     )
 
-    return EMPTY_CHOICE + ((post.code, post.name_fr if get_language() == settings.LANGUAGE_CODE else post.name_en),)
+    return EMPTY_CHOICE + (format_diplomatic_post_choice(post),)
 
 
 def get_year_choices(min_year=MINIMUM_BIRTH_YEAR, max_year=None):
     """Return the choices of a year choice field. If no max year is specified, the current year is used."""
     if max_year is None:
         max_year = datetime.datetime.now().year
-    return [EMPTY_CHOICE[0]] + [
-        (
-            year,
-            year,
-        )
-        for year in range(max_year, min_year - 1, -1)
-    ]
+    return _get_year_choices(min_year, max_year)
+
+
+@lru_cache(maxsize=32)
+def _get_year_choices(min_year, max_year):
+    # The default max year changes once a year so the choices are only built once a day at most
+    return (EMPTY_CHOICE[0],) + tuple((year, year) for year in range(max_year, min_year - 1, -1))
 
 
 def get_language_initial_choices(code, person):
@@ -127,9 +152,7 @@ def get_language_initial_choices(code, person):
     if not code:
         return EMPTY_CHOICE
     language = LanguageService.get_language(code=code, person=person)
-    return EMPTY_CHOICE + (
-        (language.code, language.name if get_language() == settings.LANGUAGE_CODE else language.name_en),
-    )
+    return EMPTY_CHOICE + (format_language_choice(language),)
 
 
 def get_thesis_institute_initial_choices(uuid, person):
@@ -137,7 +160,7 @@ def get_thesis_institute_initial_choices(uuid, person):
     if not uuid:
         return EMPTY_CHOICE
     institute = EntitiesService.get_ucl_entity(person=person, uuid=uuid)
-    return EMPTY_CHOICE + ((institute.uuid, format_entity_title(entity=institute)),)
+    return EMPTY_CHOICE + (format_thesis_institute_choice(institute),)
 
 
 def get_diploma_initial_choices(uuid, person):
@@ -145,7 +168,7 @@ def get_diploma_initial_choices(uuid, person):
     if not uuid:
         return EMPTY_CHOICE
     diploma = DiplomaService.get_diploma(person=person, uuid=uuid)
-    return EMPTY_CHOICE + ((diploma.uuid, diploma.title),)
+    return EMPTY_CHOICE + (format_diploma_choice(diploma),)
 
 
 def get_superior_institute_initial_choices(institute_id, person):
@@ -158,7 +181,7 @@ def get_superior_institute_initial_choices(institute_id, person):
         uuid=institute_id,
     )
 
-    return EMPTY_CHOICE + ((institute.uuid, format_school_title(school=institute)),)
+    return EMPTY_CHOICE + (format_school_choice(institute),)
 
 
 def get_thesis_location_initial_choices(value):
@@ -171,7 +194,7 @@ def get_high_school_initial_choices(uuid, person):
     if not uuid:
         return EMPTY_CHOICE
     high_school = HighSchoolService.get_high_school(person=person, uuid=uuid)
-    return EMPTY_CHOICE + ((high_school.uuid, format_school_title(school=high_school)),)
+    return EMPTY_CHOICE + (format_school_choice(high_school),)
 
 
 def get_campus_choices(person):
@@ -184,56 +207,132 @@ def get_scholarship_choices(uuid, person):
     """Return the unique initial choice for the campus."""
     if not uuid:
         return EMPTY_CHOICE
-    scholarship = ScholarshipService.get_scholarship(
+    scholarship = CachedScholarshipService.get_scholarship(
         person=person,
         scholarship_uuid=uuid,
     )
     return EMPTY_CHOICE + ((uuid, format_scholarship(scholarship)),)
 
 
-def get_past_academic_years_choices(
-    person,
-    exclude_current=False,
-    current_year=None,
-    academic_years=None,
-    format_label_function=None,
-    additional_years: set[int] | None = None,
-):
-    """Return a list of choices of past academic years."""
-    if academic_years is None:
-        academic_years = AcademicYearService.get_academic_years(person)
+class InitialChoiceLookup(NamedTuple):
+    """Load the object designated by the value of a field and format it as a choice."""
+
+    load: Callable[[Any, Any], Any]
+    format_choice: Callable[[Any], tuple]
+
+
+INITIAL_CHOICE_LOOKUPS: Dict[str, InitialChoiceLookup] = {
+    'country': InitialChoiceLookup(
+        load=lambda iso_code, person: CountriesService.get_country(iso_code=iso_code, person=person),
+        format_choice=format_country_choice,
+    ),
+    'diplomatic_post': InitialChoiceLookup(
+        load=lambda code, person: AdmissionDiplomaticPostService.get_diplomatic_post(code=code, person=person),
+        format_choice=format_diplomatic_post_choice,
+    ),
+    'language': InitialChoiceLookup(
+        load=lambda code, person: LanguageService.get_language(code=code, person=person),
+        format_choice=format_language_choice,
+    ),
+    'thesis_institute': InitialChoiceLookup(
+        load=lambda uuid, person: EntitiesService.get_ucl_entity(person=person, uuid=uuid),
+        format_choice=format_thesis_institute_choice,
+    ),
+    'diploma': InitialChoiceLookup(
+        load=lambda uuid, person: DiplomaService.get_diploma(person=person, uuid=uuid),
+        format_choice=format_diploma_choice,
+    ),
+    'superior_institute': InitialChoiceLookup(
+        load=lambda uuid, person: SuperiorInstituteService.get_superior_institute(person=person, uuid=uuid),
+        format_choice=format_school_choice,
+    ),
+    'high_school': InitialChoiceLookup(
+        load=lambda uuid, person: HighSchoolService.get_high_school(person=person, uuid=uuid),
+        format_choice=format_school_choice,
+    ),
+    'scholarship': InitialChoiceLookup(
+        load=lambda uuid, person: CachedScholarshipService.get_scholarship(person=person, scholarship_uuid=uuid),
+        format_choice=lambda scholarship: (scholarship.uuid, format_scholarship(scholarship)),
+    ),
+}
+
 
-    if current_year is None:
-        current_year = AcademicYearService.get_current_academic_year(person, academic_years)
+class InitialChoicesFormMixin:
+    """
+    Form mixin resolving the initial choices of the fields whose choices are loaded from the web services.
 
-    if additional_years is None:
-        additional_years = set()
+    The fields are declared in `initial_choices_fields`, mapping each field name to a key of `INITIAL_CHOICE_LOOKUPS`.
+    `resolve_initial_choices` collects the values of these fields and loads the related objects in one concurrent
+    batch, so that the cost of the lookups is the latency of the slowest one instead of their sum. The loaded objects
+    are then available in `initial_choices_objects`.
+    """
+
+    initial_choices_fields: Dict[str, str] = {}
+
+    def get_initial_choice_value(self, field_name):
+        """Return the value whose choice must be loaded, from the data or else from the initial data."""
+        return self.data.get(
+            self.add_prefix(field_name),
+            self.initial.get(field_name, self.fields[field_name].initial),
+        )
+
+    def resolve_initial_choices(self, person):
+        values = {
+            field_name: self.get_initial_choice_value(field_name)
+            for field_name in self.initial_choices_fields
+            if field_name in self.fields
+        }
 
-    if exclude_current:
-        current_year -= 1
+        # The same object is loaded once, even if several fields refer to it
+        lookup_keys = list(
+            dict.fromkeys(
+                (self.initial_choices_fields[field_name], value) for field_name, value in values.items() if value
+            )
+        )
+        loaded_objects = run_concurrently(
+            *(partial(INITIAL_CHOICE_LOOKUPS[lookup_name].load, value, person) for lookup_name, value in lookup_keys)
+        )
+        loaded_objects_by_key = dict(zip(lookup_keys, loaded_objects))
 
-    lower_year = current_year - 100
+        self.initial_choices_objects = {}
+        for field_name, value in values.items():
+            lookup_name = self.initial_choices_fields[field_name]
+            loaded_object = loaded_objects_by_key.get((lookup_name, value)) if value else None
+            self.initial_choices_objects[field_name] = loaded_object
+            self.fields[field_name].widget.choices = (
+                EMPTY_CHOICE + (INITIAL_CHOICE_LOOKUPS[lookup_name].format_choice(loaded_object),)
+                if loaded_object
+                else EMPTY_CHOICE
+            )
 
-    if format_label_function is None:
 
-        def default_format_label_function(academic_year):
-            return f"{academic_year.year}-{academic_year.year + 1}"
+def format_academic_year_end_label(academic_year):
+    return str(academic_year.year + 1)
 
-        format_label_function = default_format_label_function
 
-    return EMPTY_CHOICE + tuple(
-        (academic_year.year, format_label_function(academic_year))
-        for academic_year in academic_years
-        if current_year >= academic_year.year >= lower_year or academic_year.year in additional_years
+def get_past_academic_years_choices(
+    person,
+    exclude_current=False,
+    current_year=None,
+    calendar: AcademicCalendar | None = None,
+    format_label_function=format_academic_year_label,
+    additional_years: set[int] | None = None,
+):
+    """Return a list of choices of past academic years."""
+    if calendar is None:
+        calendar = AcademicYearService.get_academic_calendar(person)
+
+    return EMPTY_CHOICE + calendar.get_past_choices(
+        exclude_current=exclude_current,
+        current_year=current_year,
+        format_label=format_label_function,
+        additional_years=frozenset(additional_years or ()),
     )
 
 
 def get_academic_years_choices(person):
     """Return a list of choices of academic years."""
-    return EMPTY_CHOICE + tuple(
-        (academic_year.year, f"{academic_year.year}-{academic_year.year + 1}")
-        for academic_year in AcademicYearService.get_academic_years(person)
-    )
+    return EMPTY_CHOICE + AcademicYearService.get_academic_calendar(person).get_choices()
 
 
 class CustomDateInput(forms.DateInput):
@@ -30,6 +30,7 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext
 from localflavor.generic.forms import IBAN_COUNTRY_CODE_LENGTH, BICFormField
+from localflavor.generic.validators import IBANValidator
 
 from admission.constants import FIELD_REQUIRED_MESSAGE
 from admission.contrib.enums import dynamic_person_concerned
@@ -46,13 +47,10 @@ from admission.contrib.enums.accounting import (
 )
 from admission.contrib.forms import AdmissionFileUploadField as FileUploadField
 from admission.contrib.forms import RadioBooleanField, get_example_text
+from admission.services.iban import validate_iban
 from admission.templatetags.admission import get_academic_year
 from admission.utils import mark_safe_lazy
-from reference.services.iban_validator import (
-    IBANValidatorException,
-    IBANValidatorRequestException,
-    IBANValidatorService,
-)
+from reference.services.iban_validator import IBANValidatorException
 
 IBAN_MIN_LENGTH = min(IBAN_COUNTRY_CODE_LENGTH.values())
 
@@ -660,15 +658,18 @@ class AccountingForm(forms.Form):
 
     def clean_numero_compte_iban(self):
         value = self.cleaned_data.get('numero_compte_iban')
-        if value:
+        # The IBAN is only validated if it is used
+        if value and self.cleaned_data.get('type_numero_compte') == ChoixTypeCompteBancaire.IBAN.name:
             try:
-                IBANValidatorService.validate(value)
-                self.valid_iban = True
+                # Check the structure and the checksum before calling the remote validator
+                IBANValidator()(value)
+                self.valid_iban = validate_iban(value)
+            except ValidationError:
+                self.valid_iban = False
+                raise
             except IBANValidatorException as e:
                 self.valid_iban = False
                 raise ValidationError(e.message)
-            except IBANValidatorRequestException:
-                pass
         return value
 
     def clean_attestation_absence_dette_etablissement(self):
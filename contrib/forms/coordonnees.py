@@ -30,9 +30,9 @@ from django.utils.translation import pgettext_lazy as __
 
 from admission.constants import BE_ISO_CODE, FIELD_REQUIRED_MESSAGE
 from admission.contrib.forms import (
+    InitialChoicesFormMixin,
     PhoneField,
     autocomplete,
-    get_country_initial_choices,
     get_example_text,
 )
 from admission.utils import force_title
@@ -74,7 +74,11 @@ class DoctorateAdmissionCoordonneesForm(forms.Form):
             self.fields['private_email'].disabled = True
 
 
-class DoctorateAdmissionAddressForm(forms.Form):
+class DoctorateAdmissionAddressForm(InitialChoicesFormMixin, forms.Form):
+    initial_choices_fields = {
+        'country': 'country',
+    }
+
     street = forms.CharField(
         required=False,
         label=_("Street"),
@@ -148,10 +152,7 @@ class DoctorateAdmissionAddressForm(forms.Form):
             if self.initial.get('country') != BE_ISO_CODE:
                 self.initial = {'country': BE_ISO_CODE}
 
-        self.fields['country'].widget.choices = get_country_initial_choices(
-            self.data.get(self.add_prefix("country"), self.initial.get("country")),
-            person,
-        )
+        self.resolve_initial_choices(person)
         if self.data.get(self.add_prefix('country'), self.initial.get('country')) == BE_ISO_CODE:
             self.initial["be_postal_code"] = self.initial.get("postal_code")
             self.initial["be_city"] = self.initial.get("city")
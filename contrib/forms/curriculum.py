@@ -52,16 +52,12 @@ from admission.contrib.forms import (
     CustomDateInput,
     NoInput,
     RadioBooleanField,
+    InitialChoicesFormMixin,
     autocomplete,
-    get_country_initial_choices,
-    get_diploma_initial_choices,
     get_example_text,
-    get_language_initial_choices,
     get_past_academic_years_choices,
-    get_superior_institute_initial_choices,
 )
 from admission.contrib.forms.specific_question import ConfigurableFormMixin
-from admission.services.reference import CountriesService
 from admission.utils import mark_safe_lazy
 
 CurriculumField = partial(
@@ -376,7 +372,14 @@ EDUCATIONAL_EXPERIENCE_FIELDS_BY_CONTEXT = {
 }
 
 
-class AdmissionCurriculumEducationalExperienceForm(ByContextAdmissionForm):
+class AdmissionCurriculumEducationalExperienceForm(InitialChoicesFormMixin, ByContextAdmissionForm):
+    initial_choices_fields = {
+        'country': 'country',
+        'linguistic_regime': 'language',
+        'program': 'diploma',
+        'institute': 'superior_institute',
+    }
+
     start = forms.ChoiceField(
         label=_('Start'),
         widget=autocomplete.Select2(),
@@ -586,30 +589,10 @@ class AdmissionCurriculumEducationalExperienceForm(ByContextAdmissionForm):
         self.fields['start'].choices = academic_years_choices
         self.fields['end'].choices = academic_years_choices
 
-        iso_code = self.data.get(self.add_prefix("country"), self.initial.get("country"))
-        country = CountriesService.get_country(iso_code=iso_code, person=person) if iso_code else None
+        self.resolve_initial_choices(person)
 
+        country = self.initial_choices_objects['country']
         self.fields['country'].is_ue_country = bool(country and country.european_union)
-        self.fields['country'].widget.choices = get_country_initial_choices(
-            iso_code=iso_code,
-            person=person,
-            loaded_country=country,
-        )
-
-        self.fields['linguistic_regime'].widget.choices = get_language_initial_choices(
-            self.data.get(self.add_prefix('linguistic_regime'), self.initial.get('linguistic_regime')),
-            person,
-        )
-
-        self.fields['program'].widget.choices = get_diploma_initial_choices(
-            self.data.get(self.add_prefix('program'), self.initial.get('program')),
-            person,
-        )
-
-        self.fields['institute'].widget.choices = get_superior_institute_initial_choices(
-            self.data.get(self.add_prefix('institute'), self.initial.get('institute')),
-            person,
-        )
 
         # Initialize the fields which are not automatically mapping
         if self.initial:
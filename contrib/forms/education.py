@@ -43,15 +43,14 @@ from admission.contrib.enums.secondary_studies import (
 from admission.contrib.forms import EMPTY_CHOICE
 from admission.contrib.forms import AdmissionFileUploadField as FileUploadField
 from admission.contrib.forms import (
+    InitialChoicesFormMixin,
     RadioBooleanField,
     autocomplete,
-    get_country_initial_choices,
-    get_high_school_initial_choices,
-    get_language_initial_choices,
+    format_academic_year_end_label,
     get_past_academic_years_choices,
 )
 from admission.contrib.forms.specific_question import ConfigurableFormMixin
-from admission.services.reference import AcademicYearService, CountriesService
+from admission.services.reference import AcademicYearService
 
 
 def disable_fields(condition, fields, fields_to_keep_enabled_names=None):
@@ -99,12 +98,11 @@ class BaseAdmissionEducationForm(ConfigurableFormMixin):
         super().__init__(*args, **kwargs)
         self.can_update_diploma = can_update_diploma
         self.is_valuated = is_valuated
-        academic_years = AcademicYearService.get_academic_years(person)
-        self.current_year = AcademicYearService.get_current_academic_year(person, academic_years)
+        calendar = AcademicYearService.get_academic_calendar(person)
+        self.current_year = calendar.current_year
         self.fields["graduated_from_high_school_year"].widget.choices = get_past_academic_years_choices(
             person,
-            current_year=self.current_year,
-            academic_years=academic_years,
+            calendar=calendar,
         )
         self.fields['graduated_from_high_school'].choices = GotDiploma.choices_with_dynamic_year(self.current_year)
 
@@ -176,7 +174,7 @@ class BachelorAdmissionEducationForm(BaseAdmissionEducationForm):
 
         self.fields['first_cycle_admission_exam_year'].choices = get_past_academic_years_choices(
             kwargs['person'],
-            format_label_function=lambda academic_year: str(academic_year.year + 1),
+            format_label_function=format_academic_year_end_label,
         )
 
         diploma = belgian_diploma or foreign_diploma
@@ -204,7 +202,11 @@ class BachelorAdmissionEducationForm(BaseAdmissionEducationForm):
         return cleaned_data
 
 
-class BachelorAdmissionEducationBelgianDiplomaForm(forms.Form):
+class BachelorAdmissionEducationBelgianDiplomaForm(InitialChoicesFormMixin, forms.Form):
+    initial_choices_fields = {
+        'institute': 'high_school',
+    }
+
     community = forms.ChoiceField(
         label=_("Belgian education community"),
         choices=EMPTY_CHOICE + BelgianCommunitiesOfEducation.choices(),
@@ -256,10 +258,7 @@ class BachelorAdmissionEducationBelgianDiplomaForm(forms.Form):
         super().__init__(*args, **kwargs)
         self.initial['other_institute'] = bool(self.initial.get('other_institute_name'))
         self.initial['has_other_educational_type'] = bool(self.initial.get('educational_other'))
-        self.fields['institute'].widget.choices = get_high_school_initial_choices(
-            self.data.get(self.add_prefix("institute"), self.initial.get("institute")),
-            person,
-        )
+        self.resolve_initial_choices(person)
 
         disable_fields(not can_update_diploma, self.fields)
 
@@ -295,7 +294,12 @@ class BachelorAdmissionEducationBelgianDiplomaForm(forms.Form):
         return cleaned_data
 
 
-class BachelorAdmissionEducationForeignDiplomaForm(forms.Form):
+class BachelorAdmissionEducationForeignDiplomaForm(InitialChoicesFormMixin, forms.Form):
+    initial_choices_fields = {
+        'country': 'country',
+        'linguistic_regime': 'language',
+    }
+
     foreign_diploma_type = forms.ChoiceField(
         label=_("What diploma have you obtained (or will obtain)?"),
         choices=ForeignDiplomaTypes.choices(),
@@ -432,20 +436,10 @@ class BachelorAdmissionEducationForeignDiplomaForm(forms.Form):
 
         self.is_med_dent_training = is_med_dent_training
 
-        iso_code = self.data.get(self.add_prefix("country"), self.initial.get("country"))
-        country = CountriesService.get_country(iso_code=iso_code, person=person) if iso_code else None
+        self.resolve_initial_choices(person)
 
+        country = self.initial_choices_objects['country']
         self.fields['country'].is_ue_country = bool(country and country.european_union)
-        self.fields['country'].widget.choices = get_country_initial_choices(
-            iso_code=iso_code,
-            person=person,
-            loaded_country=country,
-        )
-
-        self.fields['linguistic_regime'].widget.choices = get_language_initial_choices(
-            self.data.get(self.add_prefix("linguistic_regime"), self.initial.get("linguistic_regime")),
-            person,
-        )
 
         disable_fields(not can_update_diploma, self.fields)
 
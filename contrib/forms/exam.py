@@ -28,7 +28,11 @@ from django import forms
 from django.utils.translation import gettext_lazy as _
 
 from admission.contrib.forms import AdmissionFileUploadField as FileUploadField
-from admission.contrib.forms import autocomplete, get_past_academic_years_choices
+from admission.contrib.forms import (
+    autocomplete,
+    format_academic_year_end_label,
+    get_past_academic_years_choices,
+)
 
 
 class ExamForm(forms.Form):
@@ -50,7 +54,7 @@ class ExamForm(forms.Form):
         self.fields['certificate'].label = certificate_title
         self.fields['year'].choices = get_past_academic_years_choices(
             person,
-            format_label_function=lambda academic_year: str(academic_year.year + 1),
+            format_label_function=format_academic_year_end_label,
         )
         if is_valuated:
             self.fields['certificate'].disabled = True
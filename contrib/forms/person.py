@@ -45,8 +45,8 @@ from admission.contrib.forms import (
     LOWERCASE_MONTHS,
     CustomDateInput,
     RadioBooleanField,
+    InitialChoicesFormMixin,
     autocomplete,
-    get_country_initial_choices,
     get_example_text,
     get_past_academic_years_choices,
     get_year_choices,
@@ -59,7 +59,12 @@ YES = '1'
 NO = '0'
 
 
-class DoctorateAdmissionPersonForm(forms.Form):
+class DoctorateAdmissionPersonForm(InitialChoicesFormMixin, forms.Form):
+    initial_choices_fields = {
+        'birth_country': 'country',
+        'country_of_citizenship': 'country',
+    }
+
     FIELDS_BY_PARTIAL_UPDATE_MODE = {
         PersonUpdateMode.LAST_ENROLMENT: {
             'last_registration_year',
@@ -301,14 +306,7 @@ class DoctorateAdmissionPersonForm(forms.Form):
 
         self.fields['birth_year'].choices = get_year_choices()
 
-        self.fields['birth_country'].widget.choices = get_country_initial_choices(
-            self.data.get(self.add_prefix("birth_country"), self.initial.get("birth_country")),
-            person,
-        )
-        self.fields['country_of_citizenship'].widget.choices = get_country_initial_choices(
-            self.data.get(self.add_prefix("country_of_citizenship"), self.initial.get("country_of_citizenship")),
-            person,
-        )
+        self.resolve_initial_choices(person)
 
         if self.initial.get('id_card_number'):
             self.initial['identification_type'] = IdentificationType.ID_CARD_NUMBER.name
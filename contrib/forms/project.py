@@ -45,11 +45,10 @@ from admission.contrib.enums.scholarship import TypeBourse
 from admission.contrib.forms import (
     EMPTY_CHOICE,
     CustomDateInput,
+    InitialChoicesFormMixin,
     RadioBooleanField,
     SelectOrOtherField,
     autocomplete,
-    get_language_initial_choices,
-    get_scholarship_choices,
     get_thesis_location_initial_choices,
 )
 from admission.contrib.forms import AdmissionFileUploadField as FileUploadField
@@ -61,7 +60,12 @@ SCIENCE_DOCTORATE = 'SC3DP'
 COMMISSION_CDSS = 'CDSS'
 
 
-class DoctorateAdmissionProjectForm(forms.Form):
+class DoctorateAdmissionProjectForm(InitialChoicesFormMixin, forms.Form):
+    initial_choices_fields = {
+        'bourse_recherche': 'scholarship',
+        'langue_redaction_these': 'language',
+    }
+
     justification = forms.CharField(
         label=_("Brief justification"),
         widget=forms.Textarea(
@@ -285,19 +289,11 @@ class DoctorateAdmissionProjectForm(forms.Form):
         if self.data.get(self.add_prefix("raison_non_soutenue"), self.initial.get("raison_non_soutenue")):
             self.fields['non_soutenue'].initial = True
 
-        scholarship_uuid = self.data.get(self.add_prefix('bourse_recherche'), self.initial.get('bourse_recherche'))
-        if scholarship_uuid:
-            self.fields['bourse_recherche'].widget.choices = get_scholarship_choices(
-                uuid=scholarship_uuid,
-                person=self.person,
-            )
+        self.resolve_initial_choices(self.person)
 
         lang_code = self.data.get(self.add_prefix("langue_redaction_these"), self.initial.get("langue_redaction_these"))
         if lang_code == LANGUAGE_UNDECIDED:
-            choices = ((LANGUAGE_UNDECIDED, _('Undecided')),)
-        else:
-            choices = get_language_initial_choices(lang_code, self.person)
-        self.fields["langue_redaction_these"].widget.choices = choices
+            self.fields["langue_redaction_these"].widget.choices = ((LANGUAGE_UNDECIDED, _('Undecided')),)
 
         # Initialize some fields if they are not already set in the input data
         self.initial['avec_autre_bourse_recherche'] = bool(self.initial.get('autre_bourse_recherche'))
@@ -336,6 +332,11 @@ class DoctorateAdmissionProjectForm(forms.Form):
 
         return data
 
+    def get_initial_choice_value(self, field_name):
+        value = super().get_initial_choice_value(field_name)
+        # The undecided language is not loaded from the web services
+        return None if value == LANGUAGE_UNDECIDED else value
+
     def get_field_label_classes(self):
         """Returns the classes that should be applied to the label of the form fields."""
 
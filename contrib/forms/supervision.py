@@ -35,8 +35,8 @@ from admission.contrib.enums.supervision import DecisionApprovalEnum
 from admission.contrib.forms import EMPTY_CHOICE
 from admission.contrib.forms import AdmissionFileUploadField as FileUploadField
 from admission.contrib.forms import (
+    InitialChoicesFormMixin,
     autocomplete,
-    get_country_initial_choices,
     get_thesis_institute_initial_choices,
 )
 
@@ -53,7 +53,11 @@ EXTERNAL_FIELDS = [
 ]
 
 
-class DoctorateAdmissionMemberSupervisionForm(forms.Form):
+class DoctorateAdmissionMemberSupervisionForm(InitialChoicesFormMixin, forms.Form):
+    initial_choices_fields = {
+        'pays': 'country',
+    }
+
     prenom = forms.CharField(
         label=_("First name"),
         required=False,
@@ -105,10 +109,7 @@ class DoctorateAdmissionMemberSupervisionForm(forms.Form):
 
     def __init__(self, person, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['pays'].widget.choices = get_country_initial_choices(
-            self.data.get(self.add_prefix("pays"), self.initial.get("pays", self.fields['pays'].initial)),
-            person,
-        )
+        self.resolve_initial_choices(person)
 
     def clean(self):
         data = super().clean()
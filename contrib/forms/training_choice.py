@@ -25,6 +25,7 @@
 # ##############################################################################
 
 import json
+from functools import partial
 from typing import Dict, Optional
 
 from dal import forward
@@ -68,11 +69,12 @@ from admission.contrib.forms.project import (
 )
 from admission.contrib.forms.specific_question import ConfigurableFormMixin
 from admission.services.autocomplete import AdmissionAutocompleteService
+from admission.services.background import run_concurrently
 from admission.services.continuing_education import ContinuingEducationService
 from admission.services.education_group import TrainingsService
 from admission.services.proposition import AdmissionPropositionService
+from admission.services.reference import CachedScholarshipService
 from admission.utils import format_scholarship, split_training_id
-from reference.services.scholarship import ScholarshipService
 
 
 def get_training(person, training: str):
@@ -332,8 +334,23 @@ class TrainingChoiceForm(ConfigurableFormMixin):
             ),
         }
 
+        scholarships = {name: scholarship_uuid for name, scholarship_uuid in scholarships.items() if scholarship_uuid}
+        selected_training = general_education_training or mixed_training or doctorate_training or ''
+
+        # The dependencies of the form are loaded concurrently
+        campus_choices, sectors, doctorate_pre_admissions, training, *scholarship_objs = run_concurrently(
+            partial(get_campus_choices, self.person),
+            partial(AdmissionAutocompleteService.get_sectors, self.person),
+            self.get_doctorate_pre_admissions,
+            partial(get_training, person=self.person, training=selected_training),
+            *(
+                partial(CachedScholarshipService.get_scholarship, person=person, scholarship_uuid=scholarship_uuid)
+                for scholarship_uuid in scholarships.values()
+            ),
+        )
+
         # Initialize fields with dynamic choices
-        self.fields['campus'].choices = get_campus_choices(self.person)
+        self.fields['campus'].choices = campus_choices
 
         self.general_education_training_obj: Optional[dict] = None
         self.continuing_education_training_obj: Optional[dict] = None
@@ -346,10 +363,7 @@ class TrainingChoiceForm(ConfigurableFormMixin):
         self.fields['mixed_training'].widget.forward.append(previous_year_enrolled_trainings_const)
 
         if general_education_training:
-            self.general_education_training_obj = get_training(
-                person=self.person,
-                training=general_education_training,
-            )
+            self.general_education_training_obj = training
             general_choices = get_training_choices(training=self.general_education_training_obj)
 
             # We need to provide additional data so we use the data attribute instead of the choice
@@ -368,7 +382,6 @@ class TrainingChoiceForm(ConfigurableFormMixin):
                 self.general_education_training_obj.get('education_group_type')
             )
         elif mixed_training:
-            training = get_training(person=self.person, training=mixed_training)
             self.fields['mixed_training'].widget.choices = get_training_choices(
                 training=training,
             )
@@ -383,7 +396,7 @@ class TrainingChoiceForm(ConfigurableFormMixin):
             self.fields['mixed_training'].training_type = training['education_group_type']
 
         elif doctorate_training:
-            self.doctorate_training_obj = get_training(person=self.person, training=doctorate_training)
+            self.doctorate_training_obj = training
             doctorate_choices = get_training_choices(training=self.doctorate_training_obj)
 
             # We need to provide additional data so we use the data attribute instead of the choice
@@ -409,34 +422,31 @@ class TrainingChoiceForm(ConfigurableFormMixin):
                 elif self.doctorate_training_obj['acronym'] == SCIENCE_DOCTORATE:
                     self.fields['science_sub_domain'].initial = self.initial['proximity_commission']
 
-        for scholarship_name, scholarship_uuid in scholarships.items():
-            if scholarship_uuid:
-                scholarship_obj = ScholarshipService.get_scholarship(
-                    person=person,
-                    scholarship_uuid=scholarship_uuid,
-                )
-                self.fields[scholarship_name].widget.choices = (
-                    (
-                        scholarship_obj.uuid,
-                        format_scholarship(scholarship_obj),
-                    ),
-                )
+        for scholarship_name, scholarship_obj in zip(scholarships, scholarship_objs):
+            self.fields[scholarship_name].widget.choices = (
+                (
+                    scholarship_obj.uuid,
+                    format_scholarship(scholarship_obj),
+                ),
+            )
 
         self.fields['sector'].widget.choices = EMPTY_CHOICE + tuple(
-            (sector.sigle, f"{sector.sigle} - {sector.intitule}")
-            for sector in AdmissionAutocompleteService.get_sectors(person)
+            (sector.sigle, f"{sector.sigle} - {sector.intitule}") for sector in sectors
         )
 
-        self.initialize_pre_admission_field()
+        self.initialize_pre_admission_field(doctorate_pre_admissions)
 
     def _format_pre_admission_training(self, training):
         return f"{training.sigle} - {training.intitule} ({training.campus.nom})"
 
-    def initialize_pre_admission_field(self):
+    def get_doctorate_pre_admissions(self):
         # Manage a doctorate admission following a pre-admission
         if self.current_context == 'create':
-            doctorate_pre_admissions = AdmissionPropositionService.get_doctorate_pre_admission_propositions(self.person)
+            return AdmissionPropositionService.get_doctorate_pre_admission_propositions(self.person)
+        return None
 
+    def initialize_pre_admission_field(self, doctorate_pre_admissions):
+        if doctorate_pre_admissions is not None:
             choices = [[self.NO_VALUE, _('No')]]
 
             for doctorate_pre_admission in doctorate_pre_admissions:
@@ -25,6 +25,7 @@
 # ##############################################################################
 
 import itertools
+from copy import copy
 from typing import List
 
 from dal import autocomplete
@@ -42,6 +43,8 @@ from admission.contrib.enums import ForeignDiplomaTypes, TypeFormation
 from admission.contrib.enums.diploma import StudyType
 from admission.contrib.forms import EMPTY_VALUE
 from admission.services.autocomplete import AdmissionAutocompleteService
+from admission.services.background import run_in_background
+from admission.services.cache import get_cache, make_cache_key
 from admission.services.organisation import EntitiesService
 from admission.services.reference import (
     CitiesService,
@@ -51,6 +54,7 @@ from admission.services.reference import (
     LanguageService,
     SuperiorNonUniversityService,
     UniversityService,
+    filter_city_names,
 )
 from admission.utils import (
     format_entity_address,
@@ -91,10 +95,15 @@ LANGUAGE_UNDECIDED = 'XX'
 
 TRUTHY_VALUES = [True, "True", "true"]
 
+PREFETCH_LOCK_TIMEOUT = 30
+
 
 class PaginatedAutocompleteMixin:
     paginate_by = 20
     page_kwargs = 'page'
+    # Number of following pages to fetch in the background once a page has been served. If None, the value of the
+    # ADMISSION_AUTOCOMPLETE_PREFETCH_DEPTH setting is used (by default, no page is prefetched).
+    prefetch_depth = None
 
     def get_page(self):
         try:
@@ -102,6 +111,21 @@ class PaginatedAutocompleteMixin:
         except Exception:
             return 1
 
+    def get_prefetch_depth(self):
+        if self.prefetch_depth is not None:
+            return self.prefetch_depth
+        return getattr(settings, 'ADMISSION_AUTOCOMPLETE_PREFETCH_DEPTH', 0)
+
+    def get_cache_key(self, page):
+        return make_cache_key(
+            'autocomplete',
+            self.__class__.__name__,
+            get_language(),
+            self.q,
+            self.forwarded,
+            page,
+        )
+
     def get_webservice_pagination_kwargs(self):
         return {
             'limit': self.paginate_by,
@@ -114,12 +138,53 @@ class PaginatedAutocompleteMixin:
     def results(self, results):
         raise NotImplementedError
 
+    def get_page_data(self):
+        results = self.get_list()
+        return {'results': self.results(results), 'pagination': {'more': len(results) >= self.paginate_by}}
+
     def get(self, request, *args, **kwargs):
         """Return option list json response."""
-        results = self.get_list()
-        return JsonResponse(
-            {'results': self.results(results), 'pagination': {'more': len(results) >= self.paginate_by}}
-        )
+        page = self.get_page()
+        prefetch_depth = self.get_prefetch_depth()
+
+        page_data = get_cache().get(self.get_cache_key(page)) if prefetch_depth > 0 else None
+        if page_data is None:
+            page_data = self.get_page_data()
+
+        if prefetch_depth > 0 and page_data['pagination']['more']:
+            run_in_background(self.prefetch_pages, range(page + 1, page + prefetch_depth + 1))
+
+        return JsonResponse(page_data)
+
+    def get_view_for_page(self, page):
+        """Return a copy of the current view whose request targets the specified page."""
+        view = copy(self)
+        view.request = copy(self.request)
+        view.request.GET = self.request.GET.copy()
+        view.request.GET[self.page_kwargs] = page
+        return view
+
+    def prefetch_pages(self, pages):
+        """Load the specified pages and store them in the cache, until there are no more results."""
+        cache = get_cache()
+        timeout = getattr(settings, 'ADMISSION_AUTOCOMPLETE_CACHE_TIMEOUT', 300)
+
+        for page in pages:
+            cache_key = self.get_cache_key(page)
+            page_data = cache.get(cache_key)
+
+            if page_data is None:
+                # Another worker may already be loading this page
+                if not cache.add(f'{cache_key}:lock', True, PREFETCH_LOCK_TIMEOUT):
+                    return
+                try:
+                    page_data = self.get_view_for_page(page).get_page_data()
+                    cache.set(cache_key, page_data, timeout)
+                finally:
+                    cache.delete(f'{cache_key}:lock')
+
+            if not page_data['pagination']['more']:
+                return
 
 
 class DoctorateAutocomplete(autocomplete.Select2ListView):
@@ -313,22 +378,36 @@ class DiplomaticPostAutocomplete(PaginatedAutocompleteMixin, autocomplete.Select
         return final_results
 
 
-class CityAutocomplete(autocomplete.Select2ListView):
+class CityAutocomplete(PaginatedAutocompleteMixin, autocomplete.Select2ListView):
     urlpatterns = 'city'
 
     def get_list(self):
-        return CitiesService.get_cities(
-            person=self.request.user.person,
-            search=self.q,
-            zip_code=self.forwarded.get('postal_code', ''),
+        postal_code = self.forwarded.get('postal_code', '')
+        pagination_kwargs = self.get_webservice_pagination_kwargs()
+
+        # Most lookups are related to a Belgian postal code so we use the local index when it is loaded
+        cities_by_postal_code = (
+            CitiesService.get_cities_by_postal_code(person=self.request.user.person) if postal_code else None
         )
+        if cities_by_postal_code and postal_code in cities_by_postal_code:
+            offset = pagination_kwargs['offset']
+            return filter_city_names(cities_by_postal_code[postal_code], self.q)[
+                offset : offset + pagination_kwargs['limit']
+            ]
 
-    def autocomplete_results(self, results):
-        return results
+        return [
+            city.name
+            for city in CitiesService.get_cities(
+                person=self.request.user.person,
+                search=self.q,
+                zip_code=postal_code,
+                **pagination_kwargs,
+            )
+        ]
 
     def results(self, results):
         """Return the result dictionary."""
-        return [dict(id=city.name, text=city.name) for city in results]
+        return [dict(id=city, text=city) for city in results]
 
 
 class LanguageAutocomplete(PaginatedAutocompleteMixin, autocomplete.Select2ListView):
@@ -380,6 +459,7 @@ class TutorAutocomplete(PaginatedAutocompleteMixin, autocomplete.Select2ListView
         return AdmissionAutocompleteService.autocomplete_tutors(
             person=self.request.user.person,
             search=self.q,
+            **self.get_webservice_pagination_kwargs(),
         )
 
     def results(self, results):
@@ -36,7 +36,7 @@ from admission.contrib.views.common.detail_tabs.curriculum_experiences import (
     initialize_field_texts,
     professional_experience_can_be_updated,
 )
-from admission.contrib.views.mixins import LoadDossierViewMixin
+from admission.contrib.views.mixins import LoadDossierViewMixin, OutboundCallBudgetMixin
 from admission.services.person import (
     AdmissionPersonService,
     ContinuingEducationAdmissionPersonService,
@@ -47,7 +47,7 @@ from admission.services.proposition import GlobalPropositionBusinessException
 __all__ = ['AdmissionCurriculumDetailView']
 
 
-class AdmissionCurriculumDetailView(LoadDossierViewMixin, TemplateView):
+class AdmissionCurriculumDetailView(OutboundCallBudgetMixin, LoadDossierViewMixin, TemplateView):
     template_name = 'admission/details/curriculum.html'
     service_mapping = {
         'create': AdmissionPersonService,
@@ -56,6 +56,7 @@ class AdmissionCurriculumDetailView(LoadDossierViewMixin, TemplateView):
         'continuing-education': ContinuingEducationAdmissionPersonService,
     }
     tab_of_specific_questions = Onglets.CURRICULUM.name
+    outbound_call_budget = 10
 
     @cached_property
     def curriculum(self):
@@ -168,35 +168,44 @@ def get_educational_experience_year_set_with_lost_years(educational_experience_y
 
 def initialize_field_texts(person, curriculum_experiences, context):
     """
-    Add into each experience, the names of the country and the linguistic regime.
+    Add into each experience, the names of the country and the linguistic regime. Each language, program and institute
+    is only loaded once, even if it is shared by several experiences.
     """
     is_supported_language = get_language() == settings.LANGUAGE_CODE
+    linguistic_regimes = {}
+    programs = {}
+    institutes = {}
 
     for experience in curriculum_experiences:
         # Initialize the linguistic regime
         if getattr(experience, 'linguistic_regime', None):
-            linguistic_regime = LanguageService.get_language(
-                code=experience.linguistic_regime,
-                person=person,
-            )
+            if experience.linguistic_regime not in linguistic_regimes:
+                linguistic_regimes[experience.linguistic_regime] = LanguageService.get_language(
+                    code=experience.linguistic_regime,
+                    person=person,
+                )
+            linguistic_regime = linguistic_regimes[experience.linguistic_regime]
             experience.linguistic_regime_name = (
                 linguistic_regime.name if is_supported_language else linguistic_regime.name_en
             )
 
         # Initialize the program
         if getattr(experience, 'program', None):
-            program = DiplomaService.get_diploma(
-                uuid=experience.program,
-                person=person,
-            )
-            experience.education_name = program.title
+            if experience.program not in programs:
+                programs[experience.program] = DiplomaService.get_diploma(
+                    uuid=experience.program,
+                    person=person,
+                )
+            experience.education_name = programs[experience.program].title
 
         # Initialize the institute
         if getattr(experience, 'institute', None):
-            institute = SuperiorInstituteService.get_superior_institute(
-                uuid=experience.institute,
-                person=person,
-            )
+            if experience.institute not in institutes:
+                institutes[experience.institute] = SuperiorInstituteService.get_superior_institute(
+                    uuid=experience.institute,
+                    person=person,
+                )
+            institute = institutes[experience.institute]
             experience.institute_name = institute.name
             experience.institute_address = format_address(
                 street_number=institute.street_number,
@@ -27,13 +27,13 @@ from django.views.generic import TemplateView
 
 from admission.contrib.enums import TRAINING_TYPES_WITH_SCHOLARSHIP
 from admission.contrib.enums.specific_question import Onglets
-from admission.contrib.views.mixins import LoadDossierViewMixin
+from admission.contrib.views.mixins import DossierETagMixin, LoadDossierViewMixin
 from admission.services.proposition import AdmissionPropositionService
 
 __all__ = ['TrainingChoiceDetailView']
 
 
-class TrainingChoiceDetailView(LoadDossierViewMixin, TemplateView):
+class TrainingChoiceDetailView(DossierETagMixin, LoadDossierViewMixin, TemplateView):
     tab_of_specific_questions = Onglets.CHOIX_FORMATION.name
 
     def get_context_data(self, **kwargs):
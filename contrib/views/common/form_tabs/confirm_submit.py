@@ -23,6 +23,8 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+from collections import defaultdict
+
 from django.conf import settings
 from django.contrib import messages
 from django.shortcuts import redirect, resolve_url
@@ -34,21 +36,21 @@ from django.views.generic import FormView
 from admission.constants import PROPOSITION_JUST_SUBMITTED
 from admission.contrib.enums import ChoixStatutPropositionGenerale
 from admission.contrib.forms.confirm_submit import AdmissionConfirmSubmitForm
-from admission.contrib.views.mixins import LoadDossierViewMixin
+from admission.contrib.views.mixins import LoadDossierViewMixin, OutboundCallBudgetMixin
 from admission.services.mixins import WebServiceFormMixin
 from admission.services.proposition import (
     ADDITIONAL_BUSINESS_EXCEPTIONS,
     TAB_OF_BUSINESS_EXCEPTION,
     AdmissionPropositionService,
 )
-from admission.templatetags.admission import TAB_TREES, can_read_tab
+from admission.templatetags.admission import SUBTABS_BY_NAME, can_read_tab
 
 __all__ = [
     'AdmissionConfirmSubmitFormView',
 ]
 
 
-class AdmissionConfirmSubmitFormView(LoadDossierViewMixin, WebServiceFormMixin, FormView):
+class AdmissionConfirmSubmitFormView(OutboundCallBudgetMixin, LoadDossierViewMixin, WebServiceFormMixin, FormView):
     template_name = 'admission/forms/confirm-submit.html'
     service_mapping = {
         'doctorate': (
@@ -66,6 +68,7 @@ class AdmissionConfirmSubmitFormView(LoadDossierViewMixin, WebServiceFormMixin,
         ),
     }
     form_class = AdmissionConfirmSubmitForm
+    outbound_call_budget = 8
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -113,12 +116,7 @@ class AdmissionConfirmSubmitFormView(LoadDossierViewMixin, WebServiceFormMixin,
 
         # Group the missing conditions by tab or add them to the additional conditions dictionary if any
         if self.confirmation_conditions['errors']:
-            errors_by_tab = {
-                tab.name: {'label': tab.label, 'errors': {}}
-                for child_tabs in TAB_TREES[self.current_context].values()
-                for tab in child_tabs
-                if can_read_tab(self.admission, tab)
-            }
+            errors_by_tab_name = defaultdict(dict)
             for error in self.confirmation_conditions['errors']:
                 # Additional conditions
                 if error['status_code'] in ADDITIONAL_BUSINESS_EXCEPTIONS:
@@ -126,12 +124,14 @@ class AdmissionConfirmSubmitFormView(LoadDossierViewMixin, WebServiceFormMixin,
                     continue
 
                 # Tab related conditions
-                tab_name = TAB_OF_BUSINESS_EXCEPTION[error['status_code']]
-                if error['status_code'] not in errors_by_tab[tab_name]['errors']:
-                    errors_by_tab[tab_name]['errors'][error['status_code']] = []
-                errors_by_tab[tab_name]['errors'][error['status_code']].append(error['detail'])
+                tab_errors = errors_by_tab_name[TAB_OF_BUSINESS_EXCEPTION[error['status_code']]]
+                tab_errors.setdefault(error['status_code'], []).append(error['detail'])
 
-            context['missing_confirmation_conditions'] = errors_by_tab
+            context['missing_confirmation_conditions'] = {
+                tab_name: {'label': tab.label, 'errors': errors_by_tab_name.get(tab_name, {})}
+                for tab_name, tab in SUBTABS_BY_NAME[self.current_context].items()
+                if can_read_tab(self.admission, tab)
+            }
             context['missing_confirmations_conditions_number'] = len(self.confirmation_conditions['errors']) - len(
                 additional_conditions
             )
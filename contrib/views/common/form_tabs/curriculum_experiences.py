@@ -29,11 +29,14 @@ from abc import ABC
 from decimal import Decimal
 
 from django import forms
+from django.conf import settings
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
 from django.http import HttpResponseRedirect
 from django.shortcuts import resolve_url
 from django.template import loader
+from django.utils.functional import lazy
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import FormView, TemplateView
 
@@ -69,6 +72,7 @@ from admission.contrib.views.common.detail_tabs.curriculum_experiences import (
     initialize_field_texts,
     professional_experience_can_be_updated,
 )
+from admission.services.cache import LocalCache, make_cache_key
 from admission.services.mixins import WebServiceFormMixin
 
 __all__ = [
@@ -78,6 +82,9 @@ __all__ = [
     "AdmissionCurriculumProfessionalExperienceDeleteView",
     "AdmissionCurriculumEducationalExperienceDeleteView",
 ]
+
+# The empty year forms rendered for each context, language and valuation
+empty_year_forms_cache = LocalCache(max_size=100)
 __namespace__ = 'curriculum'
 
 from admission.services.reference import AcademicYearService
@@ -338,17 +345,8 @@ class AdmissionCurriculumEducationalExperienceFormView(AdmissionCurriculumFormEx
             },
         )
 
-        # We need to prevent the uploader component of osis-document from being initialized when the page is loaded
-        # so that the events remain attached when the form is copied. The class identifying the component is replaced
-        # in the default form and will be reset in the duplicated form, allowing osis-document to detect the file
-        # fields in this new form, and set up the appropriate VueJS components.
-        context_data["empty_form"] = loader.render_to_string(
-            template_name='admission/includes/curriculum_experience_year_form.html',
-            context={
-                'year_form': year_formset.empty_form,
-                'next_year': FOLLOWING_FORM_SET_PREFIX,
-            },
-        ).replace(OSIS_DOCUMENT_UPLOADER_CLASS, OSIS_DOCUMENT_UPLOADER_CLASS_PREFIX)
+        # Only rendered if the page is displayed
+        context_data["empty_form"] = lazy(self.render_empty_year_form, str)(year_formset, educational_experience)
 
         context_data['current_year'] = current_year
         context_data['form'] = base_form  # Trick template to display form tag
@@ -365,6 +363,42 @@ class AdmissionCurriculumEducationalExperienceFormView(AdmissionCurriculumFormEx
 
         return context_data
 
+    def render_empty_year_form(self, year_formset, educational_experience):
+        """
+        Return the HTML of the empty year form. As it only depends on the context, the language and the trainings from
+        which the experience has been valuated, it is kept in a local cache if the
+        ADMISSION_CURRICULUM_EMPTY_YEAR_FORM_CACHE_ENABLED setting is enabled.
+        """
+        cache_enabled = getattr(settings, 'ADMISSION_CURRICULUM_EMPTY_YEAR_FORM_CACHE_ENABLED', False)
+        cache_key = make_cache_key(
+            'curriculum_empty_year_form',
+            self.current_context,
+            get_language(),
+            sorted((educational_experience or {}).get('valuated_from_trainings') or []),
+        )
+
+        if cache_enabled:
+            entry = empty_year_forms_cache.get_entry(cache_key)
+            if entry is not None:
+                return entry[0]
+
+        # We need to prevent the uploader component of osis-document from being initialized when the page is loaded
+        # so that the events remain attached when the form is copied. The class identifying the component is replaced
+        # in the default form and will be reset in the duplicated form, allowing osis-document to detect the file
+        # fields in this new form, and set up the appropriate VueJS components.
+        empty_form = loader.render_to_string(
+            template_name='admission/includes/curriculum_experience_year_form.html',
+            context={
+                'year_form': year_formset.empty_form,
+                'next_year': FOLLOWING_FORM_SET_PREFIX,
+            },
+        ).replace(OSIS_DOCUMENT_UPLOADER_CLASS, OSIS_DOCUMENT_UPLOADER_CLASS_PREFIX)
+
+        if cache_enabled:
+            empty_year_forms_cache.set(cache_key, empty_form)
+
+        return empty_form
+
     def prepare_form_data(self, base_form, year_formset):
         data = base_form.cleaned_data
 
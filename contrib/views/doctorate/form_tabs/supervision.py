@@ -39,7 +39,7 @@ from admission.services.proposition import (
     TAB_OF_BUSINESS_EXCEPTION,
     AdmissionSupervisionService,
 )
-from admission.templatetags.admission import TAB_TREES, can_read_tab
+from admission.templatetags.admission import SUBTABS_BY_NAME, can_read_tab
 
 __all__ = [
     "DoctorateAdmissionSupervisionFormView",
@@ -108,9 +108,8 @@ class DoctorateAdmissionSupervisionFormView(LoadDossierViewMixin, WebServiceForm
         @return:
         """
         tabs_labels = {
-            tab.name: tab.label
-            for child_tabs in TAB_TREES['doctorate'].values()
-            for tab in child_tabs
+            tab_name: tab.label
+            for tab_name, tab in SUBTABS_BY_NAME['doctorate'].items()
             if can_read_tab(self.admission, tab)
         }
 
@@ -24,6 +24,8 @@
 #
 # ##############################################################################
 import datetime
+from operator import attrgetter
+from typing import Any, List, NamedTuple, Optional
 
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _, pgettext_lazy
@@ -34,6 +36,8 @@ from admission.constants import (
     LANGUAGE_CODE_EN,
     LANGUAGE_CODE_FR,
     PROPOSITION_JUST_SUBMITTED,
+    READ_ACTIONS_BY_TAB,
+    UPDATE_ACTIONS_BY_TAB,
 )
 from admission.contrib.enums import (
     CANCELLED_STATUSES,
@@ -41,6 +45,7 @@ from admission.contrib.enums import (
     IN_PROGRESS_STATUSES,
     TrainingType,
 )
+from admission.contrib.views.mixins import OutboundCallBudgetMixin
 from admission.services.person import AdmissionPersonService
 from admission.services.proposition import AdmissionPropositionService
 from admission.templatetags.admission import TAB_TREES, can_make_action
@@ -53,18 +58,129 @@ __all__ = [
 __namespace__ = False
 
 
-class AdmissionListView(TemplateView):
+def _get_tab_actions(actions_by_tab, tab_name):
+    actions = actions_by_tab[tab_name]
+    return actions if isinstance(actions, tuple) else (actions,)
+
+
+# Actions whose links are checked to display a proposition in the dashboard
+DASHBOARD_ACTIONS = {
+    'retrieve_person',
+    'retrieve_project',
+    'destroy_proposition',
+    'pay_after_submission',
+    'pay_after_request',
+    *_get_tab_actions(READ_ACTIONS_BY_TAB, 'training-choice'),
+    *_get_tab_actions(UPDATE_ACTIONS_BY_TAB, 'documents'),
+    *_get_tab_actions(UPDATE_ACTIONS_BY_TAB, 'person'),
+    *_get_tab_actions(UPDATE_ACTIONS_BY_TAB, 'training-choice'),
+}
+MIN_DATE = datetime.datetime(datetime.MINYEAR, 1, 1)
+
+
+class TrainingSummary:
+    """Fields of the training of a proposition displayed in the dashboard."""
+
+    __slots__ = ('sigle', 'intitule', 'campus', 'type', 'annee')
+
+    def __init__(self, training):
+        self.sigle = training.sigle
+        self.intitule = getattr(training, 'intitule', '')
+        self.campus = getattr(training, 'campus', '')
+        self.type = training.type
+        self.annee = training.annee
+
+
+class PropositionSummary:
+    """Fields of a proposition displayed in the dashboard, which only keeps the links of the DASHBOARD_ACTIONS."""
+
+    __slots__ = (
+        'uuid',
+        'admission_context',
+        'reference',
+        'statut',
+        'doctorat',
+        'formation',
+        'training_acronym',
+        'training_year',
+        'creee_le',
+        'soumise_le',
+        'pdf_recapitulatif',
+        'links',
+        'sort_key',
+    )
+
+    def __init__(self, proposition, admission_context, training_field_name):
+        training = TrainingSummary(getattr(proposition, training_field_name))
+        self.uuid = proposition.uuid
+        self.admission_context = admission_context
+        self.reference = getattr(proposition, 'reference', '')
+        self.statut = proposition.statut
+        self.doctorat = training if training_field_name == 'doctorat' else None
+        self.formation = training if training_field_name == 'formation' else None
+        self.training_acronym = training.sigle
+        self.training_year = proposition.annee_calculee or training.annee
+        self.creee_le = proposition.creee_le
+        self.soumise_le = getattr(proposition, 'soumise_le', None)
+        self.pdf_recapitulatif = getattr(proposition, 'pdf_recapitulatif', None)
+        self.links = {action: link for action, link in proposition.links.items() if action in DASHBOARD_ACTIONS}
+        # The drafts are sorted by creation date, the other propositions by submission and creation dates
+        if self.statut in IN_PROGRESS_STATUSES:
+            self.sort_key = self.creee_le
+        else:
+            self.sort_key = (self.soumise_le or MIN_DATE, self.creee_le)
+
+
+class DashboardData(NamedTuple):
+    """Data of the web services displayed in the dashboard. The re-enrolment data are only loaded during the period."""
+
+    propositions: Any
+    candidate: Any
+    re_enrolment_period: Any
+    ucl_enrolments: Optional[List] = None
+    re_enrolment_eligibility: Any = None
+
+
+def is_re_enrolment_period_open(re_enrolment_period):
+    return re_enrolment_period.date_debut <= datetime.date.today() <= re_enrolment_period.date_fin
+
+
+def load_dashboard_data(person) -> DashboardData:
+    """Load the data of the dashboard of a candidate (see AsyncAdmissionListView for the asynchronous version)."""
+    propositions = AdmissionPropositionService().get_propositions(person)
+    candidate = AdmissionPersonService.retrieve_person(person)
+    re_enrolment_period = AdmissionPropositionService.retrieve_re_enrolment_period(person)
+    if not is_re_enrolment_period_open(re_enrolment_period):
+        return DashboardData(propositions, candidate, re_enrolment_period)
+    return DashboardData(
+        propositions,
+        candidate,
+        re_enrolment_period,
+        ucl_enrolments=AdmissionPropositionService.retrieve_ucl_enrolments_list(person),
+        re_enrolment_eligibility=AdmissionPropositionService.retrieve_candidate_re_enrolment_eligibility(
+            person=person,
+        ),
+    )
+
+
+class AdmissionListView(OutboundCallBudgetMixin, TemplateView):
     urlpatterns = {'list': ''}
     template_name = "admission/admission_list.html"
+    # The dashboard data, and the supervision of each doctorate proposition waiting for the signatures of its panel
+    outbound_call_budget = 8
     extra_context = {
         'LANGUAGE_CODE_FR': LANGUAGE_CODE_FR,
         'LANGUAGE_CODE_EN': LANGUAGE_CODE_EN,
         'TAB_TREES': TAB_TREES,
     }
 
+    def get_dashboard_data(self) -> DashboardData:
+        return load_dashboard_data(self.request.user.person)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        result = AdmissionPropositionService().get_propositions(self.request.user.person)
+        dashboard_data = self.get_dashboard_data()
+        result = dashboard_data.propositions
         context["global_links"] = result.links
         context["can_create_proposition"] = can_make_action(result, 'create_training_choice')
         context["creation_error_message"] = result.links['create_training_choice'].get('error', '')
@@ -74,9 +190,9 @@ class AdmissionListView(TemplateView):
             DOCUMENTS_REQUEST_JUST_COMPLETED_WITHOUT_DOCUMENT,
             None,
         )
-        context['candidate'] = AdmissionPersonService.retrieve_person(self.request.user.person)
+        context['candidate'] = dashboard_data.candidate
 
-        # Group and sort the propositions for display
+        # Group the summaries of the propositions for display, in one pass
         submitted_propositions = {}
         draft_propositions = []
         draft_or_in_payment_propositions = {}
@@ -88,41 +204,37 @@ class AdmissionListView(TemplateView):
             ('continuing-education', result.continuing_education_propositions, 'formation'),
         ]:
             for proposition in propositions:
-                training = getattr(proposition, training_field_name)
-                training_acronym = training.sigle
-                training_year = proposition.annee_calculee or training.annee
-                proposition.admission_context = admission_context
-                if proposition.statut in IN_PROGRESS_OR_IN_PAYMENT_STATUSES:
+                summary = PropositionSummary(proposition, admission_context, training_field_name)
+                if summary.statut in IN_PROGRESS_OR_IN_PAYMENT_STATUSES:
                     # Group by training acronym
-                    draft_or_in_payment_propositions[training_acronym] = proposition
-                elif proposition.statut not in CANCELLED_STATUSES:
-                    enrolled_or_with_submitted_proposition_trainings.add((training_acronym, training_year))
-                if proposition.statut in IN_PROGRESS_STATUSES:
+                    draft_or_in_payment_propositions[summary.training_acronym] = summary
+                elif summary.statut not in CANCELLED_STATUSES:
+                    enrolled_or_with_submitted_proposition_trainings.add(
+                        (summary.training_acronym, summary.training_year)
+                    )
+                if summary.statut in IN_PROGRESS_STATUSES:
                     # Group by status
-                    draft_propositions.append(proposition)
+                    draft_propositions.append(summary)
                 else:
                     # Group by year
-                    submitted_propositions.setdefault(training_year, []).append(proposition)
+                    submitted_propositions.setdefault(summary.training_year, []).append(summary)
 
-        context['draft_propositions'] = sorted(draft_propositions, key=lambda elt: elt.creee_le, reverse=True)
+        context['draft_propositions'] = sorted(draft_propositions, key=attrgetter('sort_key'), reverse=True)
         context['draft_or_in_payment_propositions'] = draft_or_in_payment_propositions
 
         # Re-enrolment specificities
-        re_enrolment_period = AdmissionPropositionService.retrieve_re_enrolment_period(self.request.user.person)
+        re_enrolment_period = dashboard_data.re_enrolment_period
 
         context['ucl_enrolments_list'] = []
         context['re_enrolment_period'] = re_enrolment_period
         context['can_create_re_enrolment_proposition'] = False
         context['re_enrolment_error_message'] = ''
 
-        if re_enrolment_period.date_debut <= datetime.date.today() <= re_enrolment_period.date_fin:
+        if is_re_enrolment_period_open(re_enrolment_period):
             submitted_propositions.setdefault(re_enrolment_period.annee_formation, [])
 
-            all_ucl_enrolments_list = AdmissionPropositionService.retrieve_ucl_enrolments_list(self.request.user.person)
-
-            re_enrolment_eligibility = AdmissionPropositionService.retrieve_candidate_re_enrolment_eligibility(
-                person=self.request.user.person,
-            )
+            all_ucl_enrolments_list = dashboard_data.ucl_enrolments
+            re_enrolment_eligibility = dashboard_data.re_enrolment_eligibility
 
             for enrolment in all_ucl_enrolments_list:
                 enrolled_or_with_submitted_proposition_trainings.add((enrolment.sigle_formation, enrolment.annee))
@@ -163,13 +275,8 @@ class AdmissionListView(TemplateView):
                 ]
 
         # Sort submitted propositions by dates
-        min_date = datetime.datetime(datetime.MINYEAR, 1, 1)
         context['submitted_propositions'] = {
-            year: sorted(
-                submitted_propositions[year],
-                key=lambda elt: (elt.soumise_le or min_date, elt.creee_le),
-                reverse=True,
-            )
+            year: sorted(submitted_propositions[year], key=attrgetter('sort_key'), reverse=True)
             for year in sorted(submitted_propositions.keys(), reverse=True)
         }
 
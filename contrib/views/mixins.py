@@ -23,21 +23,33 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+import hashlib
+import json
+import logging
+import uuid
 from datetime import date
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.shortcuts import resolve_url
 from django.template.loader import select_template
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.utils.functional import cached_property
+from django.utils.http import quote_etag
 from django.utils.safestring import mark_safe
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import get_language, gettext_lazy as _
 from django.views.generic.base import ContextMixin
 
 from admission.contrib.enums import CANCELLED_STATUSES, IN_PROGRESS_STATUSES
+from admission.services.cache import get_person_data_version, get_proposition_version
+from admission.services.outbound_calls import OutboundCallBudgetExceeded, OutboundCallRecorder
 from admission.services.proposition import AdmissionPropositionService
 from admission.templatetags.admission import can_make_action
 
+logger = logging.getLogger(__name__)
+
 LATE_MESSAGE_POOLS = [
     'ADMISSION_POOL_HUE_UCL_PATHWAY_CHANGE',
     'ADMISSION_POOL_UE5_BELGIAN',
@@ -210,3 +222,107 @@ class LoadDossierViewMixin(LoadViewMixin, UserPassesTestMixin):
         context['ucl_enrolment_information'] = self.ucl_enrolment_information
 
         return context
+
+
+# Identifies the deployed code and templates: the ADMISSION_RELEASE setting, or else the start of the process
+PROCESS_RELEASE_TOKEN = uuid.uuid4().hex
+
+
+def get_release_token():
+    return getattr(settings, 'ADMISSION_RELEASE', '') or PROCESS_RELEASE_TOKEN
+
+
+class DossierETagMixin:
+    """
+    Mixin for the detail tabs of a dossier answering the conditional requests with a 304 response, without
+    building the context nor rendering the template, when the dossier has not been modified since the last visit.
+
+    It must only be used by the tabs whose content depends on the data of the proposition alone, and not on the data
+    of the candidate, which can be modified elsewhere (e.g. in the backoffice).
+    """
+
+    def get_etag(self):
+        person = self.request.user.person
+        return hashlib.md5(
+            json.dumps(
+                [
+                    self.request.path,
+                    get_language(),
+                    person.global_id,
+                    self.request.COOKIES.get(settings.CSRF_COOKIE_NAME),
+                    get_proposition_version(person, self.admission_uuid),
+                    get_person_data_version(self.admission.matricule_candidat),
+                    self.admission.to_dict(),
+                    # Some messages depend on the date (e.g. the late enrolment message)
+                    date.today(),
+                    get_release_token(),
+                    getattr(settings, 'ADMISSION_DETAIL_TABS_ETAG_SALT', ''),
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+
+    def get(self, request, *args, **kwargs):
+        if (
+            not getattr(settings, 'ADMISSION_DETAIL_TABS_ETAG_ENABLED', False)
+            or not self.admission_uuid
+            # The pending messages are displayed in the page, which must therefore be rendered
+            or len(messages.get_messages(request))
+        ):
+            return super().get(request, *args, **kwargs)
+
+        etag = quote_etag(self.get_etag())
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response['ETag'] = etag
+        # The browsers must always revalidate the page as it depends on the data of the web services
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class OutboundCallBudgetMixin:
+    """
+    Mixin checking that a view does not make more calls to the web services than its `outbound_call_budget` while
+    handling a request (including the rendering of its template, which is done in the view). Exceeding the budget
+    logs a warning with the calls, or raises an exception if the ADMISSION_OUTBOUND_CALL_BUDGET_STRICT setting is set.
+    The asynchronous views are supported.
+    """
+
+    outbound_call_budget = None
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.outbound_call_budget is None:
+            return super().dispatch(request, *args, **kwargs)
+        if self.view_is_async:
+            return self.async_dispatch(request, *args, **kwargs)
+
+        with OutboundCallRecorder() as recorder:
+            response = super().dispatch(request, *args, **kwargs)
+            if callable(getattr(response, 'render', None)):
+                response.render()
+
+        self.check_outbound_call_budget(recorder)
+        return response
+
+    async def async_dispatch(self, request, *args, **kwargs):
+        with OutboundCallRecorder() as recorder:
+            response = await super().dispatch(request, *args, **kwargs)
+            if callable(getattr(response, 'render', None)):
+                await sync_to_async(response.render)()
+
+        self.check_outbound_call_budget(recorder)
+        return response
+
+    def check_outbound_call_budget(self, recorder):
+        if len(recorder) > self.outbound_call_budget:
+            message = '%s made %s calls to the web services (budget: %s):\n%s' % (
+                type(self).__name__,
+                len(recorder),
+                self.outbound_call_budget,
+                recorder.format_calls(),
+            )
+            if getattr(settings, 'ADMISSION_OUTBOUND_CALL_BUDGET_STRICT', False):
+                raise OutboundCallBudgetExceeded(message)
+            logger.warning(message)
@@ -0,0 +1,69 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from admission.url_manifest import DEFAULT_URL_MANIFEST, dump_url_manifest
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the manifest of the urls of the admission, loaded instead of discovering the views (see the "
+        "ADMISSION_URL_MANIFEST setting)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=getattr(settings, 'ADMISSION_URL_MANIFEST', DEFAULT_URL_MANIFEST),
+            help="Path of the manifest (the ADMISSION_URL_MANIFEST setting, or url_manifest.json, by default).",
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help="Exit with a non-zero status if the manifest is missing or out of date, without writing it.",
+        )
+
+    def handle(self, *args, **options):
+        from admission.urls import discover_urlpatterns
+
+        if not options['output']:
+            raise CommandError("No output path: set the ADMISSION_URL_MANIFEST setting or the --output option")
+
+        manifest_path = Path(options['output'])
+        manifest = dump_url_manifest(discover_urlpatterns())
+
+        if options['check']:
+            if not manifest_path.exists() or manifest_path.read_text() != manifest:
+                raise CommandError(
+                    f"The url manifest {manifest_path} is out of date, run ./manage.py generate_url_manifest"
+                )
+            self.stdout.write(f"The url manifest {manifest_path} is up to date")
+        else:
+            manifest_path.write_text(manifest)
+            self.stdout.write(self.style.SUCCESS(f"The url manifest has been written to {manifest_path}"))
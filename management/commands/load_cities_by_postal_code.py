@@ -0,0 +1,43 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.core.management import BaseCommand, CommandError
+
+from admission.services.reference import CitiesService
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the index of the cities by postal code, used by the city autocomplete, in the cache. It is meant to be "
+        "run when the application is deployed and before the index expires (see ADMISSION_CITIES_CACHE_TIMEOUT)."
+    )
+
+    def handle(self, *args, **options):
+        cities_by_postal_code = CitiesService.load_cities_by_postal_code()
+        if cities_by_postal_code is None:
+            raise CommandError("The index of the cities is already being loaded")
+        self.stdout.write(
+            self.style.SUCCESS(f"The cities of {len(cities_by_postal_code)} postal codes have been loaded")
+        )
@@ -0,0 +1,48 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.conf import settings
+
+from admission.services.cache import apply_conditional_request
+from admission.services.outbound_calls import record_api_client_calls
+from admission.services.traffic_capture import capture_traffic
+
+
+def get_sdk_name(api_client):
+    """Return the name of the SDK of an api client (e.g. 'osis_admission_sdk')."""
+    return type(api_client).__module__.split('.')[0]
+
+
+def prepare_api_client(api_client):
+    """Prepare an api client of the SDKs before it is used by a service."""
+    stub_backend_url = getattr(settings, 'ADMISSION_STUB_BACKEND_URL', '')
+    if stub_backend_url:
+        # Send the requests of every SDK to the local stub backend (see admission.tests.stub_backend)
+        api_client.configuration.host = f'{stub_backend_url.rstrip("/")}/{get_sdk_name(api_client)}'
+    apply_conditional_request(api_client)
+    record_api_client_calls(api_client, get_sdk_name(api_client))
+    if getattr(settings, 'ADMISSION_TRAFFIC_CAPTURE_FILE', ''):
+        capture_traffic(api_client, get_sdk_name(api_client))
+    return api_client
@@ -0,0 +1,197 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+"""
+Asynchronous transport of the SDKs, used by the asynchronous views (see admission.contrib.async_views). The requests
+are built by the SDKs, as for the synchronous calls, and sent with httpx (if it is installed) on connection pools shared
+by all the calls made on the same event loop. A call is cancelled, and its connection released, when the task awaiting
+it is cancelled (e.g. when the client of the view disconnects).
+"""
+import asyncio
+import importlib
+import importlib.util
+import json
+import weakref
+from typing import NamedTuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from admission.services.api_clients import get_sdk_name
+from admission.services.trusted_responses import call_trusted_endpoint, convert_response_data, loads
+
+# httpx is only imported when the first asynchronous call is made, as it is slow to import
+HTTPX_INSTALLED = importlib.util.find_spec('httpx') is not None
+
+__all__ = [
+    'HTTPX_INSTALLED',
+    'SDKRequest',
+    'acall_endpoint',
+    'acall_trusted_endpoint',
+    'build_request',
+    'get_async_client',
+]
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_TIMEOUT = 30
+
+# One client, and thus one connection pool, by event loop, closed when the loop shuts down
+_clients = weakref.WeakKeyDictionary()
+
+
+class SDKRequest(NamedTuple):
+    method: str
+    url: str
+    query_params: list
+    headers: dict
+    body: object
+    post_params: list
+
+
+class _RequestBuilt(Exception):
+    def __init__(self, request: SDKRequest):
+        super().__init__(request.url)
+        self.request = request
+
+
+class SDKResponse:
+    """Response of httpx with the interface of the responses of the SDKs, used to deserialize it or raise an error."""
+
+    def __init__(self, response):
+        self.response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+
+    @property
+    def data(self):
+        return self.response.text
+
+    def getheaders(self):
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        return self.response.headers.get(name, default)
+
+
+def build_request(endpoint, **kwargs) -> SDKRequest:
+    """Return the request that `endpoint(**kwargs)` would send, without sending it."""
+
+    def capture_request(method, url, query_params=None, headers=None, body=None, post_params=None, **_):
+        raise _RequestBuilt(SDKRequest(method, url, query_params or [], headers or {}, body, post_params or []))
+
+    # The api clients are not shared, and the traffic capture (which also replaces this method) is not used by the
+    # asynchronous calls
+    endpoint.api_client.rest_client.request = capture_request
+    try:
+        endpoint(_preload_content=False, **kwargs)
+    except _RequestBuilt as request_built:
+        return request_built.request
+    raise RuntimeError(f'The request of {endpoint.settings["operation_id"]} could not be built')
+
+
+async def _keep_client_open(loop, client):
+    """Keep the client of the event loop open until the loop shuts down its asynchronous generators."""
+    try:
+        yield client
+    finally:
+        _clients.pop(loop, None)
+        await client.aclose()
+
+
+async def get_async_client():
+    """Return the httpx client of the running event loop, whose connections are shared by all the calls."""
+    loop = asyncio.get_running_loop()
+    client, _ = _clients.get(loop, (None, None))
+    if client is None:
+        import httpx
+
+        max_connections = getattr(settings, 'ADMISSION_ASYNC_MAX_CONNECTIONS', DEFAULT_MAX_CONNECTIONS)
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=getattr(settings, 'ADMISSION_ASYNC_TIMEOUT', DEFAULT_TIMEOUT),
+        )
+        # Once started on the running loop, the generator is closed, and the client with it, when the loop shuts down
+        # its asynchronous generators (as asyncio.run, asgiref's async_to_sync and the ASGI servers do)
+        keep_open = _keep_client_open(loop, client)
+        _clients[loop] = (client, keep_open)
+        await keep_open.__anext__()
+    return client
+
+
+def _raise_for_status(api_client, response: SDKResponse):
+    """Raise the exception that the SDK raises for the status of the response (see the rest module of the SDKs)."""
+    if 200 <= response.status <= 299:
+        return
+    exceptions = importlib.import_module(f'{get_sdk_name(api_client)}.exceptions')
+    exception_cls = {
+        401: exceptions.UnauthorizedException,
+        403: exceptions.ForbiddenException,
+        404: exceptions.NotFoundException,
+    }.get(response.status)
+    if exception_cls is None:
+        exception_cls = exceptions.ServiceException if 500 <= response.status <= 599 else exceptions.ApiException
+    raise exception_cls(http_resp=response)
+
+
+async def _send(endpoint, **kwargs):
+    request = build_request(endpoint, **kwargs)
+    content = request.body
+    if content is not None and not isinstance(content, (str, bytes)):
+        content = json.dumps(content)
+    client = await get_async_client()
+    response = await client.request(
+        request.method,
+        request.url,
+        params=request.query_params or None,
+        headers=request.headers,
+        content=content,
+        data=dict(request.post_params) if request.post_params else None,
+    )
+    _raise_for_status(endpoint.api_client, SDKResponse(response))
+    return response
+
+
+async def acall_endpoint(endpoint, **kwargs):
+    """
+    Asynchronous version of `endpoint(**kwargs)`, for an endpoint of the SDKs (e.g. `APIClient().list_propositions`).
+    Without httpx, the endpoint is called in a thread.
+    """
+    if not HTTPX_INSTALLED:
+        return await sync_to_async(endpoint, thread_sensitive=False)(**kwargs)
+    response = await _send(endpoint, **kwargs)
+    response_type = endpoint.settings['response_type']
+    if not response_type:
+        return None
+    return endpoint.api_client.deserialize(SDKResponse(response), response_type, True)
+
+
+async def acall_trusted_endpoint(endpoint, **kwargs):
+    """Asynchronous version of `call_trusted_endpoint(endpoint, **kwargs)` (see `acall_endpoint`)."""
+    if not getattr(settings, 'ADMISSION_TRUSTED_RESPONSES', False):
+        return await acall_endpoint(endpoint, **kwargs)
+    if not HTTPX_INSTALLED:
+        return await sync_to_async(call_trusted_endpoint, thread_sensitive=False)(endpoint, **kwargs)
+    response = await _send(endpoint, **kwargs)
+    return convert_response_data(loads(response.content), endpoint.settings['response_type'])
@@ -28,7 +28,11 @@ from osis_admission_sdk import ApiClient, ApiException
 from osis_admission_sdk.api import autocomplete_api
 from osis_learning_unit_sdk.api import learning_units_api
 
+from admission.services.api_clients import prepare_api_client
+from admission.services.async_transport import acall_endpoint
+from admission.services.cache import stale_while_revalidate
 from admission.services.mixins import ServiceMeta
+from admission.services.single_flight import single_flight
 from frontoffice.settings.osis_sdk import admission as admission_sdk
 from frontoffice.settings.osis_sdk import learning_unit as learning_unit_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
@@ -37,17 +41,21 @@ from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 class AdmissionAutocompleteAPIClient:
     def __new__(cls):
         api_config = admission_sdk.build_configuration()
-        return autocomplete_api.AutocompleteApi(ApiClient(configuration=api_config))
+        return autocomplete_api.AutocompleteApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class AdmissionAutocompleteService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
+    # The sectors are the same for all the candidates so they are shared between them
     @classmethod
+    @stale_while_revalidate('SECTORS')
+    @single_flight(per_person=False)
     def get_sectors(cls, person=None):
         return AdmissionAutocompleteAPIClient().list_sector_dtos(**build_mandatory_auth_headers(person))
 
     @classmethod
+    @single_flight(per_person=False)
     def get_doctorates(cls, person=None, sigle="", campus="", acronym_or_name=''):
         return AdmissionAutocompleteAPIClient().list_doctorat_dtos(
             sigle=sigle,
@@ -57,6 +65,7 @@ class AdmissionAutocompleteService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @single_flight(per_person=False)
     def get_general_education_trainings(cls, person, training_type, acronym_or_name, campus=''):
         return AdmissionAutocompleteAPIClient().list_formation_generale_dtos(
             type=training_type,
@@ -66,6 +75,7 @@ class AdmissionAutocompleteService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @single_flight(per_person=False)
     def get_continuing_education_trainings(cls, person, acronym_or_name, campus=''):
         return AdmissionAutocompleteAPIClient().list_formation_continue_dtos(
             acronym_or_name=acronym_or_name,
@@ -73,7 +83,38 @@ class AdmissionAutocompleteService(metaclass=ServiceMeta):
             **build_mandatory_auth_headers(person),
         )
 
+    # Asynchronous versions, used by the asynchronous views
     @classmethod
+    async def aget_doctorates(cls, person=None, sigle="", campus="", acronym_or_name=''):
+        return await acall_endpoint(
+            AdmissionAutocompleteAPIClient().list_doctorat_dtos,
+            sigle=sigle,
+            campus=campus,
+            acronym_or_name=acronym_or_name,
+            **build_mandatory_auth_headers(person),
+        )
+
+    @classmethod
+    async def aget_general_education_trainings(cls, person, training_type, acronym_or_name, campus=''):
+        return await acall_endpoint(
+            AdmissionAutocompleteAPIClient().list_formation_generale_dtos,
+            type=training_type,
+            acronym_or_name=acronym_or_name,
+            campus=campus,
+            **build_mandatory_auth_headers(person),
+        )
+
+    @classmethod
+    async def aget_continuing_education_trainings(cls, person, acronym_or_name, campus=''):
+        return await acall_endpoint(
+            AdmissionAutocompleteAPIClient().list_formation_continue_dtos,
+            acronym_or_name=acronym_or_name,
+            campus=campus,
+            **build_mandatory_auth_headers(person),
+        )
+
+    @classmethod
+    @single_flight(per_person=False)
     def autocomplete_tutors(cls, person, **kwargs):
         return AdmissionAutocompleteAPIClient().list_tutors(
             **kwargs,
@@ -81,6 +122,7 @@ class AdmissionAutocompleteService(metaclass=ServiceMeta):
         )['results']
 
     @classmethod
+    @single_flight(per_person=False)
     def autocomplete_persons(cls, person, **kwargs):
         return AdmissionAutocompleteAPIClient().list_people(
             **kwargs,
@@ -88,10 +130,11 @@ class AdmissionAutocompleteService(metaclass=ServiceMeta):
         )['results']
 
     @classmethod
+    @single_flight(per_person=False)
     def autocomplete_learning_unit_years(cls, year, acronym_search, person):
         configuration = learning_unit_sdk.build_configuration()
         with osis_learning_unit_sdk.ApiClient(configuration) as api_client:
-            api_instance = learning_units_api.LearningUnitsApi(api_client)
+            api_instance = learning_units_api.LearningUnitsApi(prepare_api_client(api_client))
         return api_instance.learningunits_list(
             year=int(year),
             acronym_like=acronym_search,
@@ -99,6 +142,7 @@ class AdmissionAutocompleteService(metaclass=ServiceMeta):
         )['results']
 
     @classmethod
+    @single_flight(per_person=False)
     def list_diplomatic_posts(cls, person, **kwargs):
         return AdmissionAutocompleteAPIClient().list_diplomatic_posts(
             **kwargs,
@@ -0,0 +1,168 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import contextvars
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from django.conf import settings
+from django.db import connections
+from django.utils import translation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_PENDING_TASKS = 16
+DEFAULT_MAX_CONCURRENT_WORKERS = 8
+
+_executor = None
+_pending_tasks = None
+_concurrent_executor = None
+_free_concurrent_workers = None
+_lock = threading.Lock()
+
+
+def _get_executor():
+    """Return the process-wide executor, lazily created with the configured limits."""
+    global _executor, _pending_tasks
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _pending_tasks = threading.BoundedSemaphore(
+                    getattr(settings, 'ADMISSION_BACKGROUND_MAX_PENDING_TASKS', DEFAULT_MAX_PENDING_TASKS)
+                )
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'ADMISSION_BACKGROUND_MAX_WORKERS', DEFAULT_MAX_WORKERS),
+                    thread_name_prefix='admission-background',
+                )
+    return _executor
+
+
+def run_in_background(func: Callable, *args, **kwargs) -> Optional[Future]:
+    """
+    Run the function in a background thread, with the language of the current request activated.
+
+    The number of pending tasks is bounded: when the limit is reached, the task is dropped and None is returned, so
+    that background work can never amplify the load on the web services during peaks.
+    """
+    executor = _get_executor()
+    if not _pending_tasks.acquire(blocking=False):
+        logger.debug("Background task %s dropped, too many pending tasks", getattr(func, '__qualname__', func))
+        return None
+
+    language = translation.get_language()
+
+    def task():
+        try:
+            with translation.override(language):
+                return func(*args, **kwargs)
+        except Exception:
+            logger.exception("Background task %s failed", getattr(func, '__qualname__', func))
+            raise
+        finally:
+            _pending_tasks.release()
+            connections.close_all()
+
+    try:
+        return executor.submit(task)
+    except RuntimeError:
+        # The executor is shutting down
+        _pending_tasks.release()
+        return None
+
+
+def _get_concurrent_executor():
+    """Return the process-wide executor of run_concurrently, separate from the one of the background tasks."""
+    global _concurrent_executor, _free_concurrent_workers
+    if _concurrent_executor is None:
+        with _lock:
+            if _concurrent_executor is None:
+                max_workers = getattr(settings, 'ADMISSION_CONCURRENT_MAX_WORKERS', DEFAULT_MAX_CONCURRENT_WORKERS)
+                _free_concurrent_workers = threading.BoundedSemaphore(max_workers)
+                _concurrent_executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix='admission-concurrent',
+                )
+    return _concurrent_executor
+
+
+def _run_in_free_worker(func: Callable) -> Optional[Future]:
+    """Run the function in a free worker of run_concurrently with a copy of the current context, or return None."""
+    executor = _get_concurrent_executor()
+    if not _free_concurrent_workers.acquire(blocking=False):
+        return None
+
+    context = contextvars.copy_context()
+    language = translation.get_language()
+
+    def task():
+        try:
+            with translation.override(language):
+                return context.run(func)
+        finally:
+            _free_concurrent_workers.release()
+            connections.close_all()
+
+    try:
+        return executor.submit(task)
+    except RuntimeError:
+        # The executor is shutting down
+        _free_concurrent_workers.release()
+        return None
+
+
+def run_concurrently(*funcs: Callable) -> List:
+    """
+    Call the functions concurrently and return their results, in the same order.
+
+    The last function is called in the current thread while the other ones run in the workers dedicated to
+    run_concurrently, with a copy of the current context, so that they never wait behind the background tasks. A
+    function is called in the current thread too when no worker is free. The first exception raised by a function is
+    propagated to the caller once all the functions are done.
+    """
+    futures = [_run_in_free_worker(func) for func in funcs[:-1]]
+    results = []
+    error = None
+
+    for func, future in zip(funcs, [*futures, None]):
+        try:
+            results.append(func() if future is None else None)
+        except Exception as exception:
+            error = error or exception
+            results.append(None)
+
+    for index, future in enumerate(futures):
+        if future is not None:
+            try:
+                results[index] = future.result()
+            except Exception as exception:
+                error = error or exception
+
+    if error is not None:
+        raise error
+
+    return results
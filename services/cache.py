@@ -0,0 +1,420 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import copy
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar
+from http import HTTPStatus
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.utils.translation import get_language
+
+from admission.services.background import run_in_background
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCAL_CACHE_MAX_SIZE = 1000
+VERSION_TIMEOUT = 60 * 60 * 24
+
+
+def get_cache():
+    """Return the cache used to share web service data between the requests and the processes."""
+    return caches[getattr(settings, 'ADMISSION_CACHE_ALIAS', DEFAULT_CACHE_ALIAS)]
+
+
+def make_cache_key(prefix: str, *parts) -> str:
+    """Return a cache key built from the prefix and a digest of the other (json serializable) parts."""
+    digest = hashlib.md5(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+    return f'admission:{prefix}:{digest}'
+
+
+def get_person_identifier(person):
+    """Return a value identifying the person in the cache keys."""
+    if person is None:
+        return None
+    return getattr(person, 'global_id', None) or f'pk-{person.pk}'
+
+
+def make_call_cache_key(prefix: str, func, signature: inspect.Signature, args, kwargs, per_person=False) -> str:
+    """
+    Return a cache key identifying a call of a service method, from its arguments and the current language. The
+    identity of the person is only considered if `per_person` is set.
+    """
+    arguments = signature.bind(*args, **kwargs).arguments
+    arguments.pop('cls', None)
+    person = arguments.pop('person', None)
+    return make_cache_key(
+        prefix,
+        func.__qualname__,
+        get_language(),
+        get_person_identifier(person) if per_person else None,
+        arguments,
+    )
+
+
+class LocalCache:
+    """
+    Thread-safe cache of the current process, with a least recently used eviction. Unlike the shared cache, it can
+    keep objects that can't be pickled, such as the models of the SDKs.
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size or getattr(settings, 'ADMISSION_LOCAL_CACHE_MAX_SIZE', DEFAULT_LOCAL_CACHE_MAX_SIZE)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_entry(self, key):
+        """Return the (value, storage time) couple of the key, or None if it is not in the cache."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def stale_while_revalidate(setting_prefix: str, per_person=False, is_valid=None):
+    """
+    Decorator of idempotent service methods whose results rarely change. The results are kept in a local cache:
+    - younger than the soft timeout, they are returned directly;
+    - between the soft and the hard timeouts, they are returned directly and refreshed in the background;
+    - older than the hard timeout, or no longer valid according to the `is_valid` function, they are loaded again
+      before being returned.
+
+    The timeouts (in seconds) are defined by the ADMISSION_<setting_prefix>_SOFT_TIMEOUT (0, i.e. no cache, by
+    default) and ADMISSION_<setting_prefix>_HARD_TIMEOUT (one day by default) settings.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        local_cache = LocalCache()
+        refreshing_keys = set()
+        refreshing_keys_lock = threading.Lock()
+
+        def refresh(key, args, kwargs):
+            try:
+                local_cache.set(key, func(*args, **kwargs))
+            finally:
+                with refreshing_keys_lock:
+                    refreshing_keys.discard(key)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            soft_timeout = getattr(settings, f'ADMISSION_{setting_prefix}_SOFT_TIMEOUT', 0)
+            if not soft_timeout:
+                return func(*args, **kwargs)
+            hard_timeout = getattr(settings, f'ADMISSION_{setting_prefix}_HARD_TIMEOUT', 60 * 60 * 24)
+
+            key = make_call_cache_key('swr', func, signature, args, kwargs, per_person)
+            entry = local_cache.get_entry(key)
+            age = time.monotonic() - entry[1] if entry is not None else None
+
+            if age is None or age >= hard_timeout or is_valid is not None and not is_valid(entry[0]):
+                value = func(*args, **kwargs)
+                local_cache.set(key, value)
+                return value
+
+            if age >= soft_timeout:
+                with refreshing_keys_lock:
+                    should_refresh = key not in refreshing_keys
+                    refreshing_keys.add(key)
+                if should_refresh and run_in_background(refresh, key, args, kwargs) is None:
+                    with refreshing_keys_lock:
+                        refreshing_keys.discard(key)
+
+            return entry[0]
+
+        wrapper.local_cache = local_cache
+        return wrapper
+
+    return decorator
+
+
+def _get_version(key):
+    """Return the current version token stored under the key, initializing it if necessary."""
+    cache = get_cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, VERSION_TIMEOUT)
+        version = cache.get(key)
+    return version
+
+
+def _get_person_version_key(person):
+    return f'admission:version:person:{get_person_identifier(person)}'
+
+
+def _get_proposition_version_key(proposition_uuid):
+    return f'admission:version:proposition:{proposition_uuid}'
+
+
+def get_proposition_version(person, proposition_uuid):
+    """
+    Return the version of the data of a proposition seen by a person. It changes each time the proposition or the data
+    of the person are updated.
+    """
+    return (
+        _get_version(_get_person_version_key(person)),
+        _get_version(_get_proposition_version_key(proposition_uuid)),
+    )
+
+
+def get_person_data_version(person_identifier):
+    """
+    Return the version of the data of a person (e.g. a candidate), identified as in the cache keys (see
+    `get_person_identifier`). It changes each time the person updates its data.
+    """
+    return _get_version(f'admission:version:person:{person_identifier}')
+
+
+def invalidate_proposition_cache(person=None, proposition_uuid=None):
+    """Invalidate the cached data related to the proposition and to the person, in every process."""
+    cache = get_cache()
+    if person is not None:
+        cache.set(_get_person_version_key(person), uuid.uuid4().hex, VERSION_TIMEOUT)
+    if proposition_uuid:
+        cache.set(_get_proposition_version_key(proposition_uuid), uuid.uuid4().hex, VERSION_TIMEOUT)
+
+
+def _is_sdk_model(value):
+    """Return True for the objects of the models of the SDKs, which cannot be unpickled."""
+    return any(base.__name__ in ('ModelNormal', 'ModelComposed') for base in type(value).__mro__)
+
+
+class SharedModelData(NamedTuple):
+    """JSON data of an object of a model of the SDKs, which can be kept in the shared cache unlike the object."""
+
+    model_module: str
+    model_name: str
+    data: dict
+
+
+def to_shared_value(value):
+    """Return the value in a form that can be kept in the shared cache (see `from_shared_value`)."""
+    if isinstance(value, list):
+        return [to_shared_value(item) for item in value]
+    if _is_sdk_model(value):
+        model = type(value)
+        api_client = importlib.import_module(f'{model.__module__.split(".")[0]}.api_client')
+        return SharedModelData(
+            model_module=model.__module__,
+            model_name=model.__name__,
+            data=api_client.ApiClient.sanitize_for_serialization(value),
+        )
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sdk_configuration(sdk_name):
+    return importlib.import_module(f'{sdk_name}.configuration').Configuration()
+
+
+def from_shared_value(value):
+    """Return a value kept in the shared cache, with new objects of the models, as if it was loaded again."""
+    if isinstance(value, list):
+        return [from_shared_value(item) for item in value]
+    if isinstance(value, SharedModelData):
+        sdk_name = value.model_module.split('.')[0]
+        model = getattr(importlib.import_module(value.model_module), value.model_name)
+        # The data are converted as the SDKs do when they deserialize a response
+        return importlib.import_module(f'{sdk_name}.model_utils').validate_and_convert_types(
+            value.data,
+            (model,),
+            ['received_data'],
+            True,
+            True,
+            configuration=_get_sdk_configuration(sdk_name),
+        )
+    return value
+
+
+def proposition_cache(setting_name: str, extra_version=None):
+    """
+    Decorator of the service methods loading data of a proposition (identified by the `uuid` argument) for a person.
+    The results are kept in the shared cache, per person and per proposition, so that all the processes can use them
+    (e.g. the data prefetched by another process, see `prefetch_tab`). They are dropped as soon as the version of the
+    proposition changes, i.e. when a mutating service method is called (see `ServiceMeta`). The results that can't be
+    pickled are only kept in a local cache.
+
+    The cache duration (in seconds) is defined by the `setting_name` setting (0, i.e. no cache, by default).
+    The callers get their own copies of the cached results, so they can modify them.
+    If the result also depends on something else than the proposition (e.g. the current date), `extra_version` is a
+    callable taking the person and returning a value that is part of the version of the result.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        local_cache = LocalCache()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            timeout = getattr(settings, setting_name, 0)
+            if not timeout:
+                return func(*args, **kwargs)
+
+            arguments = signature.bind(*args, **kwargs).arguments
+            person = arguments.get('person')
+            proposition_uuid = arguments.get('uuid')
+            if person is None or not proposition_uuid:
+                return func(*args, **kwargs)
+
+            cache = get_cache()
+            key = make_call_cache_key('proposition', func, signature, args, kwargs, per_person=True)
+            version = get_proposition_version(person, proposition_uuid)
+            if extra_version is not None:
+                version = (version, extra_version(person))
+
+            entry = cache.get(key)
+            if entry is not None and entry[0] == version:
+                try:
+                    return from_shared_value(entry[1])
+                except Exception:
+                    # E.g. the models of the SDKs have been modified since the result was kept
+                    logger.debug("Result of %s kept in the shared cache can not be loaded", func.__qualname__)
+            entry = local_cache.get_entry(key)
+            if entry is not None and time.monotonic() - entry[1] < timeout and entry[0][0] == version:
+                return copy.deepcopy(entry[0][1])
+
+            # The version is read before the call so that an update made in the meantime invalidates the result
+            value = func(*args, **kwargs)
+            try:
+                cache.set(key, (version, to_shared_value(value)), timeout)
+            except Exception:
+                logger.debug("Result of %s can not be shared between processes", func.__qualname__)
+                local_cache.set(key, (version, value))
+                return copy.deepcopy(value)
+            return value
+
+        wrapper.local_cache = local_cache
+        return wrapper
+
+    return decorator
+
+
+class ConditionalRequest:
+    """Validators of a cached response, to be sent with the next request to the same resource."""
+
+    def __init__(self, etag=None, last_modified=None):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.api_client = None
+
+    def prepare(self, api_client):
+        self.api_client = api_client
+        if self.etag:
+            api_client.set_default_header('If-None-Match', self.etag)
+        if self.last_modified:
+            api_client.set_default_header('If-Modified-Since', self.last_modified)
+
+    def get_response_header(self, name):
+        response = getattr(self.api_client, 'last_response', None)
+        return response.getheader(name) if response is not None else None
+
+
+_current_conditional_request: ContextVar = ContextVar('admission_conditional_request', default=None)
+
+
+def apply_conditional_request(api_client):
+    """Add the validators of the current conditional request (if any) to the headers sent by the api client."""
+    conditional_request = _current_conditional_request.get()
+    if conditional_request is not None:
+        conditional_request.prepare(api_client)
+
+
+def conditional_cache(setting_name: str):
+    """
+    Decorator of the service methods loading data for a person. The results are kept in a local cache with their
+    validators (ETag / Last-Modified response headers), which are sent with the next identical requests (see
+    `apply_conditional_request`). If the web service answers that the data has not been modified, the cached result
+    is returned.
+
+    The cache duration (in seconds) is defined by the `setting_name` setting (0, i.e. no cache, by default).
+    The callers get copies of the cached results, so they can modify them.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        local_cache = LocalCache()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            timeout = getattr(settings, setting_name, 0)
+            if not timeout:
+                return func(*args, **kwargs)
+
+            key = make_call_cache_key('conditional', func, signature, args, kwargs, per_person=True)
+            entry = local_cache.get_entry(key)
+            if entry is not None and time.monotonic() - entry[1] >= timeout:
+                local_cache.delete(key)
+                entry = None
+
+            conditional_request = ConditionalRequest(*entry[0][:2]) if entry is not None else ConditionalRequest()
+            token = _current_conditional_request.set(conditional_request)
+            try:
+                value = func(*args, **kwargs)
+            except Exception as exception:
+                if entry is not None and getattr(exception, 'status', None) == HTTPStatus.NOT_MODIFIED:
+                    return copy.deepcopy(entry[0][2])
+                raise
+            finally:
+                _current_conditional_request.reset(token)
+
+            etag = conditional_request.get_response_header('ETag')
+            last_modified = conditional_request.get_response_header('Last-Modified')
+            if etag or last_modified:
+                local_cache.set(key, (etag, last_modified, value))
+                return copy.deepcopy(value)
+            local_cache.delete(key)
+            return value
+
+        wrapper.local_cache = local_cache
+        return wrapper
+
+    return decorator
@@ -23,7 +23,9 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+from admission.services.api_clients import prepare_api_client
 from admission.services.mixins import ServiceMeta
+from admission.services.single_flight import single_flight
 from frontoffice.settings.osis_sdk import admission as admission_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 from osis_admission_sdk import ApiClient, ApiException
@@ -33,13 +35,14 @@ from osis_admission_sdk.api import campus_api
 class AdmissionCampusAPIClient:
     def __new__(cls):
         api_config = admission_sdk.build_configuration()
-        return campus_api.CampusApi(ApiClient(configuration=api_config))
+        return campus_api.CampusApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class AdmissionCampusService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @single_flight(per_person=False)
     def get_campus(cls, person, campus_uuid):
         return AdmissionCampusAPIClient().retrieve_campus(
             uuid=campus_uuid,
@@ -47,6 +50,7 @@ class AdmissionCampusService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @single_flight(per_person=False)
     def list_campus(cls, person):
         return AdmissionCampusAPIClient().list_campus(
             **build_mandatory_auth_headers(person),
@@ -30,7 +30,10 @@ from osis_admission_sdk.model.informations_specifiques_formation_continue_dto im
     InformationsSpecifiquesFormationContinueDTO,
 )
 
+from admission.services.api_clients import prepare_api_client
+from admission.services.cache import stale_while_revalidate
 from admission.services.mixins import ServiceMeta
+from admission.services.single_flight import single_flight
 from frontoffice.settings.osis_sdk import admission as admission_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 
@@ -38,13 +41,15 @@ from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 class ContinuingEducationAPIClient:
     def __new__(cls):
         api_config = admission_sdk.build_configuration()
-        return continuing_education_api.ContinuingEducationApi(ApiClient(configuration=api_config))
+        return continuing_education_api.ContinuingEducationApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class ContinuingEducationService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @stale_while_revalidate('TRAINING_METADATA')
+    @single_flight(per_person=False)
     def get_continuing_education_information(
         cls,
         person,
@@ -23,6 +23,7 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+from admission.services.api_clients import prepare_api_client
 from admission.services.mixins import ServiceMeta
 from frontoffice.settings.osis_sdk import admission as admission_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
@@ -33,7 +34,7 @@ from osis_admission_sdk.api import diplomatic_post_api
 class AdmissionDiplomaticPostAPIClient:
     def __new__(cls):
         api_config = admission_sdk.build_configuration()
-        return diplomatic_post_api.DiplomaticPostApi(ApiClient(configuration=api_config))
+        return diplomatic_post_api.DiplomaticPostApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class AdmissionDiplomaticPostService(metaclass=ServiceMeta):
@@ -27,7 +27,10 @@ from osis_education_group_sdk import ApiClient, ApiException
 from osis_education_group_sdk.api import trainings_api
 from osis_education_group_sdk.models.training_detailed import TrainingDetailed
 
+from admission.services.api_clients import prepare_api_client
+from admission.services.cache import stale_while_revalidate
 from admission.services.mixins import ServiceMeta
+from admission.services.single_flight import single_flight
 from frontoffice.settings.osis_sdk import education_group as education_group_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 
@@ -35,13 +38,15 @@ from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 class EducationGroupAPIClient:
     def __new__(cls):
         api_config = education_group_sdk.build_configuration()
-        return trainings_api.TrainingsApi(ApiClient(configuration=api_config))
+        return trainings_api.TrainingsApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class TrainingsService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @stale_while_revalidate('TRAINING_METADATA')
+    @single_flight(per_person=False)
     def get_training(cls, person, year, acronym) -> TrainingDetailed:
         return EducationGroupAPIClient().trainings_read(
             year=year,
@@ -0,0 +1,89 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import logging
+from concurrent.futures import TimeoutError
+from typing import Optional
+
+from django.conf import settings
+
+from admission.services.background import run_in_background
+from admission.services.cache import get_cache, make_cache_key
+from reference.services.iban_validator import (
+    IBANValidatorException,
+    IBANValidatorRequestException,
+    IBANValidatorService,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IBAN_VALIDATION_TIMEOUT = 5
+
+
+def normalize_iban(iban: str) -> str:
+    return iban.upper().replace(' ', '').replace('-', '')
+
+
+def _validate_remotely(iban: str, cache_key: str):
+    """Validate the IBAN with the remote validator and return the validation exception instead of raising it."""
+    try:
+        IBANValidatorService.validate(iban)
+    except IBANValidatorException as exception:
+        return exception
+
+    cache_timeout = getattr(settings, 'ADMISSION_IBAN_VALIDATION_CACHE_TIMEOUT', 0)
+    if cache_timeout:
+        get_cache().set(cache_key, True, cache_timeout)
+
+
+def validate_iban(iban: str) -> Optional[bool]:
+    """
+    Validate the IBAN with the remote validator, whose structure and checksum must have been checked beforehand.
+
+    Return True if it is valid and None if the validator is not available or does not answer within
+    ADMISSION_IBAN_VALIDATION_TIMEOUT seconds, in which case the validation is left to the web services. Raise an
+    IBANValidatorException if it is not valid. The accepted IBANs are cached for
+    ADMISSION_IBAN_VALIDATION_CACHE_TIMEOUT seconds (0, i.e. no cache, by default).
+    """
+    cache_key = make_cache_key('iban', normalize_iban(iban))
+    if get_cache().get(cache_key):
+        return True
+
+    timeout = getattr(settings, 'ADMISSION_IBAN_VALIDATION_TIMEOUT', DEFAULT_IBAN_VALIDATION_TIMEOUT)
+
+    # The validation goes on in background after a timeout, so that its result can still be cached
+    future = run_in_background(_validate_remotely, iban, cache_key)
+    try:
+        exception = future.result(timeout=timeout) if future is not None else _validate_remotely(iban, cache_key)
+    except TimeoutError:
+        logger.warning("The IBAN validator did not answer in time")
+        return None
+    except IBANValidatorRequestException:
+        return None
+
+    if exception is not None:
+        raise exception
+
+    return True
@@ -23,6 +23,8 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+import functools
+import inspect
 import re
 from copy import copy
 
@@ -33,11 +35,33 @@ from django.utils.translation import gettext_lazy as _
 from osis_admission_sdk import OpenApiException
 
 from admission.contrib.enums import IN_PROGRESS_STATUSES
+from admission.services.cache import invalidate_proposition_cache
+from admission.services.outbound_calls import track_service_method
 from base.models.person import Person
 from frontoffice.settings.osis_sdk.utils import MultipleApiBusinessException, api_exception_handler
 
 INVALID_LENGTH_RE = re.compile('Invalid value for `([^`]+)`, length must be less than or equal to `([^`]+)`')
 
+# Prefixes of the names of the service methods that modify the data of the propositions
+MUTATING_METHOD_PREFIXES = (
+    'create_',
+    'update_',
+    'delete_',
+    'submit_',
+    'cancel_',
+    'request_',
+    'specify_',
+    'give_control_back_',
+    'open_',
+    'add_',
+    'edit_',
+    'remove_',
+    'set_',
+    'resend_',
+    'approve_',
+    'reject_',
+)
+
 
 class WebServiceFormMixin:
     error_mapping = {}
@@ -84,21 +108,34 @@ class WebServiceFormMixin:
             else:
                 form.add_error(None, str(e))
             return self.form_invalid(form)
+        self.prefetch_next_tab()
         return super().form_valid(form)
 
+    def prefetch_next_tab(self):
+        """Start loading the data of the next tab if the user is about to be redirected to it."""
+        from admission.services.prefetch import prefetch_tab
+
+        if '_submit_and_continue' not in self.request.POST or not self.kwargs.get('pk'):
+            return
+        try:
+            next_tab_name = self.get_next_tab_name()
+        except (IndexError, KeyError, ValueError):
+            return
+        prefetch_tab(self.person, self.current_context, self.kwargs['pk'], next_tab_name)
+
     def get_next_tab_name(self, for_context=None):
-        from admission.templatetags.admission import TAB_TREES
+        from admission.templatetags.admission import SUBTABS_BY_NAME
 
         for_context = for_context or self.current_context
 
-        flat_tab_list = [child.name for tab, children in TAB_TREES[for_context].items() for child in children]
+        flat_tab_list = list(SUBTABS_BY_NAME[for_context])
         return flat_tab_list[flat_tab_list.index(self.request.resolver_match.url_name) + 1]
 
     def call_webservice(self, data):
         raise NotImplementedError
 
     def get_success_url(self):
-        from admission.templatetags.admission import TAB_TREES, can_update_tab
+        from admission.templatetags.admission import SUBTABS_BY_NAME, can_update_tab
 
         messages.info(self.request, _("Your data have been saved"))
 
@@ -109,9 +146,7 @@ class WebServiceFormMixin:
         if self.success_url:
             return self.success_url
 
-        tab_mapping = {
-            child.name: child for tab, children in TAB_TREES[self.current_context].items() for child in children
-        }
+        tab_mapping = SUBTABS_BY_NAME[self.current_context]
 
         if (
             # We are creating an admission, on profile tabs
@@ -151,11 +186,59 @@ class FormMixinWithSpecificQuestions:
         return kwargs
 
 
+def with_proposition_cache_invalidation(func):
+    """Decorator of the mutating service methods that invalidates the cached data of the related proposition."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            arguments = signature.bind(*args, **kwargs).arguments
+            invalidate_proposition_cache(
+                person=arguments.get('person'),
+                proposition_uuid=arguments.get('uuid') or arguments.get('kwargs', {}).get('uuid'),
+            )
+
+    return wrapper
+
+
+def _raise_exception(exception, *args, **kwargs):
+    raise exception
+
+
+def handle_api_exception(api_exception_cls, exception, *args, **kwargs):
+    """
+    Handle the exception raised by a service method called with the given arguments as the `api_exception_handler`
+    decorator does, e.g. by converting the business errors into a MultipleApiBusinessException.
+    """
+    return api_exception_handler(api_exception_cls)(functools.partial(_raise_exception, exception))(*args, **kwargs)
+
+
+def async_api_exception_handler(api_exception_cls):
+    """Version of the `api_exception_handler` decorator for the asynchronous service methods."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except api_exception_cls as exception:
+                return handle_api_exception(api_exception_cls, exception, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 class ServiceMeta(type):
     """
     A metaclass that decorates all class methods with exception handler.
 
-    'api_exception_cls' must be specified as attribute
+    'api_exception_cls' must be specified as attribute. If 'invalidates_proposition_cache' is set, the methods
+    modifying data (see MUTATING_METHOD_PREFIXES) also invalidate the cached data of the related proposition. The
+    asynchronous methods (e.g. 'aget_propositions') must only read data.
     """
 
     def __new__(mcs, name, bases, attrs):
@@ -163,5 +246,13 @@ class ServiceMeta(type):
             raise AttributeError("{name} must declare 'api_exception_cls' attribute".format(name=name))
         for attr_name, attr_value in attrs.items():
             if isinstance(attr_value, classmethod):
-                attrs[attr_name] = classmethod(api_exception_handler(attrs['api_exception_cls'])(attr_value.__func__))
+                func = attr_value.__func__
+                if attrs.get('invalidates_proposition_cache') and attr_name.startswith(MUTATING_METHOD_PREFIXES):
+                    func = with_proposition_cache_invalidation(func)
+                func = track_service_method(func, f'{name}.{attr_name}')
+                if inspect.iscoroutinefunction(func):
+                    exception_handler = async_api_exception_handler(attrs['api_exception_cls'])
+                else:
+                    exception_handler = api_exception_handler(attrs['api_exception_cls'])
+                attrs[attr_name] = classmethod(exception_handler(func))
         return super().__new__(mcs, name, bases, attrs)
@@ -27,6 +27,7 @@ from osis_organisation_sdk import ApiClient, ApiException
 from osis_organisation_sdk.api import entites_api
 
 from admission.constants import UCL_CODE
+from admission.services.api_clients import prepare_api_client
 from admission.services.mixins import ServiceMeta
 from frontoffice.settings.osis_sdk import organisation as organisation_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
@@ -35,7 +36,7 @@ from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 class EntitiesAPIClient:
     def __new__(cls):
         api_config = organisation_sdk.build_configuration()
-        return entites_api.EntitesApi(ApiClient(configuration=api_config))
+        return entites_api.EntitesApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class EntitiesService(metaclass=ServiceMeta):
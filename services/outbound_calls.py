@@ -0,0 +1,114 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import List, NamedTuple
+
+
+class OutboundCall(NamedTuple):
+    service_method: str
+    sdk: str
+
+
+class OutboundCallBudgetExceeded(Exception):
+    pass
+
+
+_current_service_method: ContextVar = ContextVar('admission_current_service_method', default='')
+_recorders: ContextVar = ContextVar('admission_outbound_call_recorders', default=())
+
+
+class OutboundCallRecorder:
+    """Context manager recording the calls made to the web services by the current thread."""
+
+    def __init__(self):
+        self.calls: List[OutboundCall] = []
+        self._token = None
+
+    def __enter__(self):
+        self._token = _recorders.set((*_recorders.get(), self))
+        return self
+
+    def __exit__(self, *exc_info):
+        _recorders.reset(self._token)
+
+    def __len__(self):
+        return len(self.calls)
+
+    def format_calls(self):
+        return '\n'.join(f'{index}. {call.service_method} ({call.sdk})' for index, call in enumerate(self.calls, 1))
+
+
+def get_current_service_method():
+    """Return the name of the running service method, if any."""
+    return _current_service_method.get()
+
+
+def record_outbound_call(sdk_name):
+    """Record a call to the web services, made by the current service method, in the active recorders."""
+    recorders = _recorders.get()
+    if recorders:
+        call = OutboundCall(_current_service_method.get() or '<unknown>', sdk_name)
+        for recorder in recorders:
+            recorder.calls.append(call)
+
+
+def record_api_client_calls(api_client, sdk_name):
+    """Record each request sent by an api client of the SDKs (see `record_outbound_call`)."""
+    call_api = api_client.call_api
+
+    def recording_call_api(*args, **kwargs):
+        record_outbound_call(sdk_name)
+        return call_api(*args, **kwargs)
+
+    api_client.call_api = recording_call_api
+
+
+def track_service_method(func, name):
+    """Decorator making the name of the running service method available to `record_outbound_call`."""
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            token = _current_service_method.set(name)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _current_service_method.reset(token)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _current_service_method.set(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current_service_method.reset(token)
+
+    return wrapper
@@ -28,7 +28,12 @@ from osis_admission_sdk.api import person_api
 from osis_admission_sdk.model.identification_dto import IdentificationDTO
 from osis_admission_sdk.model.person_identification import PersonIdentification
 
+from admission.services.api_clients import prepare_api_client
+from admission.services.async_transport import acall_endpoint
+from admission.services.cache import conditional_cache, proposition_cache
 from admission.services.mixins import ServiceMeta
+from admission.services.single_flight import single_flight
+from admission.services.trusted_responses import call_trusted_endpoint
 from frontoffice.settings.osis_sdk import admission as admission_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 
@@ -36,11 +41,12 @@ from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 class AdmissionPersonAPIClient:
     def __new__(cls):
         api_config = admission_sdk.build_configuration()
-        return person_api.PersonApi(ApiClient(configuration=api_config))
+        return person_api.PersonApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class AdmissionPersonService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    invalidates_proposition_cache = True
 
     # Identification
     @classmethod
@@ -61,6 +67,13 @@ class AdmissionPersonService(metaclass=ServiceMeta):
             **build_mandatory_auth_headers(person),
         )
 
+    @classmethod
+    async def aretrieve_person(cls, person) -> PersonIdentification:
+        return await acall_endpoint(
+            AdmissionPersonAPIClient().retrieve_person_identification,
+            **build_mandatory_auth_headers(person),
+        )
+
     @classmethod
     def update_person(cls, person, data, uuid=None):
         if uuid:
@@ -114,6 +127,9 @@ class AdmissionPersonService(metaclass=ServiceMeta):
 
     # Education
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PERSON_DATA_CACHE_TIMEOUT')
+    @conditional_cache('ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
     def retrieve_high_school_diploma(cls, person, uuid=None):
         if uuid:
             return AdmissionPersonAPIClient().retrieve_high_school_diploma_admission(
@@ -137,6 +153,8 @@ class AdmissionPersonService(metaclass=ServiceMeta):
 
     # Languages
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PERSON_DATA_CACHE_TIMEOUT')
     def retrieve_languages_knowledge(cls, person, uuid=None):
         if uuid:
             return AdmissionPersonAPIClient().list_language_knowledges_admission(
@@ -162,13 +180,18 @@ class AdmissionPersonService(metaclass=ServiceMeta):
 
     # Curriculum
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PERSON_DATA_CACHE_TIMEOUT')
+    @conditional_cache('ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
     def get_curriculum(cls, person, uuid=None):
         if uuid:
-            return AdmissionPersonAPIClient().retrieve_curriculum_details_admission(
+            return call_trusted_endpoint(
+                AdmissionPersonAPIClient().retrieve_curriculum_details_admission,
                 uuid=uuid,
                 **build_mandatory_auth_headers(person),
             )
-        return AdmissionPersonAPIClient().retrieve_curriculum_details(
+        return call_trusted_endpoint(
+            AdmissionPersonAPIClient().retrieve_curriculum_details,
             **build_mandatory_auth_headers(person),
         )
 
@@ -279,6 +302,7 @@ class AdmissionPersonService(metaclass=ServiceMeta):
 
 class GeneralEducationAdmissionPersonService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    invalidates_proposition_cache = True
 
     # Person
     @classmethod
@@ -322,6 +346,9 @@ class GeneralEducationAdmissionPersonService(metaclass=ServiceMeta):
 
     # Education
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PERSON_DATA_CACHE_TIMEOUT')
+    @conditional_cache('ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
     def retrieve_high_school_diploma(cls, person, uuid):
         return AdmissionPersonAPIClient().retrieve_high_school_diploma_general_education_admission(
             uuid=uuid,
@@ -354,8 +381,12 @@ class GeneralEducationAdmissionPersonService(metaclass=ServiceMeta):
 
     # Curriculum
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PERSON_DATA_CACHE_TIMEOUT')
+    @conditional_cache('ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
     def get_curriculum(cls, person, uuid):
-        return AdmissionPersonAPIClient().retrieve_curriculum_details_general_education_admission(
+        return call_trusted_endpoint(
+            AdmissionPersonAPIClient().retrieve_curriculum_details_general_education_admission,
             uuid=uuid,
             **build_mandatory_auth_headers(person),
         )
@@ -437,6 +468,7 @@ class GeneralEducationAdmissionPersonService(metaclass=ServiceMeta):
 
 class ContinuingEducationAdmissionPersonService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    invalidates_proposition_cache = True
 
     # Person
     @classmethod
@@ -480,6 +512,9 @@ class ContinuingEducationAdmissionPersonService(metaclass=ServiceMeta):
 
     # Education
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PERSON_DATA_CACHE_TIMEOUT')
+    @conditional_cache('ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
     def retrieve_high_school_diploma(cls, person, uuid):
         return AdmissionPersonAPIClient().retrieve_high_school_diploma_continuing_education_admission(
             uuid=uuid,
@@ -496,8 +531,12 @@ class ContinuingEducationAdmissionPersonService(metaclass=ServiceMeta):
 
     # Curriculum
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PERSON_DATA_CACHE_TIMEOUT')
+    @conditional_cache('ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
     def get_curriculum(cls, person, uuid):
-        return AdmissionPersonAPIClient().retrieve_curriculum_details_continuing_education_admission(
+        return call_trusted_endpoint(
+            AdmissionPersonAPIClient().retrieve_curriculum_details_continuing_education_admission,
             uuid=uuid,
             **build_mandatory_auth_headers(person),
         )
@@ -0,0 +1,175 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+
+from admission.contrib.enums.specific_question import Onglets
+from admission.services.background import run_in_background
+from admission.services.cache import get_person_identifier, get_proposition_version
+from admission.services.person import (
+    AdmissionPersonService,
+    ContinuingEducationAdmissionPersonService,
+    GeneralEducationAdmissionPersonService,
+)
+from admission.services.proposition import AdmissionPropositionService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TASKS_PER_USER = 1
+
+# Service methods loading the data of the proposition, by context
+PROPOSITION_LOADERS = {
+    'doctorate': AdmissionPropositionService.get_proposition,
+    'general-education': AdmissionPropositionService.get_general_education_proposition,
+    'continuing-education': AdmissionPropositionService.get_continuing_education_proposition,
+}
+
+# Cached service methods loading the data of a tab, by context and by tab name, with their additional arguments
+TAB_LOADERS = {
+    'doctorate': {
+        'training-choice': [
+            (
+                AdmissionPropositionService.retrieve_doctorate_specific_questions,
+                {'tab_name': Onglets.CHOIX_FORMATION.name},
+            ),
+        ],
+        'curriculum': [
+            (AdmissionPersonService.get_curriculum, {}),
+            (AdmissionPropositionService.retrieve_doctorate_specific_questions, {'tab_name': Onglets.CURRICULUM.name}),
+        ],
+        'languages': [
+            (AdmissionPersonService.retrieve_languages_knowledge, {}),
+        ],
+        'confirm-submit': [
+            (AdmissionPropositionService.verify_proposition, {}),
+        ],
+    },
+    'general-education': {
+        'training-choice': [
+            (
+                AdmissionPropositionService.retrieve_general_specific_questions,
+                {'tab_name': Onglets.CHOIX_FORMATION.name},
+            ),
+        ],
+        'education': [
+            (GeneralEducationAdmissionPersonService.retrieve_high_school_diploma, {}),
+            (
+                AdmissionPropositionService.retrieve_general_specific_questions,
+                {'tab_name': Onglets.ETUDES_SECONDAIRES.name},
+            ),
+        ],
+        'curriculum': [
+            (GeneralEducationAdmissionPersonService.get_curriculum, {}),
+            (AdmissionPropositionService.retrieve_general_specific_questions, {'tab_name': Onglets.CURRICULUM.name}),
+        ],
+        'specific-questions': [
+            (
+                AdmissionPropositionService.retrieve_general_specific_questions,
+                {'tab_name': Onglets.INFORMATIONS_ADDITIONNELLES.name},
+            ),
+        ],
+        'confirm-submit': [
+            (AdmissionPropositionService.verify_general_proposition, {}),
+        ],
+    },
+    'continuing-education': {
+        'training-choice': [
+            (
+                AdmissionPropositionService.retrieve_continuing_specific_questions,
+                {'tab_name': Onglets.CHOIX_FORMATION.name},
+            ),
+        ],
+        'education': [
+            (ContinuingEducationAdmissionPersonService.retrieve_high_school_diploma, {}),
+            (
+                AdmissionPropositionService.retrieve_continuing_specific_questions,
+                {'tab_name': Onglets.ETUDES_SECONDAIRES.name},
+            ),
+        ],
+        'curriculum': [
+            (ContinuingEducationAdmissionPersonService.get_curriculum, {}),
+            (AdmissionPropositionService.retrieve_continuing_specific_questions, {'tab_name': Onglets.CURRICULUM.name}),
+        ],
+        'specific-questions': [
+            (
+                AdmissionPropositionService.retrieve_continuing_specific_questions,
+                {'tab_name': Onglets.INFORMATIONS_ADDITIONNELLES.name},
+            ),
+        ],
+        'confirm-submit': [
+            (AdmissionPropositionService.verify_continuing_proposition, {}),
+        ],
+    },
+}
+
+_running_tasks = Counter()
+_running_tasks_lock = threading.Lock()
+
+
+def _release_task(person_identifier):
+    with _running_tasks_lock:
+        _running_tasks[person_identifier] -= 1
+        if not _running_tasks[person_identifier]:
+            del _running_tasks[person_identifier]
+
+
+def _load_tab(person, person_identifier, proposition_uuid, loaders, version):
+    try:
+        for loader, kwargs in loaders:
+            # Stop as soon as the data are modified again, the loaded data would be outdated
+            if get_proposition_version(person, proposition_uuid) != version:
+                logger.debug("Prefetch of the proposition %s cancelled", proposition_uuid)
+                return
+            loader(person=person, uuid=proposition_uuid, **kwargs)
+    finally:
+        _release_task(person_identifier)
+
+
+def prefetch_tab(person, context, proposition_uuid, tab_name):
+    """
+    Load in the background, into the caches of the services, the data needed by a tab of a proposition, so that they
+    are ready when the tab is displayed. These caches are shared between the processes (see `proposition_cache`), so
+    the tab can be displayed by any of them. Return True if the loading has been started.
+    """
+    if not getattr(settings, 'ADMISSION_PREDICTIVE_PREFETCH_ENABLED', False) or context not in PROPOSITION_LOADERS:
+        return False
+
+    person_identifier = get_person_identifier(person)
+    with _running_tasks_lock:
+        max_tasks = getattr(settings, 'ADMISSION_PREDICTIVE_PREFETCH_MAX_TASKS_PER_USER', DEFAULT_MAX_TASKS_PER_USER)
+        if _running_tasks[person_identifier] >= max_tasks:
+            return False
+        _running_tasks[person_identifier] += 1
+
+    loaders = [(PROPOSITION_LOADERS[context], {}), *TAB_LOADERS[context].get(tab_name, [])]
+    version = get_proposition_version(person, proposition_uuid)
+    if run_in_background(_load_tab, person, person_identifier, proposition_uuid, loaders, version) is None:
+        _release_task(person_identifier)
+        return False
+    return True
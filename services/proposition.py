@@ -23,83 +23,40 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import osis_admission_sdk
 from django.conf import settings
 from django.utils.translation import get_language
 from osis_admission_sdk import ApiClient, ApiException
-from osis_admission_sdk.api import propositions_api
-from osis_admission_sdk.model.actor_type_enum import ActorTypeEnum
-from osis_admission_sdk.model.approuver_proposition_command import (
-    ApprouverPropositionCommand,
-)
-from osis_admission_sdk.model.approuver_proposition_par_pdf_command import (
-    ApprouverPropositionParPdfCommand,
-)
-from osis_admission_sdk.model.candidate_enrolment_information import CandidateEnrolmentInformation
-from osis_admission_sdk.model.candidate_re_enrolment_eligibility import CandidateReEnrolmentEligibility
-from osis_admission_sdk.model.candidate_re_enrolment_period_dto import CandidateReEnrolmentPeriodDTO
-from osis_admission_sdk.model.candidate_ucl_enrolment_dto import CandidateUCLEnrolmentDTO
-from osis_admission_sdk.model.completer_comptabilite_proposition_doctorale_command import (
-    CompleterComptabilitePropositionDoctoraleCommand,
-)
-from osis_admission_sdk.model.completer_comptabilite_proposition_generale_command import (
-    CompleterComptabilitePropositionGeneraleCommand,
-)
-from osis_admission_sdk.model.completer_proposition_command import (
-    CompleterPropositionCommand,
-)
-from osis_admission_sdk.model.continuing_education_proposition_dto import (
-    ContinuingEducationPropositionDTO,
-)
-from osis_admission_sdk.model.cotutelle_dto import CotutelleDTO
-from osis_admission_sdk.model.definir_cotutelle_command import DefinirCotutelleCommand
-from osis_admission_sdk.model.designer_promoteur_reference_command import (
-    DesignerPromoteurReferenceCommand,
-)
-from osis_admission_sdk.model.doctorate_education_accounting_dto import (
-    DoctorateEducationAccountingDTO,
-)
-from osis_admission_sdk.model.doctorate_proposition_dto import DoctoratePropositionDTO
-from osis_admission_sdk.model.general_education_accounting_dto import (
-    GeneralEducationAccountingDTO,
-)
-from osis_admission_sdk.model.general_education_proposition_dto import (
-    GeneralEducationPropositionDTO,
-)
-from osis_admission_sdk.model.identifier_supervision_actor import (
-    IdentifierSupervisionActor,
-)
-from osis_admission_sdk.model.modifier_questions_specifiques_formation_continue_command import (
-    ModifierQuestionsSpecifiquesFormationContinueCommand,
-)
-from osis_admission_sdk.model.modifier_questions_specifiques_formation_generale_command import (
-    ModifierQuestionsSpecifiquesFormationGeneraleCommand,
-)
-from osis_admission_sdk.model.refuser_proposition_command import (
-    RefuserPropositionCommand,
-)
-from osis_admission_sdk.model.renvoyer_invitation_signature import (
-    RenvoyerInvitationSignature,
-)
-from osis_admission_sdk.model.specific_question import SpecificQuestion
-from osis_admission_sdk.model.specifier_raison_plusieurs_demandes_meme_cycle_meme_annee_command import (
-    SpecifierRaisonPlusieursDemandesMemeCycleMemeAnneeCommand,
-)
-from osis_admission_sdk.model.submit_general_proposition import SubmitGeneralProposition
-from osis_admission_sdk.model.submit_proposition import SubmitProposition
-from osis_admission_sdk.model.supervision_actor_reference import (
-    SupervisionActorReference,
-)
-from osis_admission_sdk.model.supervision_dto import SupervisionDTO
 
+from admission.services.api_clients import prepare_api_client
+from admission.services.async_transport import acall_endpoint, acall_trusted_endpoint
+from admission.services.cache import conditional_cache, proposition_cache, stale_while_revalidate
 from admission.services.mixins import ServiceMeta
+from admission.services.sdk_models import LazySDKModels
+from admission.services.single_flight import single_flight
+from admission.services.trusted_responses import call_trusted_endpoint
 from base.models.person import Person
 from frontoffice.settings.osis_sdk import admission as admission_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 
+if TYPE_CHECKING:
+    from osis_admission_sdk.model.candidate_enrolment_information import CandidateEnrolmentInformation
+    from osis_admission_sdk.model.candidate_re_enrolment_eligibility import CandidateReEnrolmentEligibility
+    from osis_admission_sdk.model.candidate_re_enrolment_period_dto import CandidateReEnrolmentPeriodDTO
+    from osis_admission_sdk.model.candidate_ucl_enrolment_dto import CandidateUCLEnrolmentDTO
+    from osis_admission_sdk.model.continuing_education_proposition_dto import ContinuingEducationPropositionDTO
+    from osis_admission_sdk.model.cotutelle_dto import CotutelleDTO
+    from osis_admission_sdk.model.doctorate_education_accounting_dto import DoctorateEducationAccountingDTO
+    from osis_admission_sdk.model.doctorate_proposition_dto import DoctoratePropositionDTO
+    from osis_admission_sdk.model.general_education_accounting_dto import GeneralEducationAccountingDTO
+    from osis_admission_sdk.model.general_education_proposition_dto import GeneralEducationPropositionDTO
+    from osis_admission_sdk.model.specific_question import SpecificQuestion
+    from osis_admission_sdk.model.supervision_dto import SupervisionDTO
+
 __all__ = [
     "AdmissionPropositionService",
     "AdmissionCotutelleService",
@@ -111,47 +68,85 @@ __all__ = [
     "GlobalPropositionBusinessException",
 ]
 
-from osis_admission_sdk.model.pool_enum import PoolEnum
+sdk_models = LazySDKModels('osis_admission_sdk')
 
 
 class APIClient:
     def __new__(cls, api_config=None):
+        # Imported here as the api module imports the modules of all the models it uses
+        from osis_admission_sdk.api import propositions_api
+
         api_config = api_config or admission_sdk.build_configuration()
-        return propositions_api.PropositionsApi(ApiClient(configuration=api_config))
+        return propositions_api.PropositionsApi(prepare_api_client(ApiClient(configuration=api_config)))
+
+
+def get_verification_version(person: Person):
+    """
+    Return the version of the data, other than the proposition, on which the verification of a proposition depends:
+    the deadlines are checked against the current date and the enrolment calendar.
+    """
+    return (
+        datetime.date.today().isoformat(),
+        AdmissionPropositionService.retrieve_specific_enrolment_periods(person, None).to_dict(),
+    )
 
 
 class AdmissionPropositionService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    invalidates_proposition_cache = True
 
     @classmethod
     def get_dashboard_links(cls, person: Person):
         return APIClient().retrieve_dashboard(**build_mandatory_auth_headers(person)).to_dict().get('links', {})
 
+    # The enrolment calendars are the same for all the candidates so they are shared between them
     @classmethod
+    @stale_while_revalidate('ENROLMENT_CALENDAR')
+    @single_flight(per_person=False)
     def retrieve_specific_enrolment_periods(cls, person: Person, year: Optional[int]):
         kwargs = {'year': year} if year else {}
         return APIClient().retrieve_specific_enrolment_periods(**kwargs, **build_mandatory_auth_headers(person))
 
     @classmethod
-    def retrieve_re_enrolment_period(cls, person: Person) -> CandidateReEnrolmentPeriodDTO:
+    @stale_while_revalidate(
+        'ENROLMENT_CALENDAR',
+        # A period that is over must be replaced by the following one
+        is_valid=lambda period: period.date_fin >= datetime.date.today(),
+    )
+    @single_flight(per_person=False)
+    def retrieve_re_enrolment_period(cls, person: Person) -> 'CandidateReEnrolmentPeriodDTO':
         return APIClient().propositions_re_enrolment_period_retrieve(**build_mandatory_auth_headers(person))
 
     @classmethod
-    def retrieve_ucl_enrolments_list(cls, person) -> list[CandidateUCLEnrolmentDTO]:
+    def retrieve_ucl_enrolments_list(cls, person) -> list['CandidateUCLEnrolmentDTO']:
         return APIClient().propositions_ucl_enrolments_list(**build_mandatory_auth_headers(person))
 
     @classmethod
-    def retrieve_candidate_re_enrolment_eligibility(cls, person) -> CandidateReEnrolmentEligibility:
+    def retrieve_candidate_re_enrolment_eligibility(cls, person) -> 'CandidateReEnrolmentEligibility':
         return APIClient().propositions_candidate_re_enrolment_eligibity_retrieve(
             **build_mandatory_auth_headers(person),
         )
 
+    @classmethod
+    async def aretrieve_ucl_enrolments_list(cls, person) -> list['CandidateUCLEnrolmentDTO']:
+        return await acall_endpoint(
+            APIClient().propositions_ucl_enrolments_list,
+            **build_mandatory_auth_headers(person),
+        )
+
+    @classmethod
+    async def aretrieve_candidate_re_enrolment_eligibility(cls, person) -> 'CandidateReEnrolmentEligibility':
+        return await acall_endpoint(
+            APIClient().propositions_candidate_re_enrolment_eligibity_retrieve,
+            **build_mandatory_auth_headers(person),
+        )
+
     @classmethod
     def retrieve_candidate_ucl_enrolment_information(
         cls,
         person: Person,
         **kwargs,
-    ) -> CandidateEnrolmentInformation:
+    ) -> 'CandidateEnrolmentInformation':
         return APIClient().propositions_candidate_ucl_enrolment_information_retrieve(
             **build_mandatory_auth_headers(person),
         )
@@ -161,7 +156,7 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         cls,
         person: Person,
         uuid_proposition: str,
-    ) -> CandidateEnrolmentInformation:
+    ) -> 'CandidateEnrolmentInformation':
         return APIClient().propositions_general_education_candidate_ucl_enrolment_information_retrieve(
             uuid=uuid_proposition,
             **build_mandatory_auth_headers(person),
@@ -172,7 +167,7 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         cls,
         person: Person,
         uuid_proposition: str,
-    ) -> CandidateEnrolmentInformation:
+    ) -> 'CandidateEnrolmentInformation':
         return APIClient().propositions_doctorate_candidate_ucl_enrolment_information_retrieve(
             uuid=uuid_proposition,
             **build_mandatory_auth_headers(person),
@@ -183,7 +178,7 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         cls,
         person: Person,
         uuid_proposition: str,
-    ) -> CandidateEnrolmentInformation:
+    ) -> 'CandidateEnrolmentInformation':
         return APIClient().propositions_continuing_education_candidate_ucl_enrolment_information_retrieve(
             uuid=uuid_proposition,
             **build_mandatory_auth_headers(person),
@@ -251,19 +246,25 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
     def update_proposition(cls, person: Person, **kwargs):
         return APIClient().update_project(
             uuid=kwargs['uuid'],
-            completer_proposition_command=CompleterPropositionCommand(**kwargs),
+            completer_proposition_command=sdk_models.CompleterPropositionCommand(**kwargs),
             **build_mandatory_auth_headers(person),
         )
 
     @classmethod
-    def get_proposition(cls, person: Person, uuid) -> DoctoratePropositionDTO:
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PROPOSITION_CACHE_TIMEOUT')
+    @conditional_cache('ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
+    def get_proposition(cls, person: Person, uuid) -> 'DoctoratePropositionDTO':
         return APIClient().retrieve_doctorate_proposition(
             uuid=uuid,
             **build_mandatory_auth_headers(person),
         )
 
     @classmethod
-    def get_general_education_proposition(cls, person: Person, uuid) -> GeneralEducationPropositionDTO:
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PROPOSITION_CACHE_TIMEOUT')
+    @conditional_cache('ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
+    def get_general_education_proposition(cls, person: Person, uuid) -> 'GeneralEducationPropositionDTO':
         return APIClient().retrieve_general_education_proposition(
             uuid=uuid,
             **build_mandatory_auth_headers(person),
@@ -277,7 +278,10 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         )
 
     @classmethod
-    def get_continuing_education_proposition(cls, person: Person, uuid) -> ContinuingEducationPropositionDTO:
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PROPOSITION_CACHE_TIMEOUT')
+    @conditional_cache('ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
+    def get_continuing_education_proposition(cls, person: Person, uuid) -> 'ContinuingEducationPropositionDTO':
         return APIClient().retrieve_continuing_education_proposition(
             uuid=uuid,
             **build_mandatory_auth_headers(person),
@@ -306,7 +310,15 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
 
     @classmethod
     def get_propositions(cls, person: Person):
-        return APIClient().list_propositions(
+        return call_trusted_endpoint(
+            APIClient().list_propositions,
+            **build_mandatory_auth_headers(person),
+        )
+
+    @classmethod
+    async def aget_propositions(cls, person: Person):
+        return await acall_trusted_endpoint(
+            APIClient().list_propositions,
             **build_mandatory_auth_headers(person),
         )
 
@@ -318,7 +330,8 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
 
     @classmethod
     def get_supervised_propositions(cls, person: Person):
-        return APIClient().list_supervised_propositions(
+        return call_trusted_endpoint(
+            APIClient().list_supervised_propositions,
             **build_mandatory_auth_headers(person),
         )
 
@@ -344,6 +357,8 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PROPOSITION_VERIFICATION_CACHE_TIMEOUT', get_verification_version)
     def verify_proposition(cls, person: Person, uuid):
         return APIClient().verify_proposition(
             uuid=uuid,
@@ -355,10 +370,12 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         return APIClient().submit_proposition(
             uuid=uuid,
             **build_mandatory_auth_headers(person),
-            submit_proposition=SubmitProposition(annee, PoolEnum(pool), elements_confirmation),
+            submit_proposition=sdk_models.SubmitProposition(annee, sdk_models.PoolEnum(pool), elements_confirmation),
         )
 
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PROPOSITION_VERIFICATION_CACHE_TIMEOUT', get_verification_version)
     def verify_general_proposition(cls, person: Person, uuid):
         return APIClient().verify_general_education_proposition(
             uuid=uuid,
@@ -379,9 +396,9 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         return APIClient().submit_general_education_proposition(
             uuid=uuid,
             **build_mandatory_auth_headers(person),
-            submit_general_proposition=SubmitGeneralProposition(
+            submit_general_proposition=sdk_models.SubmitGeneralProposition(
                 annee=annee,
-                pool=PoolEnum(pool),
+                pool=sdk_models.PoolEnum(pool),
                 elements_confirmation=elements_confirmation,
                 raison_plusieurs_demandes_meme_cycle_meme_annee=raison_plusieurs_demandes_meme_cycle_meme_annee,
                 justification_textuelle_plusieurs_demandes_meme_cycle_meme_annee=(
@@ -395,7 +412,7 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         return APIClient().specify_reason_multiple_applications_same_cycle_same_year(
             uuid=uuid,
             specifier_raison_plusieurs_demandes_meme_cycle_meme_annee_command=(
-                SpecifierRaisonPlusieursDemandesMemeCycleMemeAnneeCommand(
+                sdk_models.SpecifierRaisonPlusieursDemandesMemeCycleMemeAnneeCommand(
                     raison_plusieurs_demandes_meme_cycle_meme_annee=data[
                         'raison_plusieurs_demandes_meme_cycle_meme_annee'
                     ],
@@ -408,6 +425,8 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_PROPOSITION_VERIFICATION_CACHE_TIMEOUT', get_verification_version)
     def verify_continuing_proposition(cls, person: Person, uuid):
         return APIClient().verify_continuing_education_proposition(
             uuid=uuid,
@@ -419,18 +438,18 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         return APIClient().submit_continuing_education_proposition(
             uuid=uuid,
             **build_mandatory_auth_headers(person),
-            submit_proposition=SubmitProposition(annee, PoolEnum(pool), elements_confirmation),
+            submit_proposition=sdk_models.SubmitProposition(annee, sdk_models.PoolEnum(pool), elements_confirmation),
         )
 
     @classmethod
-    def retrieve_doctorate_accounting(cls, person: Person, uuid: str) -> DoctorateEducationAccountingDTO:
+    def retrieve_doctorate_accounting(cls, person: Person, uuid: str) -> 'DoctorateEducationAccountingDTO':
         return APIClient().retrieve_accounting(
             uuid=uuid,
             **build_mandatory_auth_headers(person),
         )
 
     @classmethod
-    def retrieve_general_accounting(cls, person: Person, uuid: str) -> GeneralEducationAccountingDTO:
+    def retrieve_general_accounting(cls, person: Person, uuid: str) -> 'GeneralEducationAccountingDTO':
         return APIClient().retrieve_general_accounting(
             uuid=uuid,
             **build_mandatory_auth_headers(person),
@@ -439,25 +458,32 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
     @classmethod
     def update_doctorate_accounting(cls, person: Person, uuid: str, data: dict):
         data['uuid_proposition'] = uuid
+        command = sdk_models.CompleterComptabilitePropositionDoctoraleCommand(**data)
         return APIClient().update_accounting(
             uuid=uuid,
-            completer_comptabilite_proposition_doctorale_command=CompleterComptabilitePropositionDoctoraleCommand(
-                **data
-            ),
+            completer_comptabilite_proposition_doctorale_command=command,
             **build_mandatory_auth_headers(person),
         )
 
     @classmethod
     def update_general_accounting(cls, person: Person, uuid: str, data: dict):
         data['uuid_proposition'] = uuid
+        command = sdk_models.CompleterComptabilitePropositionGeneraleCommand(**data)
         return APIClient().update_general_accounting(
             uuid=uuid,
-            completer_comptabilite_proposition_generale_command=CompleterComptabilitePropositionGeneraleCommand(**data),
+            completer_comptabilite_proposition_generale_command=command,
             **build_mandatory_auth_headers(person),
         )
 
     @classmethod
-    def retrieve_doctorate_specific_questions(cls, person: Person, uuid: str, tab_name: str) -> List[SpecificQuestion]:
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_SPECIFIC_QUESTIONS_CACHE_TIMEOUT')
+    def retrieve_doctorate_specific_questions(
+        cls,
+        person: Person,
+        uuid: str,
+        tab_name: str,
+    ) -> List['SpecificQuestion']:
         return APIClient().list_doctorate_specific_questions(
             uuid=uuid,
             tab=tab_name,
@@ -465,7 +491,9 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         )
 
     @classmethod
-    def retrieve_general_specific_questions(cls, person: Person, uuid: str, tab_name: str) -> List[SpecificQuestion]:
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_SPECIFIC_QUESTIONS_CACHE_TIMEOUT')
+    def retrieve_general_specific_questions(cls, person: Person, uuid: str, tab_name: str) -> List['SpecificQuestion']:
         return APIClient().list_general_specific_questions(
             uuid=uuid,
             tab=tab_name,
@@ -473,7 +501,14 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         )
 
     @classmethod
-    def retrieve_continuing_specific_questions(cls, person: Person, uuid: str, tab_name: str) -> List[SpecificQuestion]:
+    @single_flight(per_person=True)
+    @proposition_cache('ADMISSION_SPECIFIC_QUESTIONS_CACHE_TIMEOUT')
+    def retrieve_continuing_specific_questions(
+        cls,
+        person: Person,
+        uuid: str,
+        tab_name: str,
+    ) -> List['SpecificQuestion']:
         return APIClient().list_continuing_specific_questions(
             uuid=uuid,
             tab=tab_name,
@@ -485,7 +520,7 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         return APIClient().update_general_specific_question(
             uuid=uuid,
             modifier_questions_specifiques_formation_generale_command=(
-                ModifierQuestionsSpecifiquesFormationGeneraleCommand(**data)
+                sdk_models.ModifierQuestionsSpecifiquesFormationGeneraleCommand(**data)
             ),
             **build_mandatory_auth_headers(person),
         )
@@ -495,7 +530,7 @@ class AdmissionPropositionService(metaclass=ServiceMeta):
         return APIClient().update_continuing_specific_question(
             uuid=uuid,
             modifier_questions_specifiques_formation_continue_command=(
-                ModifierQuestionsSpecifiquesFormationContinueCommand(**data)
+                sdk_models.ModifierQuestionsSpecifiquesFormationContinueCommand(**data)
             ),
             **build_mandatory_auth_headers(person),
         )
@@ -901,18 +936,19 @@ ADDITIONAL_BUSINESS_EXCEPTIONS = {
 
 class AdmissionCotutelleService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    invalidates_proposition_cache = True
 
     @classmethod
     def update_cotutelle(cls, person, **kwargs):
         uuid = str(kwargs.pop('uuid'))
         return APIClient().update_cotutelle(
             uuid=uuid,
-            definir_cotutelle_command=DefinirCotutelleCommand(**kwargs),
+            definir_cotutelle_command=sdk_models.DefinirCotutelleCommand(**kwargs),
             **build_mandatory_auth_headers(person),
         )
 
     @classmethod
-    def get_cotutelle(cls, person, uuid) -> CotutelleDTO:
+    def get_cotutelle(cls, person, uuid) -> 'CotutelleDTO':
         return APIClient().retrieve_cotutelle(
             uuid=uuid,
             **build_mandatory_auth_headers(person),
@@ -921,6 +957,7 @@ class AdmissionCotutelleService(metaclass=ServiceMeta):
 
 class AdmissionSupervisionService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    invalidates_proposition_cache = True
 
     @classmethod
     def build_config(cls):
@@ -937,7 +974,7 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
         }
 
     @classmethod
-    def get_supervision(cls, person, uuid) -> SupervisionDTO:
+    def get_supervision(cls, person, uuid) -> 'SupervisionDTO':
         return APIClient().retrieve_supervision(uuid=uuid, **build_mandatory_auth_headers(person))
 
     @classmethod
@@ -960,7 +997,10 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
         actor_type = kwargs.pop('actor_type')
         return APIClient().add_member(
             uuid=uuid,
-            identifier_supervision_actor=IdentifierSupervisionActor(actor_type=ActorTypeEnum(actor_type), **kwargs),
+            identifier_supervision_actor=sdk_models.IdentifierSupervisionActor(
+                actor_type=sdk_models.ActorTypeEnum(actor_type),
+                **kwargs,
+            ),
             **build_mandatory_auth_headers(person),
         )
 
@@ -976,7 +1016,7 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
     def remove_member(cls, person, uuid, **kwargs):
         return APIClient().remove_member(
             uuid=uuid,
-            supervision_actor_reference=SupervisionActorReference(**kwargs),
+            supervision_actor_reference=sdk_models.SupervisionActorReference(**kwargs),
             **build_mandatory_auth_headers(person),
         )
 
@@ -984,7 +1024,7 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
     def set_reference_promoter(cls, person, uuid, **kwargs):
         return APIClient().set_reference_promoter(
             uuid=uuid,
-            designer_promoteur_reference_command=DesignerPromoteurReferenceCommand(**kwargs),
+            designer_promoteur_reference_command=sdk_models.DesignerPromoteurReferenceCommand(**kwargs),
             **build_mandatory_auth_headers(person),
         )
 
@@ -992,7 +1032,7 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
     def resend_invite(cls, person, uuid, **kwargs):
         return APIClient().update_signatures(
             uuid=uuid,
-            renvoyer_invitation_signature=RenvoyerInvitationSignature(**kwargs),
+            renvoyer_invitation_signature=sdk_models.RenvoyerInvitationSignature(**kwargs),
             **build_mandatory_auth_headers(person),
         )
 
@@ -1000,7 +1040,7 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
     def approve_proposition(cls, person, uuid, **kwargs):
         return APIClient().approve_proposition(
             uuid=uuid,
-            approuver_proposition_command=ApprouverPropositionCommand(**kwargs),
+            approuver_proposition_command=sdk_models.ApprouverPropositionCommand(**kwargs),
             **build_mandatory_auth_headers(person),
         )
 
@@ -1008,7 +1048,7 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
     def reject_proposition(cls, person, uuid, **kwargs):
         return APIClient().reject_proposition(
             uuid=uuid,
-            refuser_proposition_command=RefuserPropositionCommand(**kwargs),
+            refuser_proposition_command=sdk_models.RefuserPropositionCommand(**kwargs),
             **build_mandatory_auth_headers(person),
         )
 
@@ -1017,7 +1057,7 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
         return APIClient(api_config=cls.build_config()).approve_external_proposition(
             uuid=uuid,
             token=token,
-            approuver_proposition_command=ApprouverPropositionCommand(**kwargs),
+            approuver_proposition_command=sdk_models.ApprouverPropositionCommand(**kwargs),
             **cls.build_mandatory_external_headers(),
         )
 
@@ -1026,7 +1066,7 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
         return APIClient(api_config=cls.build_config()).reject_external_proposition(
             uuid=uuid,
             token=token,
-            refuser_proposition_command=RefuserPropositionCommand(**kwargs),
+            refuser_proposition_command=sdk_models.RefuserPropositionCommand(**kwargs),
             **cls.build_mandatory_external_headers(),
         )
 
@@ -1034,6 +1074,6 @@ class AdmissionSupervisionService(metaclass=ServiceMeta):
     def approve_by_pdf(cls, person, uuid, **kwargs):
         return APIClient().approve_by_pdf(
             uuid=uuid,
-            approuver_proposition_par_pdf_command=ApprouverPropositionParPdfCommand(**kwargs),
+            approuver_proposition_par_pdf_command=sdk_models.ApprouverPropositionParPdfCommand(**kwargs),
             **build_mandatory_auth_headers(person),
         )
@@ -23,10 +23,13 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+import bisect
 import datetime
 from functools import lru_cache
-from typing import List
+from operator import attrgetter
+from typing import Callable, Dict, FrozenSet, List, Optional
 
+from django.conf import settings
 from django.http import Http404
 from osis_reference_sdk import ApiClient, ApiException
 from osis_reference_sdk.api import (
@@ -42,22 +45,28 @@ from osis_reference_sdk.api import (
 from osis_reference_sdk.models.academic_year import AcademicYear
 
 from admission.contrib.enums.diploma import StudyType
+from admission.services.api_clients import prepare_api_client
+from admission.services.background import run_in_background
+from admission.services.cache import get_cache, stale_while_revalidate
 from admission.services.mixins import ServiceMeta
+from admission.services.single_flight import single_flight
 from base.models.person import Person
 from frontoffice.settings.osis_sdk import reference as reference_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
+from reference.services.scholarship import ScholarshipService
 
 
 class CountriesAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return countries_api.CountriesApi(ApiClient(configuration=api_config))
+        return countries_api.CountriesApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class CountriesService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @single_flight(per_person=False)
     def get_countries(cls, person=None, **kwargs):
         return (
             CountriesAPIClient()
@@ -87,16 +96,31 @@ class CountriesService(metaclass=ServiceMeta):
         return countries[0]
 
 
+CITIES_BY_POSTAL_CODE_CACHE_KEY = 'admission:cities_by_postal_code'
+CITIES_BY_POSTAL_CODE_LOCK_KEY = 'admission:cities_by_postal_code:lock'
+CITIES_BY_POSTAL_CODE_LOCK_TIMEOUT = 5 * 60
+CITIES_BY_POSTAL_CODE_PAGE_SIZE = 1000
+# The pages are loaded in a stable order so that no city is duplicated or skipped
+CITIES_BY_POSTAL_CODE_ORDERING = 'zip_code,name'
+
+
+def filter_city_names(city_names: List[str], search: str) -> List[str]:
+    """Return the names containing all the terms of the search, ignoring the case, as the web service does."""
+    terms = search.lower().split()
+    return [name for name in city_names if all(term in name.lower() for term in terms)]
+
+
 class CitiesAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return cities_api.CitiesApi(ApiClient(configuration=api_config))
+        return cities_api.CitiesApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class CitiesService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @single_flight(per_person=False)
     def get_cities(cls, person: 'Person' = None, **kwargs):
         return (
             CitiesAPIClient()
@@ -107,11 +131,139 @@ class CitiesService(metaclass=ServiceMeta):
             .results
         )
 
+    @classmethod
+    def get_cities_by_postal_code(cls, person: 'Person' = None) -> Optional[Dict[str, List[str]]]:
+        """
+        Return the names of the cities indexed by postal code, shared in the cache, or None if the index is not
+        loaded yet. In that case, it is loaded in the background (it can also be loaded when the application is
+        deployed, with the load_cities_by_postal_code management command).
+        """
+        cities_by_postal_code = get_cache().get(CITIES_BY_POSTAL_CODE_CACHE_KEY)
+        if cities_by_postal_code is None:
+            run_in_background(cls.load_cities_by_postal_code, person)
+        return cities_by_postal_code
+
+    @classmethod
+    def load_cities_by_postal_code(cls, person: 'Person' = None) -> Optional[Dict[str, List[str]]]:
+        """
+        Load the whole index of the cities by postal code in the cache and return it. If the index is already being
+        loaded (by any process sharing the cache), None is returned.
+        """
+        cache = get_cache()
+        if not cache.add(CITIES_BY_POSTAL_CODE_LOCK_KEY, True, CITIES_BY_POSTAL_CODE_LOCK_TIMEOUT):
+            return None
+
+        try:
+            cities_by_postal_code = {}
+            offset = 0
+            while True:
+                cities = (
+                    CitiesAPIClient()
+                    .cities_list(
+                        limit=CITIES_BY_POSTAL_CODE_PAGE_SIZE,
+                        offset=offset,
+                        ordering=CITIES_BY_POSTAL_CODE_ORDERING,
+                        **build_mandatory_auth_headers(person),
+                    )
+                    .results
+                )
+                for city in cities:
+                    cities_by_postal_code.setdefault(city.zip_code, set()).add(city.name)
+                if len(cities) < CITIES_BY_POSTAL_CODE_PAGE_SIZE:
+                    break
+                offset += CITIES_BY_POSTAL_CODE_PAGE_SIZE
+
+            cities_by_postal_code = {
+                postal_code: sorted(city_names) for postal_code, city_names in cities_by_postal_code.items()
+            }
+            cache.set(
+                CITIES_BY_POSTAL_CODE_CACHE_KEY,
+                cities_by_postal_code,
+                getattr(settings, 'ADMISSION_CITIES_CACHE_TIMEOUT', 60 * 60 * 24),
+            )
+            return cities_by_postal_code
+        finally:
+            cache.delete(CITIES_BY_POSTAL_CODE_LOCK_KEY)
+
 
 class AcademicYearAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return academic_years_api.AcademicYearsApi(ApiClient(configuration=api_config))
+        return academic_years_api.AcademicYearsApi(prepare_api_client(ApiClient(configuration=api_config)))
+
+
+def format_academic_year_label(academic_year):
+    return f"{academic_year.year}-{academic_year.year + 1}"
+
+
+class AcademicCalendar:
+    """
+    The academic years sorted by start date, with the academic year in progress on a given day and the choices of
+    the academic years. As the choices only depend on the years and on the day, they are built once per calendar.
+    The label formatting functions are part of the memoisation keys, so they must be defined at the module level.
+    """
+
+    def __init__(self, academic_years: List[AcademicYear], day: Optional[datetime.date] = None):
+        self.academic_years = sorted(academic_years, key=attrgetter('start_date'))
+        self.day = day or datetime.date.today()
+        self._start_dates = [academic_year.start_date for academic_year in self.academic_years]
+        self._choices = {}
+        self.current_year = self.get_year_at(self.day)
+
+    def get_year_at(self, date: datetime.date) -> Optional[int]:
+        """Return the academic year in progress at the date. If two years overlap, the most recent one is returned."""
+        index = bisect.bisect_right(self._start_dates, date)
+        for academic_year in reversed(self.academic_years[max(index - 2, 0) : index]):
+            if date <= academic_year.end_date:
+                return academic_year.year
+        return None
+
+    def get_choices(self, format_label: Callable = format_academic_year_label) -> tuple:
+        """Return the (year, label) choices of all the academic years."""
+        key = ('all', format_label)
+        if key not in self._choices:
+            self._choices[key] = tuple(
+                (academic_year.year, format_label(academic_year)) for academic_year in self.academic_years
+            )
+        return self._choices[key]
+
+    def get_past_choices(
+        self,
+        exclude_current=False,
+        current_year: Optional[int] = None,
+        window=100,
+        format_label: Callable = format_academic_year_label,
+        additional_years: FrozenSet[int] = frozenset(),
+    ) -> tuple:
+        """
+        Return the (year, label) choices of the academic years of the window ending with the current year (or the
+        previous one if the current year is excluded), and of the additional years.
+        """
+        if current_year is None:
+            current_year = self.current_year
+
+        if exclude_current:
+            current_year -= 1
+
+        lower_year = current_year - window
+
+        # Only the additional years outside the window change the choices
+        additional_years = frozenset(year for year in additional_years if not lower_year <= year <= current_year)
+        key = ('past', current_year, window, format_label)
+
+        if not additional_years and key in self._choices:
+            return self._choices[key]
+
+        choices = tuple(
+            (academic_year.year, format_label(academic_year))
+            for academic_year in self.academic_years
+            if current_year >= academic_year.year >= lower_year or academic_year.year in additional_years
+        )
+
+        if not additional_years:
+            self._choices[key] = choices
+
+        return choices
 
 
 class AcademicYearService(metaclass=ServiceMeta):
@@ -129,33 +281,37 @@ class AcademicYearService(metaclass=ServiceMeta):
             .results
         )
 
+    # The academic years are the same for all the candidates so the calendar is shared between them
+    @classmethod
+    @stale_while_revalidate(
+        'ACADEMIC_CALENDAR',
+        # The current year and the choices depend on the day
+        is_valid=lambda calendar: calendar.day == datetime.date.today(),
+    )
+    @single_flight(per_person=False)
+    def get_academic_calendar(cls, person) -> AcademicCalendar:
+        """Returns the academic calendar"""
+        return AcademicCalendar(cls.get_academic_years(person))
+
     @classmethod
     def get_current_academic_year(cls, person, academic_years=None):
         """Returns the current academic year"""
-        if not academic_years:
-            academic_years = cls.get_academic_years(person)
-
-        today_date = datetime.date.today()
-        return next(
-            (
-                academic_year.year
-                for academic_year in reversed(academic_years)
-                if academic_year.start_date <= today_date <= academic_year.end_date
-            ),
-            None,
-        )
+        if academic_years:
+            return AcademicCalendar(academic_years).current_year
+        return cls.get_academic_calendar(person).current_year
 
 
 class LanguagesAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return languages_api.LanguagesApi(ApiClient(configuration=api_config))
+        return languages_api.LanguagesApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class LanguageService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @single_flight(per_person=False)
     def get_languages(cls, person, **kwargs):
         return (
             LanguagesAPIClient()
@@ -184,13 +340,14 @@ class LanguageService(metaclass=ServiceMeta):
 class HighSchoolAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return high_schools_api.HighSchoolsApi(ApiClient(configuration=api_config))
+        return high_schools_api.HighSchoolsApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class HighSchoolService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @single_flight(per_person=False)
     def get_high_schools(cls, person, **kwargs):
         return (
             HighSchoolAPIClient()
@@ -212,13 +369,14 @@ class HighSchoolService(metaclass=ServiceMeta):
 class DiplomaAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return diplomas_api.DiplomasApi(ApiClient(configuration=api_config))
+        return diplomas_api.DiplomasApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class DiplomaService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @single_flight(per_person=False)
     def get_diplomas(cls, person, **kwargs):
         return (
             DiplomaAPIClient()
@@ -242,13 +400,16 @@ class DiplomaService(metaclass=ServiceMeta):
 class SuperiorNonUniversityAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return superior_non_universities_api.SuperiorNonUniversitiesApi(ApiClient(configuration=api_config))
+        return superior_non_universities_api.SuperiorNonUniversitiesApi(
+            prepare_api_client(ApiClient(configuration=api_config))
+        )
 
 
 class SuperiorNonUniversityService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @single_flight(per_person=False)
     def get_superior_non_universities(cls, person, **kwargs):
         return (
             SuperiorNonUniversityAPIClient()
@@ -272,13 +433,14 @@ class SuperiorNonUniversityService(metaclass=ServiceMeta):
 class UniversityAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return universities_api.UniversitiesApi(ApiClient(configuration=api_config))
+        return universities_api.UniversitiesApi(prepare_api_client(ApiClient(configuration=api_config)))
 
 
 class UniversityService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @single_flight(per_person=False)
     def get_universities(cls, person, **kwargs):
         return UniversityAPIClient().universities_list(
             limit=kwargs.pop('limit', 100),
@@ -308,3 +470,12 @@ class SuperiorInstituteService:
                 return UniversityService.get_university(person=person, uuid=uuid)
             except Http404:
                 return SuperiorNonUniversityService.get_superior_non_university(person=person, uuid=uuid)
+
+
+class CachedScholarshipService:
+    # The scholarships are the same for all the candidates so they are shared between them
+    @classmethod
+    @stale_while_revalidate('SCHOLARSHIPS')
+    @single_flight(per_person=False)
+    def get_scholarship(cls, person, scholarship_uuid):
+        return ScholarshipService.get_scholarship(person=person, scholarship_uuid=scholarship_uuid)
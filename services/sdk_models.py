@@ -0,0 +1,58 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import importlib
+import re
+
+__all__ = [
+    'LazySDKModels',
+    'get_model_module_name',
+]
+
+_WORD_BOUNDARY = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+
+
+def get_model_module_name(model_name):
+    """Return the name of the module defining a model of the SDKs (e.g. 'SupervisionDTO' -> 'supervision_dto')."""
+    return _WORD_BOUNDARY.sub('_', model_name).lower()
+
+
+class LazySDKModels:
+    """
+    Namespace of the models of a SDK, whose modules are only imported when a model is first used. The models of the
+    SDKs are generated in one module each and importing them is a significant part of the startup time of a worker.
+    """
+
+    def __init__(self, sdk_name):
+        self.sdk_name = sdk_name
+
+    def __getattr__(self, model_name):
+        if model_name.startswith('_'):
+            raise AttributeError(model_name)
+        module = importlib.import_module(f'{self.sdk_name}.model.{get_model_module_name(model_name)}')
+        model = getattr(module, model_name)
+        # Cache the model so that the next lookups do not go through __getattr__
+        setattr(self, model_name, model)
+        return model
@@ -0,0 +1,144 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import copy
+import functools
+import inspect
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+from admission.services.cache import get_cache, make_call_cache_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WAIT_TIMEOUT = 10
+CROSS_PROCESS_POLL_INTERVAL = 0.05
+
+_MISSING = object()
+
+
+class _InFlightCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+_in_flight_calls = {}
+_in_flight_calls_lock = threading.Lock()
+
+
+def _get_wait_timeout():
+    return getattr(settings, 'ADMISSION_SINGLE_FLIGHT_TIMEOUT', DEFAULT_WAIT_TIMEOUT)
+
+
+def _call_across_processes(key, func, args, kwargs):
+    """Share the call with the other processes through a lock and a short-lived result stored in the cache."""
+    cache = get_cache()
+    wait_timeout = _get_wait_timeout()
+    lock_key = f'{key}:lock'
+    result_key = f'{key}:result'
+
+    if cache.add(lock_key, True, wait_timeout):
+        try:
+            result = func(*args, **kwargs)
+            try:
+                cache.set(result_key, result, wait_timeout)
+            except Exception:
+                # The result can not be shared (e.g. it can not be pickled), the other processes will do the call
+                logger.debug("Result of %s can not be shared between processes", func.__qualname__)
+            return result
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        result = cache.get(result_key, _MISSING)
+        if result is not _MISSING:
+            return result
+        if cache.get(lock_key) is None:
+            break
+        time.sleep(CROSS_PROCESS_POLL_INTERVAL)
+
+    result = cache.get(result_key, _MISSING)
+    return func(*args, **kwargs) if result is _MISSING else result
+
+
+def single_flight(func=None, *, per_person=True):
+    """
+    Decorator of service methods that coalesces the identical calls made concurrently: the first one is made, the
+    other ones wait for it and get a copy of its result (or its exception).
+
+    Only idempotent methods must be decorated. The calls are identical if they have the same arguments and the same
+    language. The identity of the person is also considered, unless `per_person` is unset for the methods returning
+    the same data to all the persons (e.g. reference data). The calls are coalesced inside the current process and, if
+    the ADMISSION_SINGLE_FLIGHT_CROSS_PROCESS setting is enabled, across the processes sharing the cache.
+
+    The calls are only coalesced if the ADMISSION_SINGLE_FLIGHT_ENABLED setting is enabled.
+    """
+    if func is None:
+        return functools.partial(single_flight, per_person=per_person)
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not getattr(settings, 'ADMISSION_SINGLE_FLIGHT_ENABLED', False):
+            return func(*args, **kwargs)
+
+        key = make_call_cache_key('single_flight', func, signature, args, kwargs, per_person)
+
+        with _in_flight_calls_lock:
+            call = _in_flight_calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _in_flight_calls[key] = _InFlightCall()
+
+        if not is_leader:
+            if not call.done.wait(_get_wait_timeout()):
+                # The first call is too slow, don't wait any longer
+                return func(*args, **kwargs)
+            if call.exception is not None:
+                raise call.exception
+            return copy.deepcopy(call.result)
+
+        try:
+            if getattr(settings, 'ADMISSION_SINGLE_FLIGHT_CROSS_PROCESS', False):
+                call.result = _call_across_processes(key, func, args, kwargs)
+            else:
+                call.result = func(*args, **kwargs)
+            return call.result
+        except Exception as exception:
+            call.exception = exception
+            raise
+        finally:
+            with _in_flight_calls_lock:
+                del _in_flight_calls[key]
+            call.done.set()
+
+    return wrapper
@@ -0,0 +1,186 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import json
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+from admission.services.outbound_calls import get_current_service_method
+
+REDACTED = 'REDACTED'
+REDACTED_DATE = '1970-01-01'
+DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+# Names of the fields (of the payloads and of the query parameters) containing personal data
+DEFAULT_PII_RULES = [
+    r'(nom|prenom|prenoms|autres_prenoms)(_d_usage)?',
+    r'(first|last|middle)_names?(_in_use)?',
+    r'.*e?mail.*',
+    r'.*(telephone|phone|gsm).*',
+    r'.*(naissance|birth).*',
+    r'numero_.*',
+    r'.*(national|passport|id_card)_number',
+    r'.*(niss|iban|bic|passeport|passport|carte_identite|identity_card|id_card|id_photo).*',
+    r'matricule.*',
+    r'noma|last_registration_id',
+    r'global_id',
+    r'(rue|street|street_number|boite_postale|postal_box|lieu_dit|place)',
+    r'(ville|localite|city|code_postal|postal_code|zip_?code)',
+    r'(nationalite|nationality|country_of_citizenship)',
+    r'(sexe|genre|sex|gender)',
+    r'photo_identite',
+    r'q|search',
+]
+
+UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE)
+# Segments of the paths kept as is: names of the resources, years and codes (e.g. of the trainings and entities)
+PATH_SEGMENT_RE = re.compile(r'[a-z_-]*|\d{1,4}|[A-Z][A-Z0-9_]{0,19}')
+
+_write_lock = threading.Lock()
+
+
+def get_pii_rules():
+    rules = getattr(settings, 'ADMISSION_TRAFFIC_CAPTURE_PII_RULES', DEFAULT_PII_RULES)
+    return re.compile('|'.join(f'(?:{rule})' for rule in rules), re.IGNORECASE)
+
+
+def redact_value(value):
+    if isinstance(value, str):
+        # Keep the format of the dates so that the payloads can still be deserialized
+        return REDACTED_DATE if DATE_RE.match(value) else REDACTED
+    if isinstance(value, list):
+        return []
+    if isinstance(value, dict):
+        return {}
+    return None
+
+
+def sanitize(data, pii_rules):
+    """Return a copy of the JSON data whose values of the personal fields are redacted."""
+    if isinstance(data, dict):
+        return {
+            key: redact_value(value) if pii_rules.fullmatch(str(key)) else sanitize(value, pii_rules)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [sanitize(value, pii_rules) for value in data]
+    return data
+
+
+def sanitize_path(path):
+    """
+    Return the path of a request whose uuids are replaced by '{uuid}', and whose other variable segments (e.g. the
+    global ids or the search terms) are redacted.
+    """
+    return '/'.join(
+        '{uuid}' if UUID_RE.fullmatch(segment) else segment if PATH_SEGMENT_RE.fullmatch(segment) else REDACTED
+        for segment in path.split('/')
+    )
+
+
+def _normalize_query_params(query_params):
+    items = query_params.items() if isinstance(query_params, dict) else query_params or []
+    params = {}
+    for name, value in items:
+        params.setdefault(name, []).extend(value if isinstance(value, (list, tuple)) else [value])
+    return params
+
+
+def _get_payload_size(payload):
+    if payload is None:
+        return 0
+    if isinstance(payload, (bytes, str)):
+        return len(payload)
+    return len(json.dumps(payload, default=str))
+
+
+def _load_json(data):
+    try:
+        return json.loads(data)
+    except (TypeError, ValueError):
+        return None
+
+
+def write_record(path, record):
+    with _write_lock, open(path, 'a') as capture_file:
+        capture_file.write(json.dumps(record, default=str) + '\n')
+
+
+def capture_traffic(api_client, sdk_name):
+    """
+    Record the requests made by the api client, and their responses, in the file defined by the
+    ADMISSION_TRAFFIC_CAPTURE_FILE setting (one JSON object per line). The headers are not recorded, the paths are
+    sanitized (see `sanitize_path`) and the personal data are redacted according to the
+    ADMISSION_TRAFFIC_CAPTURE_PII_RULES setting (regular expressions matching the names of the fields, see
+    DEFAULT_PII_RULES).
+    """
+    capture_path = settings.ADMISSION_TRAFFIC_CAPTURE_FILE
+    rest_client = api_client.rest_client
+    request = rest_client.request
+    service_method = get_current_service_method()
+    host_path = urlsplit(api_client.configuration.host).path.rstrip('/')
+
+    def capturing_request(method, url, query_params=None, headers=None, body=None, post_params=None, **kwargs):
+        start_time = time.time()
+        start = time.perf_counter()
+        status, data = None, None
+        try:
+            response = request(method, url, query_params, headers, body, post_params, **kwargs)
+            status = response.status
+            if kwargs.get('_preload_content', True):
+                data = response.data
+            return response
+        except Exception as exception:
+            status = getattr(exception, 'status', None)
+            data = getattr(exception, 'body', None)
+            raise
+        finally:
+            latency = time.perf_counter() - start
+            pii_rules = get_pii_rules()
+            path = urlsplit(url).path
+            if path.startswith(host_path):
+                path = path[len(host_path) :]
+            write_record(
+                capture_path,
+                {
+                    'timestamp': start_time,
+                    'service_method': service_method,
+                    'sdk': sdk_name,
+                    'method': method,
+                    'path': sanitize_path(path),
+                    'query': sanitize(_normalize_query_params(query_params), pii_rules),
+                    'status': status,
+                    'latency': latency,
+                    'request_size': _get_payload_size(body if body is not None else post_params),
+                    'response_size': None if data is None else _get_payload_size(data),
+                    'response': sanitize(_load_json(data), pii_rules),
+                },
+            )
+
+    rest_client.request = capturing_request
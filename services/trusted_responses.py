@@ -0,0 +1,177 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+import functools
+import json
+
+from dateutil.parser import isoparse
+from django.conf import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = [
+    'ResponseView',
+    'call_trusted_endpoint',
+    'convert_response_data',
+    'loads',
+]
+
+loads = orjson.loads if orjson is not None else json.loads
+
+
+@functools.lru_cache(maxsize=None)
+def _get_model_kind(model):
+    """Return 'simple' for the enumerations of the SDKs, 'model' for their other models and None otherwise."""
+    base_names = {base.__name__ for base in getattr(model, '__mro__', [])}
+    if 'ModelSimple' in base_names:
+        return 'simple'
+    if 'ModelNormal' in base_names or 'ModelComposed' in base_names:
+        return 'model'
+    return None
+
+
+def _parse_date(value, date_type):
+    try:
+        return date_type.fromisoformat(value)
+    except ValueError:
+        # Less common ISO 8601 formats
+        parsed_value = isoparse(value)
+        return parsed_value if date_type is datetime.datetime else parsed_value.date()
+
+
+def convert_response_data(value, types):
+    """
+    Convert a value decoded from JSON to one of the types of the SDKs (e.g. `(DoctoratePropositionDTO, none_type)`,
+    `([SupervisionActor],)`, `(date,)`). The dates are parsed and the objects of the models are wrapped in read-only
+    views, the other values are not checked.
+    """
+    if value is None or type(value) in types:
+        return value
+    for type_ in types:
+        if isinstance(type_, list):
+            if isinstance(value, list):
+                return [convert_response_data(item, type_) for item in value]
+        elif isinstance(type_, dict):
+            if isinstance(value, dict):
+                item_types = next(iter(type_.values()))
+                return {key: convert_response_data(item, item_types) for key, item in value.items()}
+        elif type_ is datetime.datetime or type_ is datetime.date:
+            if isinstance(value, str):
+                return _parse_date(value, type_)
+        elif _get_model_kind(type_) == 'simple':
+            return type_(value)
+        elif _get_model_kind(type_) == 'model':
+            if isinstance(value, dict):
+                return ResponseView(type_, value)
+    return value
+
+
+class ResponseView:
+    """
+    Read-only view of a JSON object returned by the web services, with the same attributes as the model of the SDKs
+    describing it. Unlike the models, the values are not validated and they are only converted when they are first
+    read. The fields of the model cannot be modified but other attributes can be added (e.g. for the display).
+    """
+
+    __slots__ = ('_model', '_data', '_values')
+
+    def __init__(self, model, data):
+        object.__setattr__(self, '_model', model)
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_values', {})
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        try:
+            types = self._model.openapi_types[name]
+            raw_value = self._data[self._model.attribute_map.get(name, name)]
+        except KeyError:
+            raise AttributeError(f"{self._model.__name__} has no attribute '{name}'") from None
+        value = self._values[name] = convert_response_data(raw_value, types)
+        return value
+
+    def __setattr__(self, name, value):
+        if name in self._model.attribute_map:
+            raise AttributeError(f"The '{name}' field of a response view cannot be modified")
+        self._values[name] = value
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __contains__(self, name):
+        return name in self._values or self._model.attribute_map.get(name, name) in self._data
+
+    def __reduce__(self):
+        return self.__class__, (self._model, self._data)
+
+    def __repr__(self):
+        return f'<ResponseView {self._model.__name__}>'
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def to_dict(self):
+        """Return the fields as a dictionary, like the to_dict method of the models."""
+        return {
+            name: _to_python(getattr(self, name))
+            for name, json_name in self._model.attribute_map.items()
+            if json_name in self._data
+        }
+
+
+def _to_python(value):
+    if isinstance(value, ResponseView):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_python(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_python(item) for key, item in value.items()}
+    if _get_model_kind(type(value)) == 'simple':
+        return value.value
+    return value
+
+
+def call_trusted_endpoint(endpoint, **kwargs):
+    """
+    Call an endpoint of the SDKs (e.g. `APIClient().list_propositions`) whose response is only read. If the
+    ADMISSION_TRUSTED_RESPONSES setting is enabled, the JSON response is decoded without the validation of the models
+    (with orjson if it is installed) and the objects are returned as read-only views (see ResponseView).
+    """
+    if not getattr(settings, 'ADMISSION_TRUSTED_RESPONSES', False):
+        return endpoint(**kwargs)
+    response = endpoint(_preload_content=False, **kwargs)
+    return convert_response_data(loads(response.data), endpoint.settings['response_type'])
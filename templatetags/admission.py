@@ -29,7 +29,7 @@ import re
 from contextlib import suppress
 from dataclasses import dataclass
 from inspect import getfullargspec
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from bootstrap3.forms import render_field
 from bootstrap3.renderers import FieldRenderer
@@ -50,8 +50,6 @@ from osis_admission_sdk.exceptions import (
     NotFoundException,
     UnauthorizedException,
 )
-from osis_admission_sdk.model.membre_cadto_nested import MembreCADTONested
-from osis_admission_sdk.model.promoteur_dto_nested import PromoteurDTONested
 
 from admission.constants import READ_ACTIONS_BY_TAB, UPDATE_ACTIONS_BY_TAB
 from admission.contrib.enums import (
@@ -88,6 +86,10 @@ from admission.utils import (
     to_snake_case,
 )
 
+if TYPE_CHECKING:
+    from osis_admission_sdk.model.membre_cadto_nested import MembreCADTONested
+    from osis_admission_sdk.model.promoteur_dto_nested import PromoteurDTONested
+
 register = template.Library()
 
 
@@ -239,6 +241,12 @@ TAB_TREES = {
     },
 }
 
+# Sub tabs of each tab tree, indexed by their name
+SUBTABS_BY_NAME = {
+    tab_tree_name: {subtab.name: subtab for subtabs in tab_tree.values() for subtab in subtabs}
+    for tab_tree_name, tab_tree in TAB_TREES.items()
+}
+
 
 def _get_active_parent(tab_tree, tab_name):
     return next(
@@ -326,9 +334,7 @@ def admission_tabs(context, admission=None, with_submit=False):
 
 
 def get_subtab_label(tab_name, tab_tree_name):
-    return next(
-        subtab for subtabs in TAB_TREES[tab_tree_name].values() for subtab in subtabs if subtab.name == tab_name
-    ).label  # pragma : no branch
+    return SUBTABS_BY_NAME[tab_tree_name][tab_name].label
 
 
 @register.simple_tag(takes_context=True)
@@ -0,0 +1,183 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+from unittest.mock import patch
+
+from django.shortcuts import resolve_url
+from django.template.backends.django import Template
+
+__all__ = [
+    'Journey',
+    'JourneyRunner',
+    'JourneyStep',
+    'StepMeasure',
+    'compare_with_baseline',
+    'format_report',
+    'load_baseline',
+    'save_baseline',
+]
+
+
+class JourneyStep(NamedTuple):
+    """A request of a journey, to the url of the `url_name` view."""
+
+    name: str
+    url_name: str
+    url_kwargs: Dict = {}
+    method: str = 'get'
+    data: Optional[Dict] = None
+
+
+class Journey(NamedTuple):
+    """A scripted sequence of requests made by a user."""
+
+    name: str
+    steps: List[JourneyStep]
+
+
+class StepMeasure(NamedTuple):
+    journey: str
+    step: str
+    status_code: int
+    wall_time: float
+    cpu_time: float
+    render_time: float
+    calls: int
+    transferred_bytes: int
+
+    @property
+    def key(self):
+        return f'{self.journey}:{self.step}'
+
+
+class _RenderTimer:
+    def __init__(self):
+        self.total = 0.0
+
+    @contextmanager
+    def measure(self):
+        original_render = Template.render
+        timer = self
+
+        def render(template, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original_render(template, *args, **kwargs)
+            finally:
+                timer.total += time.perf_counter() - start
+
+        with patch.object(Template, 'render', render):
+            yield self
+
+
+class JourneyRunner:
+    """
+    Run journeys with the Django test client against a stub backend (see admission.tests.stub_backend) and measure
+    each request: wall time, CPU time of the request thread, template rendering time (of the top-level templates),
+    number of calls to the backend and bytes exchanged with it.
+    """
+
+    def __init__(self, client, stub_backend):
+        self.client = client
+        self.stub_backend = stub_backend
+
+    def run_step(self, journey: Journey, step: JourneyStep) -> StepMeasure:
+        url = resolve_url(step.url_name, **step.url_kwargs)
+        self.stub_backend.reset_calls()
+        with _RenderTimer().measure() as render_timer:
+            start_cpu_time = time.thread_time()
+            start_wall_time = time.perf_counter()
+            response = getattr(self.client, step.method)(url, data=step.data)
+            wall_time = time.perf_counter() - start_wall_time
+            cpu_time = time.thread_time() - start_cpu_time
+        calls = list(self.stub_backend.calls)
+        return StepMeasure(
+            journey=journey.name,
+            step=step.name,
+            status_code=response.status_code,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            render_time=render_timer.total,
+            calls=len(calls),
+            transferred_bytes=sum(call.request_size + call.response_size for call in calls),
+        )
+
+    def run(self, journey: Journey) -> List[StepMeasure]:
+        return [self.run_step(journey, step) for step in journey.steps]
+
+
+def load_baseline(path: Path) -> Dict[str, Dict]:
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_baseline(path: Path, measures: List[StepMeasure]):
+    path.write_text(json.dumps({measure.key: measure._asdict() for measure in measures}, indent=2, sort_keys=True))
+
+
+def compare_with_baseline(measures: List[StepMeasure], baseline: Dict[str, Dict]) -> List[str]:
+    """
+    Return the regressions compared to the baseline, and the steps missing from it. Only the call counts are compared,
+    the timings are noisy.
+    """
+    return [
+        (
+            f'{measure.key}: not in the baseline'
+            if measure.key not in baseline
+            else f'{measure.key}: {measure.calls} calls instead of {baseline[measure.key]["calls"]}'
+        )
+        for measure in measures
+        if measure.key not in baseline or measure.calls > baseline[measure.key]['calls']
+    ]
+
+
+def _format_delta(value, reference):
+    if not reference:
+        return ''
+    return f' ({(value - reference) / reference:+.0%})'
+
+
+def format_report(measures: List[StepMeasure], baseline: Dict[str, Dict]) -> str:
+    lines = [
+        f'{"step":<50} {"status":>6} {"wall (ms)":>18} {"cpu (ms)":>18} {"render (ms)":>18} {"calls":>6} {"bytes":>9}'
+    ]
+    for measure in measures:
+        reference = baseline.get(measure.key, {})
+        timings = ' '.join(
+            f'{value * 1000:>8.1f}{_format_delta(value, reference.get(field)):>10}'
+            for field, value in [
+                ('wall_time', measure.wall_time),
+                ('cpu_time', measure.cpu_time),
+                ('render_time', measure.render_time),
+            ]
+        )
+        lines.append(
+            f'{measure.key:<50} {measure.status_code:>6} {timings} {measure.calls:>6} {measure.transferred_bytes:>9}'
+        )
+    return '\n'.join(lines)
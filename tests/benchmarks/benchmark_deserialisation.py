@@ -0,0 +1,153 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+"""
+Benchmark of the deserialisation of large responses of the web services, by the models of the SDKs and by the
+trusted responses (see admission.services.trusted_responses). It is not part of the test suite and must be run
+explicitly:
+
+    ./manage.py test admission.tests.benchmarks.benchmark_deserialisation
+
+The responses are generated from the types of the models, with lists of increasing sizes. For each payload, the report
+gives the CPU time and the peak of memory allocated to deserialise it, and to deserialise it and read all its values
+(as the values of the trusted responses are only converted when they are read).
+
+Environment variables:
+- ADMISSION_BENCHMARK_PAYLOAD_SIZES: comma-separated numbers of items of the lists (1,10,50 by default);
+- ADMISSION_BENCHMARK_REPETITIONS: number of deserialisations measured per payload (5 by default).
+"""
+import datetime
+import json
+import os
+import time
+import tracemalloc
+from typing import NamedTuple
+
+from django.test import SimpleTestCase
+from osis_admission_sdk import ApiClient
+from osis_admission_sdk.api import person_api, propositions_api
+
+from admission.services.trusted_responses import convert_response_data, loads
+
+# Lists nested in other lists have a fixed size to keep the payloads realistic
+NESTED_LIST_SIZE = 3
+
+
+def generate_value(types, list_size, list_depth=0):
+    """Generate a JSON value of one of the types of the SDKs."""
+    type_ = next(type_ for type_ in types if type_ is not type(None))
+    if isinstance(type_, list):
+        size = list_size if list_depth == 0 else NESTED_LIST_SIZE
+        return [generate_value(type_, list_size, list_depth + 1) for _ in range(size)]
+    if isinstance(type_, dict):
+        return {'key': generate_value(next(iter(type_.values())), list_size, list_depth)}
+    if type_ is datetime.datetime:
+        return '2023-01-02T10:11:12.123456+01:00'
+    if type_ is datetime.date:
+        return '2023-01-02'
+    if type_ is bool:
+        return True
+    if type_ in (int, float):
+        return 2023
+    if hasattr(type_, 'allowed_values') and type_.allowed_values.get(('value',)):
+        return next(iter(type_.allowed_values[('value',)].values()))
+    if hasattr(type_, 'openapi_types'):
+        if 'value' in type_.openapi_types and not type_.attribute_map:
+            return generate_value(type_.openapi_types['value'], list_size, list_depth)
+        return {
+            type_.attribute_map[name]: generate_value(field_types, list_size, list_depth)
+            for name, field_types in type_.openapi_types.items()
+            if name in type_.attribute_map
+        }
+    return 'value'
+
+
+def read_all(value):
+    """Read all the values of a deserialised response."""
+    if isinstance(value, list):
+        return [read_all(item) for item in value]
+    return value.to_dict()
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def getheader(self, name, default=None):
+        return 'application/json' if name.lower() == 'content-type' else default
+
+
+class DeserialisationMeasure(NamedTuple):
+    cpu_time: float
+    peak_memory: int
+
+
+def measure(func, repetitions):
+    """Return the mean CPU time, in seconds, and the peak of memory allocated, in bytes, of a function."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    start = time.process_time()
+    for _ in range(repetitions):
+        func()
+    return DeserialisationMeasure((time.process_time() - start) / repetitions, peak_memory)
+
+
+class DeserialisationBenchmark(SimpleTestCase):
+    def test_deserialisation(self):
+        api_client = ApiClient()
+        endpoints = {
+            'list_propositions': propositions_api.PropositionsApi(api_client).list_propositions,
+            'list_supervised_propositions': propositions_api.PropositionsApi(api_client).list_supervised_propositions,
+            'retrieve_curriculum_details': person_api.PersonApi(api_client).retrieve_curriculum_details,
+        }
+        sizes = [int(size) for size in os.environ.get('ADMISSION_BENCHMARK_PAYLOAD_SIZES', '1,10,50').split(',')]
+        repetitions = int(os.environ.get('ADMISSION_BENCHMARK_REPETITIONS', 5))
+
+        lines = [
+            f'{"endpoint":<30} {"items":>6} {"kB":>8} {"mode":<8} '
+            f'{"decode (ms)":>12} {"decode (kB)":>12} {"read (ms)":>10} {"read (kB)":>10}'
+        ]
+        for name, endpoint in endpoints.items():
+            response_type = endpoint.settings['response_type']
+            for size in sizes:
+                payload = json.dumps(generate_value(response_type, size)).encode()
+                response = FakeResponse(payload)
+                decoders = {
+                    'sdk': lambda: api_client.deserialize(response, response_type, True),
+                    'trusted': lambda: convert_response_data(loads(payload), response_type),
+                }
+                for mode, decode in decoders.items():
+                    decode_measure = measure(decode, repetitions)
+                    read_measure = measure(lambda: read_all(decode()), repetitions)
+                    lines.append(
+                        f'{name:<30} {size:>6} {len(payload) / 1024:>8.1f} {mode:<8} '
+                        f'{decode_measure.cpu_time * 1000:>12.2f} {decode_measure.peak_memory / 1024:>12.1f} '
+                        f'{read_measure.cpu_time * 1000:>10.2f} {read_measure.peak_memory / 1024:>10.1f}'
+                    )
+        print('\n' + '\n'.join(lines))
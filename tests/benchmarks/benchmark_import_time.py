@@ -0,0 +1,138 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+"""
+Benchmark of the time spent to import the main modules of the application by a new worker, measured with
+`python -X importtime`. It is not part of the test suite and must be run explicitly:
+
+    ./manage.py test admission.tests.benchmarks.benchmark_import_time
+
+Each module is imported in a new interpreter, once django is set up. The report lists the time spent to import each
+module and the modules that take the most time to import.
+
+Environment variables:
+- ADMISSION_BENCHMARK_IMPORT_BUDGETS: JSON object overriding the time budgets, in milliseconds, by module (see
+  IMPORT_TIME_BUDGETS);
+- ADMISSION_BENCHMARK_IMPORT_REPORT_SIZE: number of the slowest modules listed in the report (15 by default).
+
+The benchmark fails if a module takes longer to import than its budget, or if it imports the models of a SDK while
+they should only be imported when they are used.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple
+
+from django.test import SimpleTestCase
+
+# Time budgets, in milliseconds, to import each module once django is set up
+IMPORT_TIME_BUDGETS = {
+    'admission.services.proposition': 150,
+    'admission.templatetags.admission': 1500,
+    'admission.urls': 3000,
+}
+# Modules that must not import the models of the SDKs
+LAZY_SDK_MODELS_MODULES = ['admission.services.proposition']
+SDK_MODEL_MODULE = re.compile(r'^osis_\w+_sdk\.model\.')
+
+SETUP_END_MARKER = 'admission-benchmark-setup-end'
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)$')
+
+
+class ImportMeasure(NamedTuple):
+    """Time spent to import a module, in microseconds, without (self_time) and with (cumulative_time) its imports."""
+
+    module: str
+    self_time: int
+    cumulative_time: int
+
+
+def measure_import(module: str) -> List[ImportMeasure]:
+    """Import a module in a new interpreter, once django is set up, and return the measures of the imported modules."""
+    code = (
+        'import sys, django; django.setup(); '
+        f'print({SETUP_END_MARKER!r}, file=sys.stderr, flush=True); '
+        f'import {module}'
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        check=True,
+    )
+    return parse_import_times(result.stderr.split(SETUP_END_MARKER, 1)[-1])
+
+
+def parse_import_times(output: str) -> List[ImportMeasure]:
+    """Parse the output of `python -X importtime`."""
+    measures = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_time, cumulative_time, module = match.groups()
+            measures.append(ImportMeasure(module, int(self_time), int(cumulative_time)))
+    return measures
+
+
+def format_import_report(measures_by_module: Dict[str, List[ImportMeasure]], budgets: Dict[str, float], size: int):
+    lines = [f'{"module":<60} {"import (ms)":>12} {"budget (ms)":>12} {"modules":>8} {"sdk models":>11}']
+    for module, measures in measures_by_module.items():
+        lines.append(
+            f'{module:<60} {get_import_time(module, measures):>12.1f} {budgets.get(module, ""):>12} '
+            f'{len(measures):>8} {len(get_sdk_model_modules(measures)):>11}'
+        )
+        slowest = sorted(measures, key=lambda measure: measure.self_time, reverse=True)[:size]
+        lines += [f'    {measure.module:<56} {measure.self_time / 1000:>12.1f}' for measure in slowest]
+    return '\n'.join(lines)
+
+
+def get_import_time(module: str, measures: List[ImportMeasure]) -> float:
+    """Return the time spent to import a module, in milliseconds."""
+    return next((measure.cumulative_time / 1000 for measure in measures if measure.module == module), 0)
+
+
+def get_sdk_model_modules(measures: List[ImportMeasure]) -> List[str]:
+    return [measure.module for measure in measures if SDK_MODEL_MODULE.match(measure.module)]
+
+
+class ImportTimeBenchmark(SimpleTestCase):
+    def test_import_time(self):
+        budgets = {**IMPORT_TIME_BUDGETS, **json.loads(os.environ.get('ADMISSION_BENCHMARK_IMPORT_BUDGETS', '{}'))}
+        measures_by_module = {module: measure_import(module) for module in budgets}
+
+        report_size = int(os.environ.get('ADMISSION_BENCHMARK_IMPORT_REPORT_SIZE', 15))
+        print(f'\n{format_import_report(measures_by_module, budgets, report_size)}')
+
+        failures = []
+        for module, measures in measures_by_module.items():
+            import_time = get_import_time(module, measures)
+            if import_time > budgets[module]:
+                failures.append(f'{module}: {import_time:.1f} ms to import (budget: {budgets[module]} ms)')
+            if module in LAZY_SDK_MODELS_MODULES and get_sdk_model_modules(measures):
+                failures.append(f'{module}: imports {", ".join(get_sdk_model_modules(measures))}')
+        self.assertFalse(failures, '\n'.join(failures))
@@ -0,0 +1,159 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+"""
+Benchmarks of the candidate and promoter journeys, run against a stub backend. They are not part of the test suite
+and must be run explicitly:
+
+    ./manage.py test admission.tests.benchmarks.benchmark_journeys
+
+Environment variables:
+- ADMISSION_BENCHMARK_FIXTURES: comma-separated fixture files of the stub backend (the fixtures of the stub backend
+  by default, other files must provide the data of the propositions PROPOSITION_UUID and SUPERVISED_PROPOSITION_UUIDS,
+  e.g. recorded from a real session);
+- ADMISSION_BENCHMARK_LATENCY: latency of the stub backend, in seconds (0.02 by default);
+- ADMISSION_BENCHMARK_EXPERIENCES: number of educational experiences visited in the curriculum (3 by default);
+- ADMISSION_BENCHMARK_SETTINGS: JSON object of settings to override (e.g. to enable the caches);
+- ADMISSION_BENCHMARK_BASELINE: path of the baseline file (baseline.json next to this file by default);
+- ADMISSION_BENCHMARK_UPDATE_BASELINE: if set, the baseline is replaced by the new measures.
+
+The benchmark fails if a request is not successful, is not in the baseline or makes more calls to the backend than in
+the baseline.
+"""
+import json
+import os
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+
+from admission.tests.benchmarks import (
+    Journey,
+    JourneyRunner,
+    JourneyStep,
+    compare_with_baseline,
+    format_report,
+    load_baseline,
+    save_baseline,
+)
+from admission.tests.stub_backend import DEFAULT_FIXTURES, StubBackendTestMixin
+from base.tests.factories.person import PersonFactory
+
+CANDIDATE_GLOBAL_ID = '00345678'
+PROMOTER_GLOBAL_ID = '00987654'
+PROPOSITION_UUID = '3c5cdc60-2537-4a12-a396-64d2e9e34876'
+EXPERIENCE_UUIDS = [f'9cbdf4db-2454-4cbf-9e48-55d2a9881e{index:02d}' for index in range(100)]
+SUPERVISED_PROPOSITION_UUIDS = [
+    '0f4ec8d2-ec69-4a1c-b2e3-6b1ee5c3ad01',
+    '0f4ec8d2-ec69-4a1c-b2e3-6b1ee5c3ad02',
+]
+
+
+def get_candidate_journeys(experiences_number):
+    pk = {'pk': PROPOSITION_UUID}
+    return [
+        Journey('dashboard', [JourneyStep('list', 'admission:list')]),
+        Journey(
+            'create',
+            [
+                JourneyStep('person', 'admission:create:person'),
+                JourneyStep('coordonnees', 'admission:create:coordonnees'),
+                JourneyStep('training-choice', 'admission:create:training-choice'),
+                JourneyStep('education', 'admission:create:education'),
+                JourneyStep('curriculum', 'admission:create:curriculum'),
+            ],
+        ),
+        Journey(
+            'doctorate',
+            [
+                JourneyStep('person', 'admission:doctorate:update:person', pk),
+                JourneyStep('coordonnees', 'admission:doctorate:update:coordonnees', pk),
+                JourneyStep('training-choice', 'admission:doctorate:update:training-choice', pk),
+                JourneyStep('curriculum', 'admission:doctorate:update:curriculum', pk),
+                *[
+                    JourneyStep(
+                        f'educational-experience-{index}',
+                        'admission:doctorate:update:curriculum:educational_update',
+                        {**pk, 'experience_id': experience_uuid},
+                    )
+                    for index, experience_uuid in enumerate(EXPERIENCE_UUIDS[:experiences_number])
+                ],
+                JourneyStep('languages', 'admission:doctorate:update:languages', pk),
+                JourneyStep('confirm-submit', 'admission:doctorate:update:confirm-submit', pk),
+            ],
+        ),
+    ]
+
+
+def get_promoter_journeys():
+    steps = [JourneyStep('supervised-list', 'admission:supervised-list')]
+    for index, uuid in enumerate(SUPERVISED_PROPOSITION_UUIDS):
+        steps += [
+            JourneyStep(f'{index}-{tab}', f'admission:doctorate:{tab}', {'pk': uuid})
+            for tab in ['project', 'person', 'curriculum', 'supervision']
+        ]
+    return [Journey('promoter', steps)]
+
+
+class JourneysBenchmark(StubBackendTestMixin, TestCase):
+    stub_backend_fixtures = os.environ.get('ADMISSION_BENCHMARK_FIXTURES', ','.join(DEFAULT_FIXTURES)).split(',')
+    stub_backend_latency = float(os.environ.get('ADMISSION_BENCHMARK_LATENCY', 0.02))
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.candidate = PersonFactory(global_id=CANDIDATE_GLOBAL_ID)
+        cls.promoter = PersonFactory(global_id=PROMOTER_GLOBAL_ID)
+
+    def setUp(self):
+        super().setUp()
+        settings_override = override_settings(**json.loads(os.environ.get('ADMISSION_BENCHMARK_SETTINGS', '{}')))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.baseline_path = Path(
+            os.environ.get('ADMISSION_BENCHMARK_BASELINE', Path(__file__).with_name('baseline.json'))
+        )
+
+    def test_journeys(self):
+        runner = JourneyRunner(self.client, self.stub_backend)
+        measures = []
+
+        self.client.force_login(self.candidate.user)
+        for journey in get_candidate_journeys(int(os.environ.get('ADMISSION_BENCHMARK_EXPERIENCES', 3))):
+            measures += runner.run(journey)
+
+        self.client.force_login(self.promoter.user)
+        for journey in get_promoter_journeys():
+            measures += runner.run(journey)
+
+        baseline = load_baseline(self.baseline_path)
+        print(f'\n{format_report(measures, baseline)}')
+
+        failed_steps = [f'{measure.key}: {measure.status_code}' for measure in measures if measure.status_code >= 400]
+        self.assertFalse(failed_steps, '\n'.join(failed_steps))
+
+        if os.environ.get('ADMISSION_BENCHMARK_UPDATE_BASELINE'):
+            save_baseline(self.baseline_path, measures)
+        else:
+            regressions = compare_with_baseline(measures, baseline)
+            self.assertFalse(regressions, '\n'.join(regressions))
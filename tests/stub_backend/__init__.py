@@ -0,0 +1,366 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http import HTTPStatus
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from typing import List, Optional
+from urllib.parse import parse_qs, urlencode
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from django.test import override_settings
+
+__all__ = [
+    'DEFAULT_FIXTURES',
+    'DEFAULT_FIXTURES_DIR',
+    'StubBackend',
+    'StubBackendTestMixin',
+    'StubCall',
+    'StubEndpoint',
+    'filter_results',
+    'paginate',
+]
+
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+DEFAULT_FIXTURES = ['reference.json', 'admission.json', 'organisation.json', 'education_group.json']
+PATH_PARAMETER_RE = re.compile(r'{(\w+)}')
+# Query parameters of the list endpoints that are not filters on the fields of the results
+PAGINATION_PARAMETERS = {'limit', 'offset'}
+SEARCH_PARAMETER = 'search'
+ORDERING_PARAMETER = 'ordering'
+
+
+def _matches_filter(value, expected):
+    if isinstance(value, bool):
+        return str(value).lower() == expected.lower()
+    return str(value) == expected
+
+
+def filter_results(results: List, query: dict) -> List:
+    """
+    Apply the query parameters to the results of a list endpoint, as the web services do:
+    - a parameter named as a field of the results keeps the results having this value (the other parameters, e.g.
+      the language, are ignored);
+    - `search` keeps the results whose text fields contain all the searched terms;
+    - `ordering` sorts the results by the specified fields (prefixed by '-' to sort in descending order).
+    """
+    for name, values in query.items():
+        if name in PAGINATION_PARAMETERS or name == ORDERING_PARAMETER:
+            continue
+        if name == SEARCH_PARAMETER:
+            terms = values[-1].lower().split()
+            results = [
+                result
+                for result in results
+                if all(
+                    any(isinstance(value, str) and term in value.lower() for value in result.values()) for term in terms
+                )
+            ]
+        else:
+            results = [result for result in results if name not in result or _matches_filter(result[name], values[-1])]
+
+    if ORDERING_PARAMETER in query:
+        # Sort by the last field first as the sort is stable
+        for field in reversed(query[ORDERING_PARAMETER][-1].split(',')):
+            name = field.lstrip('-')
+            results = sorted(
+                results,
+                key=lambda result: (result.get(name) is None, result.get(name)),
+                reverse=field.startswith('-'),
+            )
+    return results
+
+
+def paginate(body: dict, query: dict, url: str) -> dict:
+    """Return the page of a paginated body (with `count`, `next`, `previous` and `results`) requested by the query."""
+    results = body['results']
+    offset = int(query.get('offset', [0])[-1])
+    limit = int(query['limit'][-1]) if 'limit' in query else len(results)
+
+    def page_url(page_offset):
+        page_query = {name: values[-1] for name, values in query.items()}
+        return f'{url}?{urlencode({**page_query, "limit": limit, "offset": page_offset})}'
+
+    return {
+        **body,
+        'count': len(results),
+        'next': page_url(offset + limit) if offset + limit < len(results) else None,
+        'previous': page_url(max(0, offset - limit)) if offset and limit else None,
+        'results': results[offset : offset + limit],
+    }
+
+
+class StubEndpoint:
+    """An endpoint of the stub backend, answering with a fixed response after a simulated latency."""
+
+    def __init__(self, sdk, method, path, body=None, status=HTTPStatus.OK, headers=None, latency=None, jitter=None):
+        self.sdk = sdk
+        self.method = method.upper()
+        self.path = path
+        self.path_re = self.compile_path(path)
+        self.body = body
+        self.status = int(status)
+        self.headers = headers or {}
+        self.latency = latency
+        self.jitter = jitter
+
+    @staticmethod
+    def compile_path(path):
+        """Compile a path whose parameters are written as in the OpenAPI schemas, e.g. '/propositions/{uuid}'."""
+        parts = PATH_PARAMETER_RE.split(path.rstrip('/'))
+        # The odd parts are the names of the parameters
+        pattern = ''.join(re.escape(part) if i % 2 == 0 else f'(?P<{part}>[^/]+)' for i, part in enumerate(parts))
+        return re.compile(f'^{pattern}/?$')
+
+    def matches(self, sdk, method, path):
+        return self.sdk == sdk and self.method == method and self.path_re.match(path) is not None
+
+    def get_body(self, query: dict, url: str):
+        """Return the body of the response to a request with this query (filtered and paginated for the lists)."""
+        if self.method != 'GET':
+            return self.body
+        if isinstance(self.body, list):
+            return filter_results(self.body, query)
+        if isinstance(self.body, dict) and isinstance(self.body.get('results'), list):
+            return paginate({**self.body, 'results': filter_results(self.body['results'], query)}, query, url)
+        return self.body
+
+
+class StubCall:
+    """A request received by the stub backend."""
+
+    def __init__(self, sdk, method, path, query, status, request_size, response_size, duration, headers=None):
+        self.sdk = sdk
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers or {}
+        self.status = status
+        self.request_size = request_size
+        self.response_size = response_size
+        self.duration = duration
+
+    def __repr__(self):
+        return f'<StubCall {self.method} /{self.sdk}{self.path} {self.status}>'
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class StubBackend:
+    """
+    Local stand-in for the OSIS web services used by the SDKs, serving fixture data over HTTP with a configurable
+    latency. The requests of an SDK are expected under /<sdk name> (e.g. /osis_reference_sdk/countries), which is what
+    the api clients do when the ADMISSION_STUB_BACKEND_URL setting is defined (see `prepare_api_client`).
+
+    As the web services, the backend filters, sorts and paginates the lists according to the query parameters (see
+    `filter_results`), and answers the successful GET requests with an ETag, and with a 304 (Not Modified) response
+    if the request has an If-None-Match header matching it.
+
+    Usage:
+        with StubBackend(fixtures=DEFAULT_FIXTURES, default_latency=0.05) as backend:
+            with backend.override_settings():
+                ...
+            backend.calls  # The requests received by the backend
+    """
+
+    def __init__(self, fixtures=None, default_latency=0.0, default_jitter=0.0, seed=None):
+        self.endpoints: List[StubEndpoint] = []
+        self.calls: List[StubCall] = []
+        self.default_latency = default_latency
+        self.default_jitter = default_jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        for fixture in fixtures or []:
+            self.load_fixture(fixture)
+
+    # Configuration
+    def add_endpoint(self, sdk, method, path, body=None, **kwargs) -> StubEndpoint:
+        """Add an endpoint, which takes precedence over the existing ones matching the same requests."""
+        endpoint = StubEndpoint(sdk, method, path, body, **kwargs)
+        with self._lock:
+            self.endpoints.insert(0, endpoint)
+        return endpoint
+
+    def load_fixture(self, fixture):
+        """
+        Load the endpoints of a JSON fixture file (a path, or a file name in the default fixtures directory):
+        {"sdk": "osis_reference_sdk", "endpoints": [{"method": "GET", "path": "/countries", "body": {...}}]}
+        """
+        path = Path(fixture)
+        if not path.is_absolute() and not path.exists():
+            path = DEFAULT_FIXTURES_DIR / path
+        data = json.loads(path.read_text())
+        for endpoint in data['endpoints']:
+            self.add_endpoint(endpoint.pop('sdk', data.get('sdk')), **endpoint)
+
+    def set_latency(self, sdk, method, path, latency, jitter=0.0):
+        """Change the latency of the endpoints matching a request."""
+        for endpoint in self.endpoints:
+            if endpoint.matches(sdk, method.upper(), path):
+                endpoint.latency = latency
+                endpoint.jitter = jitter
+
+    def find_endpoint(self, sdk, method, path) -> Optional[StubEndpoint]:
+        with self._lock:
+            return next((endpoint for endpoint in self.endpoints if endpoint.matches(sdk, method, path)), None)
+
+    def reset_calls(self):
+        with self._lock:
+            self.calls = []
+
+    # WSGI application
+    def get_delay(self, endpoint):
+        latency = self.default_latency if endpoint is None or endpoint.latency is None else endpoint.latency
+        jitter = self.default_jitter if endpoint is None or endpoint.jitter is None else endpoint.jitter
+        with self._lock:
+            return max(0.0, latency + self._random.uniform(-jitter, jitter))
+
+    def __call__(self, environ, start_response):
+        start = time.perf_counter()
+        sdk, _, path = environ.get('PATH_INFO', '').lstrip('/').partition('/')
+        path = f'/{path.rstrip("/")}'
+        method = environ['REQUEST_METHOD']
+        request_size = int(environ.get('CONTENT_LENGTH') or 0)
+        if request_size:
+            environ['wsgi.input'].read(request_size)
+
+        endpoint = self.find_endpoint(sdk, method, path)
+        time.sleep(self.get_delay(endpoint))
+
+        query = parse_qs(environ.get('QUERY_STRING', ''))
+        if endpoint is None:
+            status = HTTPStatus.NOT_FOUND
+            body = {'detail': f'No stub for {method} /{sdk}{path}'}
+            headers = {}
+        else:
+            status = HTTPStatus(endpoint.status)
+            body = endpoint.get_body(query, url=f'{self.url}/{sdk}{path}')
+            headers = dict(endpoint.headers)
+        content = b'' if body is None else json.dumps(body).encode()
+        content_headers = {'Content-Type': 'application/json', 'Content-Length': str(len(content))}
+
+        if method == 'GET' and status == HTTPStatus.OK:
+            headers.setdefault('ETag', f'"{hashlib.md5(content).hexdigest()}"')
+            if_none_match = environ.get('HTTP_IF_NONE_MATCH', '')
+            if headers['ETag'] in {tag.strip() for tag in if_none_match.split(',')} or if_none_match == '*':
+                status = HTTPStatus.NOT_MODIFIED
+                content = b''
+                content_headers = {}
+
+        with self._lock:
+            self.calls.append(
+                StubCall(
+                    sdk=sdk,
+                    method=method,
+                    path=path,
+                    query=query,
+                    headers={
+                        name[5:].replace('_', '-').title(): value
+                        for name, value in environ.items()
+                        if name.startswith('HTTP_')
+                    },
+                    status=status.value,
+                    request_size=request_size,
+                    response_size=len(content),
+                    duration=time.perf_counter() - start,
+                )
+            )
+
+        start_response(
+            f'{status.value} {status.phrase}',
+            [*content_headers.items(), *headers.items()],
+        )
+        return [content]
+
+    # Server
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._server = make_server(
+            '127.0.0.1',
+            0,
+            self,
+            server_class=_ThreadingWSGIServer,
+            handler_class=_QuietRequestHandler,
+        )
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-backend', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+    def override_settings(self):
+        """Return a settings override sending the requests of the services to this backend."""
+        return override_settings(ADMISSION_STUB_BACKEND_URL=self.url)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class StubBackendTestMixin:
+    """Test case mixin running the services against a stub backend, available as `cls.stub_backend`."""
+
+    stub_backend_fixtures = DEFAULT_FIXTURES
+    stub_backend_latency = 0.0
+
+    @classmethod
+    def setUpClass(cls):
+        cls.stub_backend = StubBackend(fixtures=cls.stub_backend_fixtures, default_latency=cls.stub_backend_latency)
+        cls.stub_backend.start()
+        cls.addClassCleanup(cls.stub_backend.stop)
+        settings_override = cls.stub_backend.override_settings()
+        settings_override.enable()
+        cls.addClassCleanup(settings_override.disable)
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self.stub_backend.reset_calls()
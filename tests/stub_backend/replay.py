@@ -0,0 +1,158 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+"""
+Replay of the traffic recorded with the ADMISSION_TRAFFIC_CAPTURE_FILE setting (see admission.services.traffic_capture)
+against a stub backend serving the recorded responses with the recorded latencies:
+
+    python -m admission.tests.stub_backend.replay capture.jsonl --speed 2 --scale 10
+"""
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+from urllib.parse import urlencode
+
+from admission.tests.stub_backend import StubBackend
+
+__all__ = [
+    'ReplayResult',
+    'add_capture_endpoints',
+    'load_capture',
+    'replay',
+]
+
+
+class ReplayResult(NamedTuple):
+    latencies: List[float]
+    errors: int
+    duration: float
+
+    def format(self):
+        if not self.latencies:
+            return 'No request replayed'
+        if len(self.latencies) > 1:
+            quantiles = statistics.quantiles(self.latencies, n=100)
+        else:
+            quantiles = self.latencies * 99
+        return (
+            f'{len(self.latencies)} requests in {self.duration:.2f}s ({self.errors} errors) - latency: '
+            f'p50 {quantiles[49] * 1000:.1f}ms, p95 {quantiles[94] * 1000:.1f}ms, '
+            f'max {max(self.latencies) * 1000:.1f}ms'
+        )
+
+
+def load_capture(path) -> List[Dict]:
+    with open(path) as capture_file:
+        records = [json.loads(line) for line in capture_file if line.strip()]
+    return sorted(records, key=lambda record: record['timestamp'])
+
+
+def add_capture_endpoints(backend: StubBackend, records: List[Dict], latency_factor=1.0):
+    """
+    Add to the backend an endpoint per recorded request path, answering with the last recorded response. As the uuids
+    of the paths are replaced by '{uuid}' in the capture, an endpoint answers the requests of every uuid.
+    """
+    records_by_request = {}
+    for record in records:
+        records_by_request.setdefault((record['sdk'], record['method'], record['path']), []).append(record)
+    for (sdk, method, path), request_records in records_by_request.items():
+        last_record = request_records[-1]
+        backend.add_endpoint(
+            sdk,
+            method,
+            path,
+            body=last_record['response'],
+            status=last_record['status'] or 200,
+            latency=statistics.median(record['latency'] for record in request_records) * latency_factor,
+            jitter=0,
+        )
+
+
+def replay(records: List[Dict], base_url: str, speed=1.0, scale=1) -> ReplayResult:
+    """
+    Send the recorded requests to the backend, keeping their original intervals divided by `speed`. The capture is
+    replayed `scale` times simultaneously to simulate more users.
+    """
+    if not records:
+        return ReplayResult([], 0, 0)
+
+    first_timestamp = records[0]['timestamp']
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def send(record):
+        nonlocal errors
+        query = urlencode(record['query'], doseq=True)
+        url = f'{base_url}/{record["sdk"]}{record["path"]}{"?" + query if query else ""}'
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, method=record['method'])) as response:
+                response.read()
+        except urllib.error.HTTPError as error:
+            error.read()
+            if error.code != record['status']:
+                with lock:
+                    errors += 1
+        except urllib.error.URLError:
+            with lock:
+                errors += 1
+        with lock:
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, scale * 10)) as executor:
+        for record in records:
+            delay = (record['timestamp'] - first_timestamp) / speed - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+            for _ in range(scale):
+                executor.submit(send, record)
+    return ReplayResult(latencies, errors, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay captured web service traffic against a stub backend.')
+    parser.add_argument('capture', type=Path, help='Capture file (JSON lines)')
+    parser.add_argument('--speed', type=float, default=1.0, help='Speed factor of the replay (2 = twice as fast)')
+    parser.add_argument('--scale', type=int, default=1, help='Number of simultaneous replays of the capture')
+    parser.add_argument('--latency-factor', type=float, default=1.0, help='Factor applied to the recorded latencies')
+    args = parser.parse_args()
+
+    records = load_capture(args.capture)
+    with StubBackend() as backend:
+        add_capture_endpoints(backend, records, latency_factor=args.latency_factor)
+        print(replay(records, backend.url, speed=args.speed, scale=args.scale).format())
+
+
+if __name__ == '__main__':
+    main()
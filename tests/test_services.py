@@ -23,10 +23,56 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+import datetime
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
 
-from django.test import SimpleTestCase
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.views import View
+from osis_admission_sdk import ApiException
+from osis_admission_sdk.exceptions import NotFoundException, ServiceException
+from osis_admission_sdk.model.doctorat_dto import DoctoratDTO
 
+from admission.contrib.enums.training_choice import TrainingType
+from admission.contrib.forms import format_academic_year_end_label, get_year_choices
+from admission.contrib.views.mixins import OutboundCallBudgetMixin
+from admission.services.api_clients import prepare_api_client
+from admission.services.async_transport import acall_endpoint, build_request, get_async_client
+from admission.services.autocomplete import AdmissionAutocompleteAPIClient
+from admission.services.background import _get_concurrent_executor, run_concurrently
+from admission.services.cache import (
+    conditional_cache,
+    get_cache,
+    invalidate_proposition_cache,
+    proposition_cache,
+    stale_while_revalidate,
+)
+from admission.services.iban import validate_iban
 from admission.services.mixins import ServiceMeta
+from admission.services.outbound_calls import (
+    OutboundCallBudgetExceeded,
+    OutboundCallRecorder,
+    get_current_service_method,
+    record_outbound_call,
+)
+from admission.services.person import AdmissionPersonService
+from admission.services.prefetch import prefetch_tab
+from admission.services.proposition import AdmissionPropositionService
+from admission.services.reference import AcademicCalendar
+from admission.services.sdk_models import LazySDKModels, get_model_module_name
+from admission.services.single_flight import single_flight
+from admission.services.traffic_capture import sanitize_path
+from admission.services.trusted_responses import ResponseView, call_trusted_endpoint, convert_response_data
+from admission.tests import get_paginated_years
+from admission.tests.stub_backend import StubBackendTestMixin
+from admission.tests.utils import OutboundCallsTestMixin
 
 
 class ServicesTestCase(SimpleTestCase):
@@ -35,3 +81,812 @@ class ServicesTestCase(SimpleTestCase):
 
             class TestService(metaclass=ServiceMeta):
                 pass
+
+
+@override_settings(ADMISSION_SINGLE_FLIGHT_ENABLED=True)
+class SingleFlightTestCase(SimpleTestCase):
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+        def get_data(person, value):
+            self.calls.append(value)
+            self.started.set()
+            self.release.wait(5)
+            if value < 0:
+                raise ValueError
+            return value * 2
+
+        self.get_data = single_flight(per_person=False)(get_data)
+        self.get_person_data = single_flight(get_data)
+
+    def call_concurrently(self, get_data, first_person, second_person):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first_call = executor.submit(get_data, person=first_person, value=2)
+            self.started.wait(5)
+            second_call = executor.submit(get_data, person=second_person, value=2)
+            time.sleep(0.1)
+            self.release.set()
+            return first_call.result(), second_call.result()
+
+    def test_concurrent_identical_calls_are_coalesced(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first_call = executor.submit(self.get_data, person=Mock(global_id='1'), value=2)
+            self.started.wait(5)
+            second_call = executor.submit(self.get_data, person=Mock(global_id='2'), value=2)
+            time.sleep(0.1)
+            self.release.set()
+
+            self.assertEqual(first_call.result(), 4)
+            self.assertEqual(second_call.result(), 4)
+
+        self.assertEqual(self.calls, [2])
+
+    def test_concurrent_identical_calls_share_the_exception(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first_call = executor.submit(self.get_data, person=None, value=-1)
+            self.started.wait(5)
+            second_call = executor.submit(self.get_data, person=None, value=-1)
+            time.sleep(0.1)
+            self.release.set()
+
+            self.assertRaises(ValueError, first_call.result)
+            self.assertRaises(ValueError, second_call.result)
+
+        self.assertEqual(self.calls, [-1])
+
+    def test_different_calls_are_not_coalesced(self):
+        self.release.set()
+        self.assertEqual(self.get_data(person=None, value=1), 2)
+        self.assertEqual(self.get_data(person=None, value=3), 6)
+        self.assertEqual(self.calls, [1, 3])
+
+    def test_calls_of_different_persons_are_not_coalesced_by_default(self):
+        results = self.call_concurrently(self.get_person_data, Mock(global_id='1'), Mock(global_id='2'))
+
+        self.assertEqual(results, (4, 4))
+        self.assertEqual(self.calls, [2, 2])
+
+    def test_calls_of_the_same_person_are_coalesced_by_default(self):
+        person = Mock(global_id='1')
+        results = self.call_concurrently(self.get_person_data, person, person)
+
+        self.assertEqual(results, (4, 4))
+        self.assertEqual(self.calls, [2])
+
+    @override_settings(ADMISSION_SINGLE_FLIGHT_ENABLED=False)
+    def test_calls_are_not_coalesced_if_disabled(self):
+        self.assertEqual(self.call_concurrently(self.get_data, None, None), (4, 4))
+        self.assertEqual(self.calls, [2, 2])
+
+
+@override_settings(ADMISSION_TEST_SOFT_TIMEOUT=60, ADMISSION_TEST_HARD_TIMEOUT=3600)
+@patch('admission.services.cache.run_in_background', side_effect=lambda func, *args: func(*args))
+@patch('admission.services.cache.time.monotonic')
+class StaleWhileRevalidateTestCase(SimpleTestCase):
+    def setUp(self):
+        self.values = iter(range(100))
+
+        @stale_while_revalidate('TEST')
+        def get_data(person, acronym):
+            return next(self.values)
+
+        self.get_data = get_data
+
+    def test_fresh_value_is_returned_from_the_cache(self, monotonic, run_in_background):
+        monotonic.return_value = 0
+        self.assertEqual(self.get_data(person=None, acronym='A'), 0)
+        monotonic.return_value = 59
+        self.assertEqual(self.get_data(person=None, acronym='A'), 0)
+        self.assertEqual(self.get_data(person=None, acronym='B'), 1)
+        run_in_background.assert_not_called()
+
+    def test_stale_value_is_returned_and_refreshed_in_background(self, monotonic, run_in_background):
+        monotonic.return_value = 0
+        self.assertEqual(self.get_data(person=None, acronym='A'), 0)
+        monotonic.return_value = 61
+        self.assertEqual(self.get_data(person=None, acronym='A'), 0)
+        run_in_background.assert_called_once()
+        self.assertEqual(self.get_data(person=None, acronym='A'), 1)
+
+    def test_expired_value_is_loaded_again(self, monotonic, run_in_background):
+        monotonic.return_value = 0
+        self.assertEqual(self.get_data(person=None, acronym='A'), 0)
+        monotonic.return_value = 3600
+        self.assertEqual(self.get_data(person=None, acronym='A'), 1)
+        run_in_background.assert_not_called()
+
+    @override_settings(ADMISSION_TEST_SOFT_TIMEOUT=0)
+    def test_no_cache_by_default(self, monotonic, run_in_background):
+        monotonic.return_value = 0
+        self.assertEqual(self.get_data(person=None, acronym='A'), 0)
+        self.assertEqual(self.get_data(person=None, acronym='A'), 1)
+
+    def test_invalid_value_is_loaded_again(self, monotonic, run_in_background):
+        @stale_while_revalidate('TEST', is_valid=lambda value: value % 2 == 1)
+        def get_odd_data(person):
+            return next(self.values)
+
+        monotonic.return_value = 0
+        self.assertEqual(get_odd_data(person=None), 0)
+        self.assertEqual(get_odd_data(person=None), 1)
+        self.assertEqual(get_odd_data(person=None), 1)
+
+
+@override_settings(ADMISSION_TEST_PROPOSITION_CACHE_TIMEOUT=60)
+class PropositionCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        get_cache().clear()
+        self.api = api = Mock()
+        # The results are kept in the shared cache, so they must be picklable
+        api.retrieve_proposition.return_value = {'reference': 'M-CDSS20-000.001'}
+
+        class TestService(metaclass=ServiceMeta):
+            api_exception_cls = ApiException
+            invalidates_proposition_cache = True
+
+            @classmethod
+            @proposition_cache('ADMISSION_TEST_PROPOSITION_CACHE_TIMEOUT')
+            def get_proposition(cls, person, uuid):
+                return api.retrieve_proposition(uuid=uuid)
+
+            @classmethod
+            def update_proposition(cls, person, uuid, data):
+                return api.update_proposition(uuid=uuid, data=data)
+
+            @classmethod
+            def update_person(cls, person, data, uuid=None):
+                return api.update_person(data=data)
+
+        self.service = TestService
+        self.person = Mock(global_id='0123456789')
+        self.other_person = Mock(global_id='9876543210')
+
+    def test_proposition_is_cached_per_person(self):
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.assertEqual(self.api.retrieve_proposition.call_count, 1)
+
+        self.service.get_proposition(person=self.other_person, uuid='uuid-1')
+        self.service.get_proposition(person=self.person, uuid='uuid-2')
+        self.assertEqual(self.api.retrieve_proposition.call_count, 3)
+
+    def test_proposition_update_invalidates_the_cache_of_all_persons(self):
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.service.get_proposition(person=self.other_person, uuid='uuid-1')
+        self.service.update_proposition(person=self.person, uuid='uuid-1', data={})
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.service.get_proposition(person=self.other_person, uuid='uuid-1')
+        self.assertEqual(self.api.retrieve_proposition.call_count, 4)
+
+    def test_person_update_invalidates_the_cache_of_the_person(self):
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.service.get_proposition(person=self.other_person, uuid='uuid-1')
+        self.service.update_person(person=self.person, data={})
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.service.get_proposition(person=self.other_person, uuid='uuid-1')
+        self.assertEqual(self.api.retrieve_proposition.call_count, 3)
+
+    def test_cached_proposition_is_not_modified_by_the_callers(self):
+        self.api.retrieve_proposition.return_value = {'experiences': [{'name': 'Experience'}]}
+
+        proposition = self.service.get_proposition(person=self.person, uuid='uuid-1')
+        proposition['experiences'][0]['name'] = 'Modified'
+
+        proposition = self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.assertEqual(proposition, {'experiences': [{'name': 'Experience'}]})
+        self.assertEqual(self.api.retrieve_proposition.call_count, 1)
+
+    def test_models_of_the_sdks_are_kept_in_the_shared_cache(self):
+        self.api.retrieve_proposition.return_value = [
+            DoctoratDTO(
+                sigle='FOOBAR',
+                intitule='Foobar',
+                annee=2021,
+                sigle_entite_gestion='CDE',
+                campus='Louvain-La-Neuve',
+                type=TrainingType.PHD.name,
+                campus_inscription='Mons',
+                code='CODE',
+                intitule_entite_gestion='Commission',
+            ),
+        ]
+
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        doctorates = self.service.get_proposition(person=self.person, uuid='uuid-1')
+
+        self.assertEqual(self.api.retrieve_proposition.call_count, 1)
+        self.assertIsInstance(doctorates[0], DoctoratDTO)
+        self.assertEqual(doctorates[0].to_dict(), self.api.retrieve_proposition.return_value[0].to_dict())
+
+    @override_settings(ADMISSION_TEST_PROPOSITION_CACHE_TIMEOUT=0)
+    def test_no_cache_by_default(self):
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.assertEqual(self.api.retrieve_proposition.call_count, 2)
+
+
+class ConditionalCacheTestCase(SimpleTestCase):
+    class ApiClient:
+        def __init__(self):
+            self.default_headers = {}
+            self.last_response = None
+
+        def set_default_header(self, name, value):
+            self.default_headers[name] = value
+
+    def setUp(self):
+        self.etags = {'uuid-1': '"v1"'}
+        self.sent_headers = []
+
+        def retrieve_proposition(api_client, uuid):
+            self.sent_headers.append(dict(api_client.default_headers))
+            if api_client.default_headers.get('If-None-Match') == self.etags[uuid]:
+                raise ApiException(status=304, reason='Not Modified')
+            api_client.last_response = Mock(getheader={'ETag': self.etags[uuid]}.get)
+            return Mock(uuid=uuid, etag=self.etags[uuid])
+
+        api_client_cls = self.ApiClient
+
+        class TestService(metaclass=ServiceMeta):
+            api_exception_cls = ApiException
+
+            @classmethod
+            @conditional_cache('ADMISSION_TEST_CONDITIONAL_REQUEST_CACHE_TIMEOUT')
+            def get_proposition(cls, person, uuid):
+                return retrieve_proposition(prepare_api_client(api_client_cls()), uuid)
+
+        self.service = TestService
+        self.person = Mock(global_id='0123456789')
+
+    @override_settings(ADMISSION_TEST_CONDITIONAL_REQUEST_CACHE_TIMEOUT=60)
+    def test_not_modified_proposition_is_reused(self):
+        first_proposition = self.service.get_proposition(person=self.person, uuid='uuid-1')
+        second_proposition = self.service.get_proposition(person=self.person, uuid='uuid-1')
+
+        self.assertIsNot(first_proposition, second_proposition)
+        self.assertEqual(second_proposition.etag, '"v1"')
+        self.assertEqual(self.sent_headers, [{}, {'If-None-Match': '"v1"'}])
+
+    @override_settings(ADMISSION_TEST_CONDITIONAL_REQUEST_CACHE_TIMEOUT=60)
+    def test_modified_proposition_is_loaded_again(self):
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.etags['uuid-1'] = '"v2"'
+        proposition = self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.assertEqual(proposition.etag, '"v2"')
+
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.assertEqual(self.sent_headers[-1], {'If-None-Match': '"v2"'})
+
+    def test_no_conditional_request_by_default(self):
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.service.get_proposition(person=self.person, uuid='uuid-1')
+        self.assertEqual(self.sent_headers, [{}, {}])
+
+
+@override_settings(ADMISSION_CONDITIONAL_REQUEST_CACHE_TIMEOUT=60)
+class ConditionalCacheStubBackendTestCase(StubBackendTestMixin, SimpleTestCase):
+    proposition_uuid = '3c5cdc60-2537-4a12-a396-64d2e9e34876'
+
+    def setUp(self):
+        super().setUp()
+        self.person = Mock(first_name='John', last_name='Doe', email='john.doe@example.be', global_id=self.id())
+
+    def assertConditionalRequestSent(self):
+        first_call, second_call = self.stub_backend.calls
+        self.assertEqual([first_call.status, second_call.status], [200, 304])
+        self.assertNotIn('If-None-Match', first_call.headers)
+        self.assertTrue(second_call.headers['If-None-Match'])
+
+    def test_not_modified_proposition_is_reused(self):
+        first_proposition = AdmissionPropositionService.get_proposition(person=self.person, uuid=self.proposition_uuid)
+        second_proposition = AdmissionPropositionService.get_proposition(person=self.person, uuid=self.proposition_uuid)
+
+        self.assertConditionalRequestSent()
+        self.assertEqual(second_proposition.reference, first_proposition.reference)
+
+    @override_settings(ADMISSION_TRUSTED_RESPONSES=True)
+    def test_not_modified_response_is_reused_without_preloading_the_content(self):
+        first_curriculum = AdmissionPersonService.get_curriculum(person=self.person, uuid=self.proposition_uuid)
+        second_curriculum = AdmissionPersonService.get_curriculum(person=self.person, uuid=self.proposition_uuid)
+
+        self.assertConditionalRequestSent()
+        self.assertEqual(second_curriculum.to_dict(), first_curriculum.to_dict())
+
+
+@override_settings(ADMISSION_PREDICTIVE_PREFETCH_ENABLED=True)
+class PrefetchTestCase(SimpleTestCase):
+    def setUp(self):
+        get_cache().clear()
+        self.person = Mock(global_id='0123456789')
+        self.load_proposition = Mock()
+        self.load_curriculum = Mock()
+
+        patcher = patch.dict('admission.services.prefetch.PROPOSITION_LOADERS', {'doctorate': self.load_proposition})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.dict(
+            'admission.services.prefetch.TAB_LOADERS',
+            {'doctorate': {'curriculum': [(self.load_curriculum, {'foo': 'bar'})]}},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.background_tasks = []
+        patcher = patch(
+            'admission.services.prefetch.run_in_background',
+            side_effect=lambda func, *args: self.background_tasks.append((func, args)) or Mock(),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_background_tasks(self):
+        while self.background_tasks:
+            func, args = self.background_tasks.pop(0)
+            func(*args)
+
+    def test_prefetch_tab(self):
+        self.assertTrue(prefetch_tab(self.person, 'doctorate', 'uuid-1', 'curriculum'))
+        self.run_background_tasks()
+
+        self.load_proposition.assert_called_once_with(person=self.person, uuid='uuid-1')
+        self.load_curriculum.assert_called_once_with(person=self.person, uuid='uuid-1', foo='bar')
+
+    def test_prefetch_is_limited_per_user(self):
+        self.assertTrue(prefetch_tab(self.person, 'doctorate', 'uuid-1', 'curriculum'))
+        self.assertFalse(prefetch_tab(self.person, 'doctorate', 'uuid-1', 'languages'))
+        self.assertTrue(prefetch_tab(Mock(global_id='9876543210'), 'doctorate', 'uuid-1', 'curriculum'))
+
+        self.run_background_tasks()
+        self.assertTrue(prefetch_tab(self.person, 'doctorate', 'uuid-1', 'languages'))
+
+    def test_prefetch_is_cancelled_when_the_proposition_is_modified(self):
+        self.load_proposition.side_effect = lambda **kwargs: invalidate_proposition_cache(proposition_uuid='uuid-1')
+
+        prefetch_tab(self.person, 'doctorate', 'uuid-1', 'curriculum')
+        self.run_background_tasks()
+
+        self.load_proposition.assert_called_once()
+        self.load_curriculum.assert_not_called()
+
+    @override_settings(ADMISSION_PREDICTIVE_PREFETCH_ENABLED=False)
+    def test_no_prefetch_by_default(self):
+        self.assertFalse(prefetch_tab(self.person, 'doctorate', 'uuid-1', 'curriculum'))
+        self.assertEqual(self.background_tasks, [])
+
+
+class AcademicCalendarTestCase(SimpleTestCase):
+    def setUp(self):
+        academic_years = get_paginated_years(2000, 2025).results
+        self.calendar = AcademicCalendar(list(reversed(academic_years)), day=datetime.date(2023, 1, 1))
+
+    def test_current_year(self):
+        self.assertEqual(self.calendar.current_year, 2022)
+        self.assertEqual(self.calendar.get_year_at(datetime.date(2022, 9, 15)), 2022)
+        self.assertEqual(self.calendar.get_year_at(datetime.date(2022, 8, 1)), None)
+        self.assertEqual(self.calendar.get_year_at(datetime.date(1999, 10, 1)), None)
+
+    def test_most_recent_year_is_current_when_years_overlap(self):
+        academic_years = get_paginated_years(2021, 2022).results
+        academic_years[0].end_date = datetime.date(2022, 10, 1)
+        calendar = AcademicCalendar(academic_years, day=datetime.date(2022, 9, 20))
+
+        self.assertEqual(calendar.current_year, 2022)
+        self.assertEqual(calendar.get_year_at(datetime.date(2022, 9, 1)), 2021)
+
+    def test_past_choices(self):
+        choices = self.calendar.get_past_choices(exclude_current=True, window=2)
+
+        self.assertEqual(choices, ((2019, '2019-2020'), (2020, '2020-2021'), (2021, '2021-2022')))
+        self.assertIs(self.calendar.get_past_choices(exclude_current=True, window=2), choices)
+        self.assertEqual(
+            self.calendar.get_past_choices(window=1, format_label=format_academic_year_end_label),
+            ((2021, '2022'), (2022, '2023')),
+        )
+
+    def test_past_choices_with_additional_years(self):
+        choices = self.calendar.get_past_choices(window=1)
+
+        self.assertIs(self.calendar.get_past_choices(window=1, additional_years=frozenset({2022})), choices)
+        self.assertEqual(
+            self.calendar.get_past_choices(window=1, additional_years=frozenset({2024})),
+            ((2021, '2021-2022'), (2022, '2022-2023'), (2024, '2024-2025')),
+        )
+
+    def test_year_choices_are_memoised(self):
+        self.assertIs(get_year_choices(max_year=2023), get_year_choices(max_year=2023))
+        self.assertEqual(get_year_choices(min_year=2021, max_year=2023)[1:], ((2023, 2023), (2022, 2022), (2021, 2021)))
+
+
+@override_settings(ADMISSION_IBAN_VALIDATION_CACHE_TIMEOUT=60, ADMISSION_IBAN_VALIDATION_TIMEOUT=0.1)
+class IbanValidationTestCase(SimpleTestCase):
+    def setUp(self):
+        get_cache().clear()
+        patcher = patch('admission.services.iban.IBANValidatorService.validate')
+        self.validate = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_accepted_iban_is_cached(self):
+        self.assertTrue(validate_iban('BE43068999999501'))
+        self.assertTrue(validate_iban('be43 0689 9999 9501'))
+        self.validate.assert_called_once()
+
+    def test_no_answer_in_time(self):
+        answered = threading.Event()
+        self.validate.side_effect = lambda iban: time.sleep(0.3) or answered.set()
+
+        self.assertIsNone(validate_iban('BE43068999999501'))
+
+        # The late answer is still cached
+        self.assertTrue(answered.wait(5))
+        time.sleep(0.05)
+        self.assertTrue(validate_iban('BE43068999999501'))
+        self.validate.assert_called_once()
+
+
+class RunConcurrentlyTestCase(SimpleTestCase):
+    def test_results_are_returned_in_order(self):
+        self.assertEqual(run_concurrently(lambda: 1, lambda: 2, lambda: 3), [1, 2, 3])
+        self.assertEqual(run_concurrently(), [])
+
+    def test_functions_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        # Each function waits for the other ones, which would time out if they were called one after the other
+        self.assertEqual(run_concurrently(*[lambda: barrier.wait() >= 0] * 3), [True, True, True])
+
+    def test_exception_is_raised_once_all_functions_are_done(self):
+        done = Mock()
+
+        def fail():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            run_concurrently(fail, lambda: time.sleep(0.05) or done())
+
+        done.assert_called_once()
+
+    def test_exception_raised_to_the_caller_is_not_logged(self):
+        def fail():
+            raise ValueError
+
+        with self.assertNoLogs('admission.services.background'), self.assertRaises(ValueError):
+            run_concurrently(fail, lambda: None)
+
+    def test_functions_are_called_in_the_current_thread_when_no_worker_is_free(self):
+        _get_concurrent_executor()
+        with patch('admission.services.background._free_concurrent_workers', threading.BoundedSemaphore(1)) as workers:
+            workers.acquire()
+            thread_names = run_concurrently(*[lambda: threading.current_thread().name] * 3)
+
+        self.assertEqual(thread_names, [threading.current_thread().name] * 3)
+
+    def test_context_is_shared_with_the_background_functions(self):
+        with OutboundCallRecorder() as recorder:
+            run_concurrently(lambda: record_outbound_call('osis_reference_sdk'), lambda: None)
+
+        self.assertEqual(len(recorder), 1)
+
+
+class LazySDKModelsTestCase(SimpleTestCase):
+    def test_model_module_name(self):
+        self.assertEqual(get_model_module_name('SupervisionDTO'), 'supervision_dto')
+        self.assertEqual(get_model_module_name('MembreCADTONested'), 'membre_cadto_nested')
+        self.assertEqual(get_model_module_name('CandidateReEnrolmentPeriodDTO'), 'candidate_re_enrolment_period_dto')
+
+    def test_models_are_imported_when_used(self):
+        from osis_admission_sdk.model.supervision_dto import SupervisionDTO
+
+        models = LazySDKModels('osis_admission_sdk')
+        self.assertNotIn('SupervisionDTO', vars(models))
+        self.assertIs(models.SupervisionDTO, SupervisionDTO)
+        self.assertIn('SupervisionDTO', vars(models))
+
+    def test_unknown_model(self):
+        with self.assertRaises(ImportError):
+            LazySDKModels('osis_admission_sdk').UnknownModelDTO
+
+
+class TrustedResponsesTestCase(SimpleTestCase):
+    data = {
+        'uuid': '3c5cdc60-2537-4a12-a396-64d2e9e34876',
+        'creee_le': '2023-01-02T10:11:12',
+        'doctorat': {'sigle': 'SC3DP', 'annee': 2023},
+        'links': {'retrieve_project': {'url': 'access granted'}},
+    }
+
+    def test_response_view(self):
+        from osis_admission_sdk.model.doctorate_proposition_dto import DoctoratePropositionDTO
+
+        proposition = convert_response_data(self.data, (DoctoratePropositionDTO,))
+
+        self.assertIsInstance(proposition, ResponseView)
+        self.assertEqual(proposition.uuid, self.data['uuid'])
+        self.assertEqual(proposition['uuid'], self.data['uuid'])
+        self.assertEqual(proposition.creee_le, datetime.datetime(2023, 1, 2, 10, 11, 12))
+        self.assertEqual(proposition.doctorat.sigle, 'SC3DP')
+        self.assertEqual(proposition.links, self.data['links'])
+        self.assertIsNone(getattr(proposition, 'soumise_le', None))
+        self.assertEqual(proposition.to_dict()['doctorat'], {'sigle': 'SC3DP', 'annee': 2023})
+
+        # The fields cannot be modified but other attributes can be added
+        with self.assertRaises(AttributeError):
+            proposition.uuid = 'foo'
+        proposition.admission_context = 'doctorate'
+        self.assertEqual(proposition.admission_context, 'doctorate')
+
+    def test_trusted_endpoint(self):
+        from osis_admission_sdk.model.doctorate_proposition_dto import DoctoratePropositionDTO
+
+        endpoint = Mock(settings={'response_type': ([DoctoratePropositionDTO],)})
+        endpoint.return_value.data = json.dumps([self.data]).encode()
+
+        self.assertEqual(call_trusted_endpoint(endpoint, foo='bar'), endpoint.return_value)
+        endpoint.assert_called_with(foo='bar')
+
+        with override_settings(ADMISSION_TRUSTED_RESPONSES=True):
+            propositions = call_trusted_endpoint(endpoint, foo='bar')
+
+        endpoint.assert_called_with(_preload_content=False, foo='bar')
+        self.assertEqual(len(propositions), 1)
+        self.assertEqual(propositions[0].doctorat.annee, 2023)
+
+
+class AsyncTransportTestCase(SimpleTestCase):
+    params = {
+        'sigle': 'SC3DP',
+        'campus': '',
+        'acronym_or_name': 'foo',
+        'accept_language': 'fr-be',
+        'x_user_first_name': 'John',
+        'x_user_last_name': 'Doe',
+        'x_user_email': 'john.doe@example.org',
+        'x_user_global_id': '0123456789',
+    }
+
+    def test_build_request(self):
+        request = build_request(AdmissionAutocompleteAPIClient().list_doctorat_dtos, **self.params)
+
+        self.assertEqual(request.method, 'GET')
+        self.assertIn(('sigle', 'SC3DP'), request.query_params)
+        self.assertIn(('acronym_or_name', 'foo'), request.query_params)
+        self.assertEqual(request.headers['Accept-Language'], 'fr-be')
+        self.assertIsNone(request.body)
+
+    @patch('admission.services.async_transport.HTTPX_INSTALLED', True)
+    @patch('admission.services.async_transport.get_async_client')
+    def test_errors(self, get_async_client):
+        response = Mock(status_code=404, reason_phrase='Not Found', text='{"detail": "Not found."}', headers={})
+        get_async_client.return_value.request = AsyncMock(return_value=response)
+
+        with self.assertRaises(NotFoundException):
+            async_to_sync(acall_endpoint)(AdmissionAutocompleteAPIClient().list_doctorat_dtos, **self.params)
+
+        response.status_code = 503
+        with self.assertRaises(ServiceException):
+            async_to_sync(acall_endpoint)(AdmissionAutocompleteAPIClient().list_doctorat_dtos, **self.params)
+
+        request_kwargs = get_async_client.return_value.request.call_args[1]
+        self.assertIn(('sigle', 'SC3DP'), request_kwargs['params'])
+
+    def test_client_is_shared_and_closed_with_the_event_loop(self):
+        httpx = Mock()
+        httpx.AsyncClient.return_value.aclose = AsyncMock()
+
+        async def get_clients():
+            return await get_async_client(), await get_async_client()
+
+        with patch.dict('sys.modules', httpx=httpx):
+            first_client, second_client = async_to_sync(get_clients)()
+
+        self.assertIs(first_client, second_client)
+        first_client.aclose.assert_awaited_once()
+
+    @patch('admission.services.async_transport.HTTPX_INSTALLED', False)
+    def test_without_httpx(self):
+        endpoint = Mock(return_value=['result'])
+
+        self.assertEqual(async_to_sync(acall_endpoint)(endpoint, foo='bar'), ['result'])
+        endpoint.assert_called_with(foo='bar')
+
+    def test_async_service_method(self):
+        class TestService(metaclass=ServiceMeta):
+            api_exception_cls = ApiException
+
+            @classmethod
+            async def aget_data(cls, person):
+                return get_current_service_method()
+
+        self.assertEqual(async_to_sync(TestService.aget_data)(None), 'TestService.aget_data')
+
+
+class OutboundCallsTestCase(OutboundCallsTestMixin, SimpleTestCase):
+    def setUp(self):
+        class TestService(metaclass=ServiceMeta):
+            api_exception_cls = ApiException
+
+            @classmethod
+            def get_data(cls, person):
+                return prepare_api_client(Mock()).call_api()
+
+        self.service = TestService
+        self.person = Mock(global_id='0123456789')
+
+        class TestView(OutboundCallBudgetMixin, View):
+            outbound_call_budget = 1
+
+            def get(view, request, *args, **kwargs):
+                for _ in range(int(request.GET['calls'])):
+                    self.service.get_data(person=self.person)
+                return HttpResponse()
+
+        self.view = TestView.as_view()
+
+    def test_assert_num_outbound_calls(self):
+        with self.assertNumOutboundCalls(2):
+            self.service.get_data(person=self.person)
+            self.service.get_data(person=self.person)
+
+        self.assertNumOutboundCalls(1, self.service.get_data, person=self.person)
+
+        with self.assertRaisesMessage(AssertionError, '1. TestService.get_data (unittest)'):
+            with self.assertNumOutboundCalls(0):
+                self.service.get_data(person=self.person)
+
+    def test_the_requests_are_counted(self):
+        with self.assertNumOutboundCalls(0):
+            api_client = prepare_api_client(Mock())
+
+        with self.assertNumOutboundCalls(2):
+            api_client.call_api()
+            api_client.call_api()
+
+    def test_view_within_its_budget(self):
+        with self.assertNoLogs('admission.contrib.views.mixins', level='WARNING'):
+            self.view(RequestFactory().get('/', {'calls': 1}))
+
+    def test_view_exceeding_its_budget(self):
+        with self.assertLogs('admission.contrib.views.mixins', level='WARNING') as logs:
+            self.view(RequestFactory().get('/', {'calls': 2}))
+        self.assertIn('TestView made 2 calls to the web services (budget: 1)', logs.output[0])
+
+    @override_settings(ADMISSION_OUTBOUND_CALL_BUDGET_STRICT=True)
+    def test_view_exceeding_its_budget_in_strict_mode(self):
+        with self.assertRaises(OutboundCallBudgetExceeded):
+            self.view(RequestFactory().get('/', {'calls': 2}))
+
+
+class TrafficCaptureTestCase(SimpleTestCase):
+    proposition_uuid = '3c5cdc60-2537-4a12-a396-64d2e9e34876'
+
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.capture_file = Path(temporary_directory.name) / 'capture.jsonl'
+
+        self.api_client = Mock()
+        self.api_client.configuration.host = 'https://osis.dummy/api/v1/admission'
+        self.api_client.rest_client.request.return_value = Mock(
+            status=200,
+            data=b'{"uuid": "uuid-1", "nom": "Doe", "date_naissance": "2000-01-01", "pays": "BE"}',
+        )
+
+    def get_records(self):
+        return [json.loads(line) for line in self.capture_file.read_text().splitlines()]
+
+    def test_requests_are_recorded_without_personal_data(self):
+        with override_settings(ADMISSION_TRAFFIC_CAPTURE_FILE=str(self.capture_file)):
+            api_client = prepare_api_client(self.api_client)
+        api_client.rest_client.request(
+            'GET',
+            f'https://osis.dummy/api/v1/admission/propositions/{self.proposition_uuid}',
+            query_params=[('q', 'Doe'), ('limit', 10)],
+            headers={'X-User-Email': 'john.doe@dummy.be'},
+        )
+
+        [record] = self.get_records()
+        self.assertEqual(record['method'], 'GET')
+        self.assertEqual(record['path'], '/propositions/{uuid}')
+        self.assertEqual(record['query'], {'q': [], 'limit': [10]})
+        self.assertEqual(record['status'], 200)
+        self.assertEqual(record['response_size'], 78)
+        self.assertEqual(
+            record['response'],
+            {'uuid': 'uuid-1', 'nom': 'REDACTED', 'date_naissance': '1970-01-01', 'pays': 'BE'},
+        )
+        self.assertNotIn('john.doe', self.capture_file.read_text())
+
+    def test_coordinates_are_recorded_without_personal_data(self):
+        address = {
+            'street': "Place de l'Université",
+            'street_number': '1',
+            'postal_box': 'A',
+            'postal_code': '1348',
+            'city': 'Louvain-la-Neuve',
+            'country': 'BE',
+            'place': 'Lauzelle',
+        }
+        self.api_client.rest_client.request.return_value = Mock(
+            status=200,
+            data=json.dumps(
+                {
+                    'residential': address,
+                    'contact': address,
+                    'phone_mobile': '+32474000000',
+                    'email': 'john.doe@dummy.be',
+                    'emergency_contact_phone': '+32475000000',
+                }
+            ).encode(),
+        )
+
+        with override_settings(ADMISSION_TRAFFIC_CAPTURE_FILE=str(self.capture_file)):
+            api_client = prepare_api_client(self.api_client)
+        api_client.rest_client.request(
+            'GET',
+            f'https://osis.dummy/api/v1/admission/propositions/doctorate/{self.proposition_uuid}/coordonnees',
+        )
+
+        [record] = self.get_records()
+        self.assertEqual(record['path'], '/propositions/doctorate/{uuid}/coordonnees')
+        redacted_address = {key: 'REDACTED' for key in address}
+        redacted_address['country'] = 'BE'
+        self.assertEqual(
+            record['response'],
+            {
+                'residential': redacted_address,
+                'contact': redacted_address,
+                'phone_mobile': 'REDACTED',
+                'email': 'REDACTED',
+                'emergency_contact_phone': 'REDACTED',
+            },
+        )
+
+    def test_person_is_recorded_without_personal_data(self):
+        self.api_client.rest_client.request.return_value = Mock(
+            status=200,
+            data=json.dumps(
+                {
+                    'first_name_in_use': 'John',
+                    'sex': 'M',
+                    'gender': 'H',
+                    'country_of_citizenship': 'BE',
+                    'national_number': '90010100123',
+                    'last_registration_id': '12345678',
+                    'language': 'fr-be',
+                }
+            ).encode(),
+        )
+
+        with override_settings(ADMISSION_TRAFFIC_CAPTURE_FILE=str(self.capture_file)):
+            api_client = prepare_api_client(self.api_client)
+        api_client.rest_client.request('GET', 'https://osis.dummy/api/v1/admission/person')
+
+        [record] = self.get_records()
+        self.assertEqual(
+            record['response'],
+            {
+                'first_name_in_use': 'REDACTED',
+                'sex': 'REDACTED',
+                'gender': 'REDACTED',
+                'country_of_citizenship': 'REDACTED',
+                'national_number': 'REDACTED',
+                'last_registration_id': 'REDACTED',
+                'language': 'fr-be',
+            },
+        )
+
+    def test_variable_segments_of_the_paths_are_redacted(self):
+        self.assertEqual(
+            sanitize_path('/propositions/3C5CDC60-2537-4A12-A396-64D2E9E34876/person'),
+            '/propositions/{uuid}/person',
+        )
+        self.assertEqual(sanitize_path('/trainings/2023/SC3DP'), '/trainings/2023/SC3DP')
+        self.assertEqual(sanitize_path('/persons/00345678/'), '/persons/REDACTED/')
+        self.assertEqual(sanitize_path('/cities/Louvain-la-Neuve'), '/cities/REDACTED')
+        self.assertEqual(sanitize_path('/search/John%20Doe'), '/search/REDACTED')
+
+    def test_no_capture_by_default(self):
+        api_client = prepare_api_client(self.api_client)
+        api_client.rest_client.request('GET', 'https://osis.dummy/api/v1/admission/propositions')
+        self.assertFalse(self.capture_file.exists())
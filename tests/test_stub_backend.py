@@ -0,0 +1,165 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import json
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+from django.test import SimpleTestCase
+from osis_reference_sdk import ApiClient, Configuration
+
+from admission.services.api_clients import prepare_api_client
+from admission.tests.stub_backend import StubBackendTestMixin
+from admission.tests.stub_backend.replay import add_capture_endpoints, load_capture, replay
+
+
+class StubBackendTestCase(StubBackendTestMixin, SimpleTestCase):
+    def get(self, path):
+        with urllib.request.urlopen(f'{self.stub_backend.url}{path}') as response:
+            return json.loads(response.read())
+
+    def get_response(self, path, headers=None):
+        request = urllib.request.Request(f'{self.stub_backend.url}{path}', headers=headers or {})
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as error:
+            return error.code, error.headers, error.read()
+
+    def test_fixture_data_is_served(self):
+        countries = self.get('/osis_reference_sdk/countries?limit=10')
+
+        self.assertEqual([country['iso_code'] for country in countries['results']], ['BE', 'FR', 'CA'])
+        self.assertEqual(len(self.stub_backend.calls), 1)
+        self.assertEqual(self.stub_backend.calls[0].path, '/countries')
+        self.assertEqual(self.stub_backend.calls[0].query, {'limit': ['10']})
+
+    def test_path_parameters(self):
+        self.stub_backend.add_endpoint('osis_admission_sdk', 'GET', '/propositions/{uuid}', {'uuid': 'foo'})
+
+        self.assertEqual(self.get('/osis_admission_sdk/propositions/foo/'), {'uuid': 'foo'})
+
+    def test_unknown_endpoint(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.get('/osis_reference_sdk/unknown')
+        self.assertEqual(context.exception.code, 404)
+
+    def test_latency(self):
+        self.stub_backend.set_latency('osis_reference_sdk', 'GET', '/languages', latency=0.2)
+
+        start = time.perf_counter()
+        self.get('/osis_reference_sdk/languages')
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+
+    def test_fixtures_of_all_the_sdks_are_served(self):
+        proposition = self.get('/osis_admission_sdk/propositions/doctorate/3c5cdc60-2537-4a12-a396-64d2e9e34876')
+        self.assertEqual(proposition['reference'], 'M-CDSS23-000.001')
+
+        institute_uuid = proposition['institut_these']
+        self.assertEqual(self.get(f'/osis_organisation_sdk/entites/UCL/{institute_uuid}')['acronym'], 'IMCN')
+
+        training = self.get('/osis_education_group_sdk/trainings/2023/SC3DP')
+        self.assertEqual(training['acronym'], proposition['doctorat']['sigle'])
+
+    def test_filters(self):
+        countries = self.get('/osis_reference_sdk/countries?european_union=false&lang=fr')
+        self.assertEqual([country['iso_code'] for country in countries['results']], ['CA'])
+        self.assertEqual(countries['count'], 1)
+
+        countries = self.get('/osis_reference_sdk/countries?search=BELG')
+        self.assertEqual([country['iso_code'] for country in countries['results']], ['BE'])
+
+    def test_ordering_and_pagination(self):
+        countries = self.get('/osis_reference_sdk/countries?ordering=-name&limit=2')
+        self.assertEqual([country['iso_code'] for country in countries['results']], ['FR', 'CA'])
+        self.assertEqual(countries['count'], 3)
+        self.assertIsNone(countries['previous'])
+        self.assertIn('offset=2', countries['next'])
+
+        countries = self.get('/osis_reference_sdk/countries?ordering=-name&limit=2&offset=2')
+        self.assertEqual([country['iso_code'] for country in countries['results']], ['BE'])
+        self.assertIsNone(countries['next'])
+
+    def test_conditional_requests(self):
+        path = '/propositions/doctorate/3c5cdc60-2537-4a12-a396-64d2e9e34876'
+        status, headers, content = self.get_response(f'/osis_admission_sdk{path}')
+        self.assertEqual(status, 200)
+        etag = headers['ETag']
+
+        status, headers, content = self.get_response(f'/osis_admission_sdk{path}', headers={'If-None-Match': etag})
+        self.assertEqual(status, 304)
+        self.assertEqual(headers['ETag'], etag)
+        self.assertEqual(content, b'')
+
+        endpoint = self.stub_backend.add_endpoint('osis_admission_sdk', 'GET', path, {'reference': 'M-CDSS23-000.002'})
+        self.addCleanup(self.stub_backend.endpoints.remove, endpoint)
+        status, headers, content = self.get_response(f'/osis_admission_sdk{path}', headers={'If-None-Match': etag})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers['ETag'], etag)
+        self.assertEqual([call.status for call in self.stub_backend.calls], [200, 304, 200])
+
+    def test_api_clients_use_the_stub_backend(self):
+        api_client = prepare_api_client(ApiClient(configuration=Configuration()))
+        self.assertEqual(api_client.configuration.host, f'{self.stub_backend.url}/osis_reference_sdk')
+
+
+class ReplayTestCase(StubBackendTestMixin, SimpleTestCase):
+    stub_backend_fixtures = []
+
+    def setUp(self):
+        super().setUp()
+        records = [
+            {
+                'timestamp': 1700000000 + index * 0.01,
+                'service_method': 'AdmissionPropositionService.get_proposition',
+                'sdk': 'osis_admission_sdk',
+                'method': 'GET',
+                'path': f'/propositions/uuid-{index % 2}',
+                'query': {},
+                'status': 200,
+                'latency': 0.01,
+                'request_size': 0,
+                'response_size': 20,
+                'response': {'uuid': f'uuid-{index % 2}'},
+            }
+            for index in range(4)
+        ]
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as capture_file:
+            capture_file.write(''.join(json.dumps(record) + '\n' for record in reversed(records)))
+        self.records = load_capture(capture_file.name)
+
+    def test_capture_is_sorted(self):
+        self.assertEqual([record['path'] for record in self.records], [f'/propositions/uuid-{i % 2}' for i in range(4)])
+
+    def test_replay(self):
+        add_capture_endpoints(self.stub_backend, self.records)
+        result = replay(self.records, self.stub_backend.url, speed=10, scale=3)
+
+        self.assertEqual(len(result.latencies), 12)
+        self.assertEqual(result.errors, 0)
+        self.assertEqual(len(self.stub_backend.calls), 12)
+        self.assertTrue(all(latency >= 0.01 for latency in result.latencies))
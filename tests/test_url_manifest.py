@@ -0,0 +1,132 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import json
+import tempfile
+from pathlib import Path
+from unittest import skipUnless
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+from django.urls import URLResolver
+from django.urls.resolvers import RegexPattern
+
+from admission.contrib.async_views import AsyncAdmissionListView, AsyncDoctorateAutocomplete, use_async_views
+from admission.contrib.views.autocomplete import DoctorateAutocomplete
+from admission.contrib.views.common.form_tabs.person import AdmissionPersonFormView
+from admission.contrib.views.list import AdmissionListView
+from admission.url_manifest import (
+    DEFAULT_URL_MANIFEST,
+    LazyView,
+    LazyViewClass,
+    dump_url_manifest,
+    load_url_manifest,
+)
+from admission.urls import discover_urlpatterns
+
+
+def get_view_classes(urlpatterns):
+    for pattern in urlpatterns:
+        if isinstance(pattern, URLResolver):
+            yield from get_view_classes(pattern.url_patterns)
+        else:
+            view_class = getattr(pattern.callback, 'view_class', None)
+            yield view_class.view_class if isinstance(view_class, LazyViewClass) else view_class
+
+
+class UrlManifestTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.manifest = dump_url_manifest(discover_urlpatterns())
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.manifest_path = Path(directory.name) / 'urls.json'
+
+    def load_manifest(self):
+        self.manifest_path.write_text(self.manifest)
+        return load_url_manifest(self.manifest_path)
+
+    def test_loaded_manifest_is_the_same(self):
+        self.assertEqual(dump_url_manifest(self.load_manifest()), self.manifest)
+
+    def test_views_are_resolved(self):
+        resolver = URLResolver(RegexPattern(r'^/'), self.load_manifest())
+
+        match = resolver.resolve('/create/person')
+
+        self.assertIsInstance(match.func, LazyView)
+        self.assertEqual(match.func.view.view_class, AdmissionPersonFormView)
+        self.assertEqual(match.func.view_class.template_name, AdmissionPersonFormView.template_name)
+        self.assertEqual(match.namespaces, ['create'])
+        self.assertEqual(match.url_name, 'person')
+
+    def test_views_are_not_imported_when_the_urls_are_loaded(self):
+        patterns = [
+            {'route': 'view', 'name': 'view', 'view': 'unknown.View', 'initkwargs': {}},
+            {'route': 'function', 'name': 'function', 'view': 'unknown.view', 'initkwargs': None},
+        ]
+        self.manifest_path.write_text(
+            json.dumps({'version': 1, 'patterns': [{**pattern, 'regex': False, 'kwargs': {}} for pattern in patterns]})
+        )
+        urlpatterns = load_url_manifest(self.manifest_path)
+        resolver = URLResolver(RegexPattern(r'^/'), urlpatterns)
+
+        self.assertEqual(resolver.reverse('view'), 'view')
+        self.assertEqual([pattern.lookup_str for pattern in urlpatterns], ['unknown.View', 'unknown.view'])
+        self.assertEqual(resolver.resolve('/view')._func_path, 'unknown.View')
+        self.assertEqual(resolver.resolve('/function')._func_path, 'unknown.view')
+
+        with self.assertRaises(ImportError):
+            resolver.resolve('/view').func.view_class.as_view
+
+    @skipUnless(DEFAULT_URL_MANIFEST.exists(), "The url manifest has not been generated yet")
+    def test_committed_manifest_is_up_to_date(self):
+        # Generate it again with ./manage.py generate_url_manifest when the views or their urls change
+        call_command('generate_url_manifest', output=DEFAULT_URL_MANIFEST, check=True)
+
+    def test_check_command(self):
+        with self.assertRaises(CommandError):
+            call_command('generate_url_manifest', output=self.manifest_path, check=True)
+
+        self.manifest_path.write_text('{}')
+        with self.assertRaises(CommandError):
+            call_command('generate_url_manifest', output=self.manifest_path, check=True)
+
+        call_command('generate_url_manifest', output=self.manifest_path)
+        self.assertEqual(self.manifest_path.read_text(), self.manifest)
+        call_command('generate_url_manifest', output=self.manifest_path, check=True)
+
+    def test_async_views(self):
+        for urlpatterns in [discover_urlpatterns(), self.load_manifest()]:
+            view_classes = set(get_view_classes(use_async_views(urlpatterns)))
+
+            self.assertIn(AsyncDoctorateAutocomplete, view_classes)
+            self.assertIn(AsyncAdmissionListView, view_classes)
+            self.assertIn(AdmissionPersonFormView, view_classes)
+            self.assertNotIn(DoctorateAutocomplete, view_classes)
+            self.assertNotIn(AdmissionListView, view_classes)
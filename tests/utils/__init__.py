@@ -25,8 +25,37 @@
 # ##############################################################################
 from collections import namedtuple
 
+from admission.services.outbound_calls import OutboundCallRecorder
+
 # Can't use Mock because 'name' property is reserved
 MockCountry = namedtuple('MockCountry', ['iso_code', 'name', 'name_en', 'european_union'])
-MockCity = namedtuple('MockCity', ['name'])
+MockCity = namedtuple('MockCity', ['name', 'zip_code'], defaults=[''])
 MockLanguage = namedtuple('MockLanguage', ['code', 'name', 'name_en'])
 MockHighSchool = namedtuple('MockHighSchool', ['name', 'city', 'uuid'])
+
+
+class _AssertNumOutboundCallsContext(OutboundCallRecorder):
+    def __init__(self, test_case, num):
+        super().__init__()
+        self.test_case = test_case
+        self.num = num
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        if exc_type is None:
+            self.test_case.assertEqual(
+                len(self),
+                self.num,
+                '%d calls to the web services made, %d expected:\n%s' % (len(self), self.num, self.format_calls()),
+            )
+
+
+class OutboundCallsTestMixin:
+    """Test case mixin to check the number of calls made to the web services, as assertNumQueries does for the db."""
+
+    def assertNumOutboundCalls(self, num, func=None, *args, **kwargs):
+        context = _AssertNumOutboundCallsContext(self, num)
+        if func is None:
+            return context
+        with context:
+            func(*args, **kwargs)
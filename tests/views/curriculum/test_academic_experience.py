@@ -24,10 +24,11 @@
 #
 # ##############################################################################
 import datetime
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
 import freezegun
 from django.shortcuts import resolve_url
+from django.template import loader
 from django.test import override_settings
 from django.utils.translation import gettext
 
@@ -45,6 +46,7 @@ from admission.contrib.forms.curriculum import (
     EDUCATIONAL_EXPERIENCE_DOCTORATE_FIELDS,
     EDUCATIONAL_EXPERIENCE_GENERAL_FIELDS,
 )
+from admission.contrib.views.common.form_tabs.curriculum_experiences import empty_year_forms_cache
 from admission.tests.views.curriculum.mixin import MixinTestCase
 
 
@@ -519,6 +521,34 @@ class CurriculumAcademicExperienceFormTestCase(MixinTestCase):
                 base_form.fields['start'].choices,
             )
 
+    @staticmethod
+    def count_empty_year_form_renderings(render_to_string):
+        return sum(
+            call.kwargs.get('template_name') == 'admission/includes/curriculum_experience_year_form.html'
+            for call in render_to_string.call_args_list
+        )
+
+    @freezegun.freeze_time(MixinTestCase.current_date)
+    @override_settings(ADMISSION_CURRICULUM_EMPTY_YEAR_FORM_CACHE_ENABLED=True)
+    def test_with_admission_on_update_experience_form_empty_year_form_is_cached(self):
+        empty_year_forms_cache.clear()
+        self.addCleanup(empty_year_forms_cache.clear)
+
+        with patch.object(loader, 'render_to_string', wraps=loader.render_to_string) as render_to_string:
+            first_response = self.client.get(self.admission_update_url)
+            second_response = self.client.get(self.admission_update_url)
+
+        self.assertEqual(self.count_empty_year_form_renderings(render_to_string), 1)
+        self.assertContains(second_response, 'id="year_form___prefix__"')
+        self.assertEqual(str(first_response.context['empty_form']), str(second_response.context['empty_form']))
+
+    def test_with_admission_on_update_experience_post_form_does_not_render_empty_year_form(self):
+        with patch.object(loader, 'render_to_string', wraps=loader.render_to_string) as render_to_string:
+            response = self.client.post(self.admission_update_url, data=self.all_form_data)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.count_empty_year_form_renderings(render_to_string), 0)
+
     def test_with_admission_on_update_experience_form_is_forbidden_with_doctorate_and_valuated_by_doctorate(self):
         # Valuated by a doctorate admission
         self.mockapi.retrieve_educational_experience_admission.return_value.valuated_from_trainings = [
@@ -54,6 +54,7 @@ from admission.contrib.enums.projet import (
     ChoixStatutPropositionGenerale,
 )
 from admission.contrib.forms import PDF_MIME_TYPE
+from admission.services.cache import get_cache
 from base.tests.factories.person import PersonFactory
 from base.tests.test_case import OsisPortalTestCase
 from reference.services.iban_validator import (
@@ -200,7 +201,7 @@ class DoctorateAccountingViewTestCase(OsisPortalTestCase):
         self.addCleanup(patcher.stop)
 
         # Mock iban validator
-        iban_validator_patcher = patch("admission.contrib.forms.accounting.IBANValidatorService.validate")
+        iban_validator_patcher = patch("admission.services.iban.IBANValidatorService.validate")
         self.mock_iban_validator = iban_validator_patcher.start()
         self.mock_iban_validator.side_effect = validate_ok
         self.addCleanup(iban_validator_patcher.stop)
@@ -318,7 +319,8 @@ class DoctorateAccountingViewTestCase(OsisPortalTestCase):
         self.assertEqual(command_args['code_bic_swift_banque'], 'GKCCBEBA')
         self.assertEqual(command_args['prenom_titulaire_compte'], 'Jim')
         self.assertEqual(command_args['nom_titulaire_compte'], 'Foe')
-        self.assertEqual(command_args['iban_valide'], True)
+        # The IBAN is not validated as it is not used
+        self.assertEqual(command_args['iban_valide'], None)
         self.assertEqual(
             command_args['type_situation_assimilation'],
             TypeSituationAssimilation.PRIS_EN_CHARGE_OU_DESIGNE_CPAS.name,
@@ -448,7 +450,7 @@ class DoctorateAccountingViewTestCase(OsisPortalTestCase):
 
         response = self.client.post(
             self.update_url,
-            data={'type_numero_compte': ChoixTypeCompteBancaire.IBAN.name, 'numero_compte_iban': 'BE4306899999950'},
+            data={'type_numero_compte': ChoixTypeCompteBancaire.IBAN.name, 'numero_compte_iban': 'BE43068999999501'},
         )
 
         self.assertEqual(response.status_code, 200)
@@ -459,6 +461,35 @@ class DoctorateAccountingViewTestCase(OsisPortalTestCase):
         self.assertFalse(form.is_valid())
         self.assertFormError(response.context['form'], 'numero_compte_iban', 'Invalid IBAN')
 
+    def test_accounting_with_invalid_iban_checksum(self):
+        response = self.client.post(
+            self.update_url,
+            data={'type_numero_compte': ChoixTypeCompteBancaire.IBAN.name, 'numero_compte_iban': 'BE43068999999502'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        # Check the form
+        form = response.context.get('form')
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('numero_compte_iban', form.errors)
+
+        # The IBAN is rejected without calling the remote validator
+        self.mock_iban_validator.assert_not_called()
+
+    @override_settings(ADMISSION_IBAN_VALIDATION_CACHE_TIMEOUT=60)
+    def test_accounting_with_already_validated_iban(self):
+        self.addCleanup(get_cache().clear)
+        data = {'type_numero_compte': ChoixTypeCompteBancaire.IBAN.name, 'numero_compte_iban': 'BE71 0961 2345 6769'}
+
+        self.client.post(self.update_url, data=data)
+        response = self.client.post(self.update_url, data=data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('numero_compte_iban', response.context['form'].errors)
+        self.mock_iban_validator.assert_called_once()
+
     def test_accounting_form_with_incomplete_bank_account_for_other_format(self):
         response = self.client.post(
             self.update_url,
@@ -640,7 +671,7 @@ class GeneralAccountingViewTestCase(OsisPortalTestCase):
         self.addCleanup(patcher.stop)
 
         # Mock iban validator
-        iban_validator_patcher = patch("admission.contrib.forms.accounting.IBANValidatorService.validate")
+        iban_validator_patcher = patch("admission.services.iban.IBANValidatorService.validate")
         self.mock_iban_validator = iban_validator_patcher.start()
         self.mock_iban_validator.side_effect = validate_ok
         # self.mock_iban_validator.return_value.validate.return_value = True
@@ -981,7 +1012,7 @@ class GeneralAccountingViewTestCase(OsisPortalTestCase):
 
         response = self.client.post(
             self.update_url,
-            data={'type_numero_compte': ChoixTypeCompteBancaire.IBAN.name, 'numero_compte_iban': 'BE4306899999950'},
+            data={'type_numero_compte': ChoixTypeCompteBancaire.IBAN.name, 'numero_compte_iban': 'BE43068999999501'},
         )
 
         self.assertEqual(response.status_code, 200)
@@ -26,8 +26,12 @@
 
 import json
 import uuid
+from io import StringIO
 from unittest.mock import ANY, Mock, patch
 
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.test import AsyncRequestFactory, override_settings
 from django.urls import reverse
 from osis_admission_sdk.model.diplomatic_post import DiplomaticPost
 from osis_admission_sdk.model.doctorat_dto import DoctoratDTO
@@ -49,6 +53,7 @@ from osis_reference_sdk.models.superior_non_university import SuperiorNonUnivers
 from osis_reference_sdk.models.university import University
 from waffle.testutils import override_switch
 
+from admission.contrib.async_views import AsyncDoctorateAutocomplete
 from admission.contrib.enums import (
     BelgianCommunitiesOfEducation,
     ForeignDiplomaTypes,
@@ -57,6 +62,7 @@ from admission.contrib.enums import (
 from admission.contrib.enums.diploma import StudyType
 from admission.contrib.enums.scholarship import TypeBourse
 from admission.contrib.enums.training_choice import TrainingType, TypeFormation
+from admission.services.cache import get_cache
 from admission.tests.utils import MockCity, MockCountry, MockLanguage
 from base.tests.factories.person import PersonFactory
 from base.tests.test_case import OsisPortalTestCase
@@ -109,6 +115,44 @@ class AutocompleteTestCase(OsisPortalTestCase):
             **DEFAULT_API_PARAMS,
         )
 
+    @patch('admission.services.async_transport.HTTPX_INSTALLED', False)
+    @patch('osis_admission_sdk.api.autocomplete_api.AutocompleteApi')
+    def test_async_autocomplete_doctorate(self, api):
+        api.return_value.list_doctorat_dtos.return_value = [
+            DoctoratDTO(
+                sigle='FOOBAR',
+                intitule='Foobar',
+                annee=2021,
+                sigle_entite_gestion="CDE",
+                campus="Louvain-La-Neuve",
+                type=TrainingType.PHD.name,
+                campus_inscription='Mons',
+                code='CODE',
+                intitule_entite_gestion='Commission',
+            ),
+        ]
+        request = AsyncRequestFactory().get(
+            reverse('admission:autocomplete:doctorate'),
+            {'forward': json.dumps({'sector': 'SSH', 'campus': 'Mons'}), 'q': 'foo'},
+        )
+        request.user = PersonFactory().user
+        response = async_to_sync(AsyncDoctorateAutocomplete.as_view())(request)
+        results = [
+            {
+                'id': 'FOOBAR-2021',
+                'sigle': 'FOOBAR',
+                'sigle_entite_gestion': 'CDE',
+                'text': 'Foobar (Louvain-La-Neuve) <span class="training-acronym">FOOBAR</span>',
+            }
+        ]
+        self.assertDictEqual(json.loads(response.content), {'results': results})
+        api.return_value.list_doctorat_dtos.assert_called_with(
+            acronym_or_name='foo',
+            sigle='SSH',
+            campus='Mons',
+            **DEFAULT_API_PARAMS,
+        )
+
     @patch('osis_reference_sdk.api.countries_api.CountriesApi')
     def test_autocomplete_country(self, api):
         api.return_value.countries_list.return_value = Mock(
@@ -288,49 +332,92 @@ class AutocompleteTestCase(OsisPortalTestCase):
         self.assertDictEqual(response.json(), {'pagination': {'more': False}, 'results': expected})
         self.assertEqual(api.return_value.languages_list.call_args[1]['search'], 'F')
 
+    @override_settings(ADMISSION_AUTOCOMPLETE_PREFETCH_DEPTH=1)
+    @patch('admission.contrib.views.autocomplete.run_in_background', side_effect=lambda func, *args: func(*args))
+    @patch('osis_reference_sdk.api.languages_api.LanguagesApi')
+    def test_autocomplete_languages_prefetch_next_page(self, api, *args):
+        get_cache().clear()
+        first_page = [MockLanguage(code=f'L{index}', name=f'L{index}', name_en=f'L{index}') for index in range(20)]
+        second_page = [MockLanguage(code='FR', name='Français', name_en='French')]
+        api.return_value.languages_list.side_effect = [Mock(results=first_page), Mock(results=second_page)]
+
+        url = reverse('admission:autocomplete:language')
+        response = self.client.get(url, {'q': 'L'})
+        self.assertTrue(response.json()['pagination']['more'])
+        self.assertEqual(len(response.json()['results']), 20)
+
+        # The second page has been loaded in the background
+        self.assertEqual(api.return_value.languages_list.call_count, 2)
+        self.assertEqual(api.return_value.languages_list.call_args[1]['offset'], 20)
+
+        # And is served from the cache
+        response = self.client.get(url, {'q': 'L', 'page': 2})
+        self.assertDictEqual(
+            response.json(),
+            {'pagination': {'more': False}, 'results': [{'id': 'FR', 'text': 'Français'}]},
+        )
+        self.assertEqual(api.return_value.languages_list.call_count, 2)
+
+    @patch('admission.services.reference.run_in_background')
     @patch('osis_reference_sdk.api.cities_api.CitiesApi')
-    def test_autocomplete_city(self, api):
+    def test_autocomplete_city(self, api, run_in_background):
+        get_cache().clear()
         api.return_value.cities_list.return_value = Mock(
             results=[
-                MockCity(name='Pintintin-les-Creumeuil'),
-                MockCity(name='Montreuil-les-Sardouille'),
+                MockCity(name='Pintintin-les-Creumeuil', zip_code='1111'),
+                MockCity(name='Montreuil-les-Sardouille', zip_code='1111'),
+                MockCity(name='Louvain-la-Neuve', zip_code='1348'),
             ]
         )
         url = reverse('admission:autocomplete:city')
+
+        # The index is not loaded yet: the web service is searched and the index is loaded in the background
+        response = self.client.get(url, {'forward': json.dumps({'postal_code': '1111'}), 'q': 'mont'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(api.return_value.cities_list.call_args[1]['zip_code'], '1111')
+        self.assertEqual(api.return_value.cities_list.call_args[1]['search'], 'mont')
+        run_in_background.assert_called_once()
+
+        call_command('load_cities_by_postal_code', stdout=StringIO())
+        self.assertEqual(api.return_value.cities_list.call_args[1]['offset'], 0)
+        self.assertEqual(api.return_value.cities_list.call_args[1]['ordering'], 'zip_code,name')
+        api.return_value.cities_list.reset_mock()
+
         response = self.client.get(url, {'forward': json.dumps({'postal_code': '1111'}), 'q': ''})
         expected = [
-            {
-                'id': 'Pintintin-les-Creumeuil',
-                'text': 'Pintintin-les-Creumeuil',
-            },
             {
                 'id': 'Montreuil-les-Sardouille',
                 'text': 'Montreuil-les-Sardouille',
             },
+            {
+                'id': 'Pintintin-les-Creumeuil',
+                'text': 'Pintintin-les-Creumeuil',
+            },
         ]
-        self.assertDictEqual(response.json(), {'results': expected})
-        self.assertEqual(api.return_value.cities_list.call_args[1]['zip_code'], '1111')
+        self.assertDictEqual(response.json(), {'pagination': {'more': False}, 'results': expected})
+
+        # The index is used to filter the cities, with all the terms of the search
+        response = self.client.get(url, {'forward': json.dumps({'postal_code': '1111'}), 'q': 'les mont'})
+        self.assertDictEqual(response.json(), {'pagination': {'more': False}, 'results': expected[:1]})
+        api.return_value.cities_list.assert_not_called()
 
+        # Without the postal code
         api.return_value.cities_list.return_value = Mock(
             results=[
-                MockCity(name='Montreuil-les-Sardouille'),
+                MockCity(name='Montreuil-les-Sardouille', zip_code='1111'),
             ]
         )
-        response = self.client.get(url, {'forward': json.dumps({'postal_code': '1111'}), 'q': 'Mont'})
-        expected = [
-            {
-                'id': 'Montreuil-les-Sardouille',
-                'text': 'Montreuil-les-Sardouille',
-            },
-        ]
-        self.assertDictEqual(response.json(), {'results': expected})
-        self.assertEqual(api.return_value.cities_list.call_args[1]['zip_code'], '1111')
-        self.assertEqual(api.return_value.cities_list.call_args[1]['search'], 'Mont')
-
-        # Without the postal code
         response = self.client.get(url, {'forward': json.dumps({'postal_code': ''}), 'q': 'Mont'})
-        self.assertDictEqual(response.json(), {'results': expected})
+        self.assertDictEqual(response.json(), {'pagination': {'more': False}, 'results': expected[:1]})
         self.assertEqual(api.return_value.cities_list.call_args[1]['search'], 'Mont')
+        self.assertEqual(api.return_value.cities_list.call_args[1]['zip_code'], '')
+        self.assertEqual(api.return_value.cities_list.call_args[1]['limit'], 20)
+        self.assertEqual(api.return_value.cities_list.call_args[1]['offset'], 0)
+
+        # With an unknown postal code
+        response = self.client.get(url, {'forward': json.dumps({'postal_code': '9999'}), 'q': 'Mont', 'page': 2})
+        self.assertEqual(api.return_value.cities_list.call_args[1]['zip_code'], '9999')
+        self.assertEqual(api.return_value.cities_list.call_args[1]['offset'], 20)
 
     @patch('osis_admission_sdk.api.autocomplete_api.AutocompleteApi')
     def test_autocomplete_tutors(self, api):
@@ -353,6 +440,8 @@ class AutocompleteTestCase(OsisPortalTestCase):
             },
         ]
         self.assertDictEqual(response.json(), {'pagination': {'more': False}, 'results': expected})
+        self.assertEqual(api.return_value.list_tutors.call_args[1]['limit'], 20)
+        self.assertEqual(api.return_value.list_tutors.call_args[1]['offset'], 0)
 
     @patch('osis_admission_sdk.api.autocomplete_api.AutocompleteApi')
     def test_autocomplete_persons(self, api):
@@ -41,6 +41,7 @@ from osis_admission_sdk.model.submit_proposition import SubmitProposition
 from admission.constants import FIELD_REQUIRED_MESSAGE
 from admission.contrib.enums import ChoixStatutPropositionGenerale
 from admission.contrib.enums.confirmation import RaisonPlusieursDemandesMemesCycleEtAnnee
+from admission.services.cache import get_cache, invalidate_proposition_cache
 from base.tests.factories.person import PersonFactory
 from base.tests.test_case import OsisPortalTestCase
 from frontoffice.settings.osis_sdk.utils import (
@@ -149,6 +150,38 @@ class ConfirmSubmitTestCase(OsisPortalTestCase):
         self.assertContains(response, '<ul><li>Element1</li></ul>')
         self.assertContains(response, _('Your application is complete and may be submitted.'))
 
+    @override_settings(ADMISSION_PROPOSITION_VERIFICATION_CACHE_TIMEOUT=60)
+    def test_get_verification_is_cached_until_the_proposition_is_modified(self):
+        get_cache().clear()
+        verify_proposition = self.mock_proposition_api.return_value.verify_proposition
+
+        self.client.get(self.url)
+        self.client.get(self.url)
+        verify_proposition.assert_called_once()
+
+        invalidate_proposition_cache(proposition_uuid="3c5cdc60-2537-4a12-a396-64d2e9e34876")
+        self.client.get(self.url)
+        self.assertEqual(verify_proposition.call_count, 2)
+
+    @override_settings(ADMISSION_PROPOSITION_VERIFICATION_CACHE_TIMEOUT=60)
+    def test_get_verification_is_cached_until_the_date_or_the_calendar_changes(self):
+        get_cache().clear()
+        api = self.mock_proposition_api.return_value
+        api.retrieve_specific_enrolment_periods.return_value.to_dict.return_value = {'medecine_dentisterie': 1}
+
+        with freezegun.freeze_time('2023-01-01'):
+            self.client.get(self.url)
+            self.client.get(self.url)
+            api.verify_proposition.assert_called_once()
+
+            api.retrieve_specific_enrolment_periods.return_value.to_dict.return_value = {'medecine_dentisterie': 2}
+            self.client.get(self.url)
+            self.assertEqual(api.verify_proposition.call_count, 2)
+
+        with freezegun.freeze_time('2023-01-02'):
+            self.client.get(self.url)
+            self.assertEqual(api.verify_proposition.call_count, 3)
+
     def test_get_with_incomplete_admission(self):
         self.mock_proposition_api.return_value.verify_proposition.return_value.to_dict.return_value = {
             'errors': [
@@ -30,6 +30,8 @@ from django.shortcuts import resolve_url
 from django.utils.translation import gettext_lazy as _
 
 from admission.contrib.enums import ChoixStatutPropositionDoctorale
+from admission.contrib.forms import EMPTY_CHOICE
+from admission.contrib.forms.coordonnees import DoctorateAdmissionAddressForm
 from admission.tests.utils import MockCountry
 from base.tests.factories.person import PersonFactory
 from base.tests.test_case import OsisPortalTestCase
@@ -144,6 +146,12 @@ class CoordonneesTestCase(OsisPortalTestCase):
         form = response.context['main_form']
         self.assertTrue(form.fields['private_email'].disabled)
 
+    def test_address_form_with_initial_country(self):
+        form = DoctorateAdmissionAddressForm(person=self.person, initial={'country': 'FR'}, prefix='residential')
+
+        self.assertEqual(form.fields['country'].widget.choices, [*EMPTY_CHOICE, ('FR', 'France')])
+        self.assertEqual(form.initial_choices_objects['country'].iso_code, 'FR')
+
     def test_form_empty(self):
         url = resolve_url('admission:create:coordonnees')
 
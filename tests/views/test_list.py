@@ -24,12 +24,15 @@
 #
 # ##############################################################################
 import datetime
+import json
 from unittest.mock import Mock, patch
 
 import freezegun
 from django.shortcuts import resolve_url
+from django.test import override_settings
 from django.urls import reverse
 from django.utils.translation import gettext
+from osis_admission_sdk.model.doctorate_proposition_dto import DoctoratePropositionDTO
 
 from admission.contrib.enums import (
     ChoixStatutPropositionContinue,
@@ -37,6 +40,7 @@ from admission.contrib.enums import (
     ChoixStatutPropositionGenerale,
     TrainingType,
 )
+from admission.contrib.views.list import PropositionSummary
 from base.tests.factories.person import PersonFactory
 from base.tests.test_case import OsisPortalTestCase
 
@@ -249,6 +253,8 @@ class ListTestCase(OsisPortalTestCase):
         self.assertEqual(draft_propositions[2].uuid, '3c5cdc60-2537-4a12-a396-64d2e9e34872')
         self.assertEqual(draft_propositions[3].uuid, '3c5cdc60-2537-4a12-a396-64d2e9e34871')
         self.assertEqual(draft_propositions[4].uuid, '3c5cdc60-2537-4a12-a396-64d2e9e34870')
+        self.assertEqual(draft_propositions[4].admission_context, 'doctorate')
+        self.assertEqual(draft_propositions[4].training_acronym, 'SC3DP0')
 
         draft_or_in_payment_propositions = response.context['draft_or_in_payment_propositions']
         self.assertEqual(len(draft_or_in_payment_propositions), 6)
@@ -272,6 +278,30 @@ class ListTestCase(OsisPortalTestCase):
         self.assertEqual(len(submitted_propositions[2024]), 1)
         self.assertEqual(submitted_propositions[2024][0].uuid, '5c5cdc60-2537-4a12-a396-64d2e9e34872')
 
+    def test_proposition_summary(self):
+        proposition = Mock(
+            uuid='5c5cdc60-2537-4a12-a396-64d2e9e34871',
+            links={
+                'retrieve_training_choice': {'url': 'access granted'},
+                'retrieve_curriculum': {'url': 'access granted'},
+            },
+            statut=ChoixStatutPropositionGenerale.CONFIRMEE.name,
+            formation=Mock(type=TrainingType.BACHELOR.name, annee=2023, sigle='MINF1'),
+            creee_le=datetime.datetime(2023, 1, 6),
+            soumise_le=None,
+            annee_calculee=None,
+        )
+
+        summary = PropositionSummary(proposition, 'general-education', 'formation')
+
+        self.assertFalse(hasattr(summary, '__dict__'))
+        self.assertEqual(summary.admission_context, 'general-education')
+        self.assertEqual(summary.training_year, 2023)
+        self.assertEqual(summary.formation.sigle, 'MINF1')
+        self.assertIsNone(summary.doctorat)
+        self.assertEqual(summary.links, {'retrieve_training_choice': {'url': 'access granted'}})
+        self.assertEqual(summary.sort_key, (datetime.datetime(datetime.MINYEAR, 1, 1), datetime.datetime(2023, 1, 6)))
+
     @patch('osis_admission_sdk.api.propositions_api.PropositionsApi')
     def test_re_enrolment_list(self, api, *args):
         self.client.force_login(PersonFactory().user)
@@ -468,3 +498,26 @@ class ListTestCase(OsisPortalTestCase):
         response = self.client.get(url)
         detail_url = resolve_url('gestion_doctorat:doctorate:project', pk='3c5cdc60-2537-4a12-a396-64d2e9e34876')
         self.assertContains(response, detail_url)
+
+    @override_settings(ADMISSION_TRUSTED_RESPONSES=True)
+    @patch('osis_admission_sdk.api.propositions_api.PropositionsApi')
+    def test_list_supervised_with_trusted_responses(self, api, *args):
+        self.client.force_login(PersonFactory().user)
+
+        endpoint = api.return_value.list_supervised_propositions
+        endpoint.settings = {'response_type': ([DoctoratePropositionDTO],)}
+        endpoint.return_value.data = json.dumps(
+            [
+                {
+                    'uuid': '3c5cdc60-2537-4a12-a396-64d2e9e34876',
+                    'links': {'retrieve_project': {'url': 'access granted'}},
+                    'erreurs': [],
+                },
+            ]
+        ).encode()
+
+        response = self.client.get(reverse('admission:supervised-list'))
+
+        self.assertIs(endpoint.call_args.kwargs['_preload_content'], False)
+        detail_url = resolve_url('admission:doctorate:project', pk='3c5cdc60-2537-4a12-a396-64d2e9e34876')
+        self.assertContains(response, detail_url)
@@ -0,0 +1,104 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import copy
+
+import freezegun
+from django.shortcuts import resolve_url
+from django.test import override_settings
+
+from admission.contrib.enums import ChoixStatutPropositionDoctorale
+from admission.contrib.views.common.detail_tabs.curriculum import AdmissionCurriculumDetailView
+from admission.contrib.views.common.form_tabs.confirm_submit import AdmissionConfirmSubmitFormView
+from admission.contrib.views.list import AdmissionListView
+from admission.services.outbound_calls import OutboundCallRecorder
+from admission.tests.stub_backend import StubBackendTestMixin
+from base.tests.factories.person import PersonFactory
+from base.tests.test_case import OsisPortalTestCase
+
+PROPOSITION_UUID = '3c5cdc60-2537-4a12-a396-64d2e9e34876'
+DIPLOMA_UUID = 'b8c5a0e4-6f3d-4c2a-9e1b-7d4f2a6c8e01'
+
+
+@override_settings(ADMISSION_OUTBOUND_CALL_BUDGET_STRICT=True)
+class OutboundCallBudgetsTestCase(StubBackendTestMixin, OsisPortalTestCase):
+    """Render the views with a budget against the stub backend, the budgets being exceeded raising an exception."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.candidate = PersonFactory(global_id='00345678')
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.candidate.user)
+
+    def assertWithinBudget(self, view_class, url):
+        with OutboundCallRecorder() as recorder:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        # Each request received by the stub backend is counted once
+        self.assertEqual(len(recorder), len(self.stub_backend.calls), recorder.format_calls())
+        self.assertLessEqual(len(recorder), view_class.outbound_call_budget, recorder.format_calls())
+        return response
+
+    @freezegun.freeze_time('2023-09-01')
+    def test_list_during_the_re_enrolment_period(self):
+        endpoint = self.stub_backend.find_endpoint('osis_admission_sdk', 'GET', '/propositions')
+        body = copy.deepcopy(endpoint.body)
+        proposition = body['doctorate_propositions'][0]
+        # The supervision of each proposition waiting for the signatures of its panel is loaded
+        body['doctorate_propositions'] = [
+            {
+                **proposition,
+                'uuid': f'{proposition["uuid"][:-2]}{index:02d}',
+                'statut': ChoixStatutPropositionDoctorale.CA_EN_ATTENTE_DE_SIGNATURE.name,
+            }
+            for index in range(3)
+        ]
+        endpoint = self.stub_backend.add_endpoint('osis_admission_sdk', 'GET', '/propositions', body)
+        self.addCleanup(self.stub_backend.endpoints.remove, endpoint)
+
+        self.assertWithinBudget(AdmissionListView, resolve_url('admission:list'))
+        supervision_calls = [call for call in self.stub_backend.calls if call.path.endswith('/supervision')]
+        self.assertEqual(len(supervision_calls), 3)
+
+    def test_curriculum(self):
+        response = self.assertWithinBudget(
+            AdmissionCurriculumDetailView,
+            resolve_url('admission:doctorate:curriculum', pk=PROPOSITION_UUID),
+        )
+
+        # The diploma and the institute shared by the experiences are only loaded once
+        self.assertEqual(len(response.context['educational_experiences']), 3)
+        diploma_calls = [call for call in self.stub_backend.calls if call.path.startswith(f'/diplomas/{DIPLOMA_UUID}')]
+        self.assertEqual(len(diploma_calls), 1)
+
+    def test_confirm_submit(self):
+        self.assertWithinBudget(
+            AdmissionConfirmSubmitFormView,
+            resolve_url('admission:doctorate:update:confirm-submit', pk=PROPOSITION_UUID),
+        )
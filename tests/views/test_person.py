@@ -639,6 +639,29 @@ class PersonViewTestCase(OsisPortalTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertFormError(response.context['form'], 'id_card_expiry_date', _("This field is required."))
 
+    def test_update_loads_each_initial_country_once(self):
+        url = resolve_url('admission:doctorate:update:person', pk="3c5cdc60-2537-4a12-a396-64d2e9e34876")
+        self.client.force_login(self.person.user)
+
+        mocking_dict = self.mock_person_api.return_value.retrieve_person_identification_admission.return_value
+        mocking_dict.to_dict.return_value = dict(
+            first_name="John",
+            last_name="Doe",
+            id_card=[],
+            passport=[],
+            id_photo=[],
+            birth_country="BE",
+            country_of_citizenship="BE",
+        )
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        form = response.context['form']
+        self.assertEqual(form.fields['birth_country'].widget.choices, [*EMPTY_CHOICE, ('BE', 'Belgique')])
+        self.assertEqual(form.fields['country_of_citizenship'].widget.choices, [*EMPTY_CHOICE, ('BE', 'Belgique')])
+        self.mock_country_method.assert_called_once_with(iso_code='BE', person=self.person)
+
     def test_post_update(self):
         url = resolve_url('admission:doctorate:update:person', pk="3c5cdc60-2537-4a12-a396-64d2e9e34876")
         self.client.force_login(self.person.user)
@@ -27,6 +27,7 @@ from datetime import datetime
 from unittest.mock import ANY, MagicMock, patch
 
 from django.shortcuts import resolve_url
+from django.test import override_settings
 from django.utils.translation import gettext_lazy as _
 from osis_admission_sdk.model.candidate_enrolment_information import CandidateEnrolmentInformation
 from osis_admission_sdk.model.modifier_questions_specifiques_formation_continue_command import (
@@ -47,6 +48,8 @@ from admission.contrib.enums.additional_information import (
 )
 from admission.contrib.enums.specific_question import Onglets
 from admission.contrib.forms import EMPTY_CHOICE, PDF_MIME_TYPE
+from admission.services.cache import get_cache
+from admission.services.proposition import AdmissionPropositionService
 from admission.tests.views.training_choice import (
     AdmissionTrainingChoiceFormViewTestCase,
 )
@@ -84,6 +87,23 @@ class GeneralEducationSpecificQuestionDetailViewTestCase(AdmissionTrainingChoice
         self.assertEqual(response.context['admission'].uuid, self.general_proposition.uuid)
         self.assertEqual(response.context['specific_questions'], self.specific_questions)
 
+    @override_settings(ADMISSION_SPECIFIC_QUESTIONS_CACHE_TIMEOUT=60)
+    def test_specific_questions_are_cached_until_the_training_choice_changes(self):
+        get_cache().clear()
+        list_specific_questions = self.mock_proposition_api.return_value.list_general_specific_questions
+
+        self.client.get(self.url)
+        self.client.get(self.url)
+        list_specific_questions.assert_called_once()
+
+        AdmissionPropositionService.update_general_education_choice(
+            person=self.person,
+            uuid=self.proposition_uuid,
+            data={},
+        )
+        self.client.get(self.url)
+        self.assertEqual(list_specific_questions.call_count, 2)
+
     def test_get_page_with_reorientation(self):
         self.mock_proposition_api.return_value.retrieve_pool_questions.return_value.to_dict.return_value = {
             'reorientation_pool_end_date': datetime(2022, 12, 30, 23, 59),
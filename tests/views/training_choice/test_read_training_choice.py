@@ -26,7 +26,9 @@
 from unittest import mock
 
 from django.shortcuts import resolve_url
+from django.test import override_settings
 
+from admission.services.cache import get_cache, invalidate_proposition_cache
 from admission.tests.views.training_choice import (
     AdmissionTrainingChoiceFormViewTestCase,
 )
@@ -79,6 +81,41 @@ class ContinuingAdmissionReadTrainingChoiceFormViewTestCase(AdmissionTrainingCho
         response = self.client.get(self.url)
         self.assertIn('Les programmes certifiants et courts', response.rendered_content)
 
+    @override_settings(ADMISSION_DETAIL_TABS_ETAG_ENABLED=True)
+    def test_get_page_not_modified(self):
+        get_cache().clear()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.has_header('ETag'))
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        etag = response['ETag']
+
+        # The proposition has been modified
+        modified_proposition = {**self.continuing_proposition_dict, 'reference': 'M-CMC20-000.005'}
+        with mock.patch.object(self.continuing_proposition, 'to_dict', return_value=modified_proposition):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        # The data of the candidate have been modified
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        invalidate_proposition_cache(person=self.person)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        # The page is rendered when messages must be displayed
+        with mock.patch('admission.contrib.views.mixins.messages.get_messages', return_value=['Saved']):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        # The application has been deployed again
+        with override_settings(ADMISSION_RELEASE='new-release'):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
 
 class DoctorateAdmissionReadTrainingChoiceFormViewTestCase(AdmissionTrainingChoiceFormViewTestCase):
     @classmethod
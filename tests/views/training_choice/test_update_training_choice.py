@@ -49,6 +49,7 @@ from admission.contrib.forms import EMPTY_VALUE
 from admission.tests.views.training_choice import (
     AdmissionTrainingChoiceFormViewTestCase,
 )
+from admission.utils import format_scholarship
 
 
 class GeneralAdmissionUpdateTrainingChoiceFormViewTestCase(AdmissionTrainingChoiceFormViewTestCase):
@@ -133,6 +134,23 @@ class GeneralAdmissionUpdateTrainingChoiceFormViewTestCase(AdmissionTrainingChoi
                 self.assertIsNotNone(period_messages)
                 self.assertIsNone(period_messages.get('medicine_dentistry_bachelor'))
 
+    def test_form_initialization_with_scholarships(self):
+        response = self.client.get(self.url)
+        form = response.context['form']
+
+        self.assertEqual(response.status_code, 200)
+
+        # The scholarships are loaded with the other dependencies of the form
+        for field_name, scholarship in [
+            ('double_degree_scholarship', self.double_degree_scholarship),
+            ('international_scholarship', self.international_scholarship),
+            ('erasmus_mundus_scholarship', self.first_erasmus_mundus_scholarship),
+        ]:
+            self.assertEqual(
+                form.fields[field_name].widget.choices,
+                [(scholarship.uuid, format_scholarship(scholarship))],
+            )
+
     def test_form_submitting_missing_fields(self):
         response = self.client.post(self.url, data={'campus': EMPTY_VALUE})
 
@@ -0,0 +1,169 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+"""
+Manifest of the urls of the admission (url_manifest.json, generated with the generate_url_manifest management command
+and committed with the views), loaded instead of discovering the views with the FileRouter when the workers start.
+"""
+import json
+from functools import cached_property
+from pathlib import Path
+from typing import List
+
+from django.urls import URLResolver, include, path, re_path
+from django.urls.resolvers import RegexPattern
+from django.utils.module_loading import import_string
+
+__all__ = [
+    'DEFAULT_URL_MANIFEST',
+    'LazyView',
+    'LazyViewClass',
+    'dump_url_manifest',
+    'load_url_manifest',
+]
+
+MANIFEST_VERSION = 1
+# Manifest of the application, to be generated again when the views or their urls change
+DEFAULT_URL_MANIFEST = Path(__file__).with_name('url_manifest.json')
+
+
+class LazyViewClass:
+    """
+    Class of a view of the manifest, whose name is read from the manifest (e.g. by django to identify the view) and
+    which is only imported when one of its other attributes is read.
+    """
+
+    def __init__(self, view_path):
+        self.view_path = view_path
+        self.__module__, self.__qualname__ = view_path.rsplit('.', 1)
+        self.__name__ = self.__qualname__
+
+    @cached_property
+    def view_class(self):
+        return import_string(self.view_path)
+
+    def __getattr__(self, name):
+        if name.startswith('__') or name == 'view_class':
+            raise AttributeError(name)
+        return getattr(self.view_class, name)
+
+    def __repr__(self):
+        return f'<LazyViewClass {self.view_path}>'
+
+
+class LazyView:
+    """
+    View of the manifest, only imported when it is first called or when one of its attributes is read. The attributes
+    identifying the view (`view_class`, or the name of a view function), read by django when the url patterns are
+    loaded (e.g. URLPattern.lookup_str), are answered from the manifest.
+    """
+
+    def __init__(self, view_path, initkwargs=None):
+        self.view_path = view_path
+        # None if the view is a function, the keyword arguments of View.as_view otherwise
+        self.initkwargs = initkwargs
+        if initkwargs is None:
+            self.__module__, self.__qualname__ = view_path.rsplit('.', 1)
+            self.__name__ = self.__qualname__
+        else:
+            self.view_class = LazyViewClass(view_path)
+
+    @cached_property
+    def view(self):
+        view = import_string(self.view_path)
+        return view if self.initkwargs is None else view.as_view(**self.initkwargs)
+
+    def __call__(self, request, *args, **kwargs):
+        return self.view(request, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # e.g. csrf_exempt, read by django when the view is resolved
+        if name.startswith('__') or name in ['view', 'view_class']:
+            raise AttributeError(name)
+        return getattr(self.view, name)
+
+    def __repr__(self):
+        return f'<LazyView {self.view_path}>'
+
+
+def _dump_view(callback):
+    if isinstance(callback, LazyView):
+        return {'view': callback.view_path, 'initkwargs': callback.initkwargs}
+    view_class = getattr(callback, 'view_class', None)
+    if view_class is not None:
+        return {'view': f'{view_class.__module__}.{view_class.__qualname__}', 'initkwargs': callback.view_initkwargs}
+    return {'view': f'{callback.__module__}.{callback.__qualname__}', 'initkwargs': None}
+
+
+def _dump_patterns(urlpatterns) -> List[dict]:
+    patterns = []
+    for pattern in urlpatterns:
+        dumped_pattern = {
+            'route': str(pattern.pattern),
+            'regex': isinstance(pattern.pattern, RegexPattern),
+            'kwargs': pattern.default_kwargs if isinstance(pattern, URLResolver) else pattern.default_args,
+        }
+        if isinstance(pattern, URLResolver):
+            dumped_pattern.update(
+                app_name=pattern.app_name,
+                namespace=pattern.namespace,
+                patterns=_dump_patterns(pattern.url_patterns),
+            )
+        else:
+            dumped_pattern.update(name=pattern.name, **_dump_view(pattern.callback))
+        patterns.append(dumped_pattern)
+    return patterns
+
+
+def dump_url_manifest(urlpatterns) -> str:
+    """Return the manifest of the url patterns, as a JSON string. The view of each pattern must be importable."""
+    manifest = {'version': MANIFEST_VERSION, 'patterns': _dump_patterns(urlpatterns)}
+    return json.dumps(manifest, indent=2, sort_keys=True) + '\n'
+
+
+def _load_patterns(dumped_patterns) -> List:
+    patterns = []
+    for dumped_pattern in dumped_patterns:
+        make_pattern = re_path if dumped_pattern['regex'] else path
+        route, kwargs = dumped_pattern['route'], dumped_pattern['kwargs']
+        if 'patterns' in dumped_pattern:
+            view = include(
+                (_load_patterns(dumped_pattern['patterns']), dumped_pattern['app_name']),
+                namespace=dumped_pattern['namespace'],
+            )
+            patterns.append(make_pattern(route, view, kwargs))
+        else:
+            view = LazyView(dumped_pattern['view'], dumped_pattern['initkwargs'])
+            patterns.append(make_pattern(route, view, kwargs, dumped_pattern['name']))
+    return patterns
+
+
+def load_url_manifest(manifest_path) -> List:
+    """Return the url patterns of a manifest. The views are imported when they are first used."""
+    with open(manifest_path) as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f'The url manifest {manifest_path} is not supported, it must be generated again')
+    return _load_patterns(manifest['patterns'])
@@ -24,45 +24,69 @@
 #
 # ##############################################################################
 
+import logging
+import os
+
 from django.conf import settings
 from django.urls import include, path
 
-from admission.contrib.views.common.form_tabs.coordonnees import AdmissionCoordonneesFormView
-from admission.contrib.views.common.form_tabs.curriculum import AdmissionCurriculumFormView
-from admission.contrib.views.common.form_tabs.education import AdmissionEducationFormView
-from admission.contrib.views.common.form_tabs.languages import AdmissionLanguagesFormView
-from admission.contrib.views.common.form_tabs.person import AdmissionPersonFormView
-from admission.contrib.views.common.form_tabs.training_choice import AdmissionTrainingChoiceFormView
-from admission.contrib.views.lang import ChangeLanguageView
-from osis_common.utils.file_router import FileRouter
+from admission.url_manifest import DEFAULT_URL_MANIFEST, load_url_manifest
+
+logger = logging.getLogger(__name__)
 
 app_name = 'admission'
 
-file_router = FileRouter()
-urlpatterns = file_router('admission/contrib/views')
-# Copy all the common form_tabs to 'admission:create'
-urlpatterns += [
-    path(
-        'create/',
-        include(
-            (
-                [
-                    path('person', AdmissionPersonFormView.as_view(), name='person'),
-                    path('coordonnees', AdmissionCoordonneesFormView.as_view(), name='coordonnees'),
-                    path('training-choice', AdmissionTrainingChoiceFormView.as_view(), name='training-choice'),
-                    path('education', AdmissionEducationFormView.as_view(), name='education'),
-                    path('curriculum', AdmissionCurriculumFormView.as_view(), name='curriculum'),
-                    path('languages', AdmissionLanguagesFormView.as_view(), name='languages'),
-                ],
-                'create',
-            )
+
+def discover_urlpatterns():
+    """Return the url patterns of the views, discovered in the modules of admission/contrib/views."""
+    from admission.contrib.views.common.form_tabs.coordonnees import AdmissionCoordonneesFormView
+    from admission.contrib.views.common.form_tabs.curriculum import AdmissionCurriculumFormView
+    from admission.contrib.views.common.form_tabs.education import AdmissionEducationFormView
+    from admission.contrib.views.common.form_tabs.languages import AdmissionLanguagesFormView
+    from admission.contrib.views.common.form_tabs.person import AdmissionPersonFormView
+    from admission.contrib.views.common.form_tabs.training_choice import AdmissionTrainingChoiceFormView
+    from admission.contrib.views.lang import ChangeLanguageView
+    from osis_common.utils.file_router import FileRouter
+
+    file_router = FileRouter()
+    urlpatterns = file_router('admission/contrib/views')
+    # Copy all the common form_tabs to 'admission:create'
+    urlpatterns += [
+        path(
+            'create/',
+            include(
+                (
+                    [
+                        path('person', AdmissionPersonFormView.as_view(), name='person'),
+                        path('coordonnees', AdmissionCoordonneesFormView.as_view(), name='coordonnees'),
+                        path('training-choice', AdmissionTrainingChoiceFormView.as_view(), name='training-choice'),
+                        path('education', AdmissionEducationFormView.as_view(), name='education'),
+                        path('curriculum', AdmissionCurriculumFormView.as_view(), name='curriculum'),
+                        path('languages', AdmissionLanguagesFormView.as_view(), name='languages'),
+                    ],
+                    'create',
+                )
+            ),
         ),
-    ),
-    path('lang/<str:ui_language>', ChangeLanguageView.as_view(), name=ChangeLanguageView.name),
-]
+        path('lang/<str:ui_language>', ChangeLanguageView.as_view(), name=ChangeLanguageView.name),
+    ]
+
+    if settings.DEBUG:
+        logger.debug("\n" + file_router.debug(urlpatterns))
+    return urlpatterns
+
+
+# The manifest is generated with the generate_url_manifest management command (an empty setting disables it)
+url_manifest_path = getattr(settings, 'ADMISSION_URL_MANIFEST', DEFAULT_URL_MANIFEST)
+if url_manifest_path and os.path.exists(url_manifest_path):
+    urlpatterns = load_url_manifest(url_manifest_path)
+else:
+    if url_manifest_path:
+        logger.warning(f"The url manifest {url_manifest_path} does not exist, the views are discovered instead")
+    urlpatterns = discover_urlpatterns()
 
-if settings.DEBUG:
-    import logging
+# The asynchronous variants of the views require the application to be served by ASGI
+if getattr(settings, 'ADMISSION_ASYNC_VIEWS', False):
+    from admission.contrib.async_views import use_async_views
 
-    logger = logging.getLogger(__name__)
-    logger.debug("\n" + file_router.debug(urlpatterns))
+    urlpatterns = use_async_views(urlpatterns)